@@ -113,6 +113,64 @@ def test_dotorm_memory(record_count: int = 1000):
     return asyncio.get_event_loop().run_until_complete(run())
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# DotORM compact records (search(compact=True)) vs regular models
+# ═══════════════════════════════════════════════════════════════════════════
+
+def test_dotorm_compact_memory(record_count: int = 1000):
+    """Compare hydration memory: prepare_list_ids vs prepare_list_compact.
+
+    Uses synthetic rows (same shape as benchmark_users), no database
+    needed. Measures only objects allocated during hydration.
+    """
+    import tracemalloc
+
+    from dotorm import Boolean, Char, DotModel, Integer
+
+    class BenchmarkUser(DotModel):
+        __table__ = "benchmark_users"
+
+        id: int = Integer(primary_key=True)
+        name: str = Char(max_length=100)
+        email: str = Char(max_length=255)
+        active: bool = Boolean(default=True)
+
+    rows = [
+        {
+            "id": i,
+            "name": f"User {i}",
+            "email": f"user{i}@example.com",
+            "active": bool(i % 2),
+        }
+        for i in range(record_count)
+    ]
+    # warm up lazy caches and generated class
+    BenchmarkUser.prepare_list_ids(rows[:1])
+    BenchmarkUser.prepare_list_compact(rows[:1])
+
+    results = {}
+    for name, prepare in (
+        ("regular", BenchmarkUser.prepare_list_ids),
+        ("compact", BenchmarkUser.prepare_list_compact),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        records = prepare(rows)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = size
+        print(f"DotORM {name} ({record_count} records): {format_bytes(size)}")
+        print(f"  Per record: {format_bytes(size // len(records))}")
+        del records
+
+    saved = results["regular"] - results["compact"]
+    print(
+        f"  Compact saves: {format_bytes(saved)} "
+        f"({saved / results['regular']:.0%})"
+    )
+    return results
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Raw asyncpg Memory Test
 # ═══════════════════════════════════════════════════════════════════════════
@@ -255,6 +313,10 @@ def run_memory_comparison():
         print("\n2. DotORM:")
         test_dotorm_memory(count)
         gc.collect()
+
+        print("\n2b. DotORM compact records (hydration only):")
+        test_dotorm_compact_memory(count)
+        gc.collect()
         
         print("\n3. SQLAlchemy:")
         test_sqlalchemy_memory(count)
@@ -329,10 +391,17 @@ if __name__ == "__main__":
         action="store_true",
         help="Test only DotORM",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Compare regular vs compact records (no database needed)",
+    )
     
     args = parser.parse_args()
     
-    if args.all:
+    if args.compact:
+        test_dotorm_compact_memory(args.records)
+    elif args.all:
         run_with_memory_profiler()
     elif args.dotorm_only:
         print(f"Testing DotORM with {args.records} records...")
@@ -0,0 +1,33 @@
+"""Helpers for running microbenchmarks without pytest-benchmark.
+
+Microbenchmarks that need no database also run as modules:
+    python -m benchmarks.test_filter_parser
+
+Each of them defines run(), which times its cases with per_call()
+and prints them with print_table().
+"""
+
+import timeit
+from typing import Any, Callable, Sequence
+
+
+def per_call(func: Callable[[], Any], number: int) -> float:
+    """Average time of one func() call, seconds."""
+    return timeit.timeit(func, number=number) / number
+
+
+def print_table(header: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Print rows under header: first column left, floats as 0.00."""
+    widths = [max(len(name), 10) for name in header]
+    widths[0] = max(widths[0], 20)
+
+    def line(cells: Sequence[Any]) -> str:
+        parts = []
+        for i, (value, width) in enumerate(zip(cells, widths)):
+            text = f"{value:.2f}" if isinstance(value, float) else str(value)
+            parts.append(text.ljust(width) if i == 0 else text.rjust(width))
+        return " ".join(parts)
+
+    print(line(header))
+    for row in rows:
+        print(line(row))
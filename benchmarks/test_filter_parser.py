@@ -0,0 +1,113 @@
+"""FilterParser / Builder microbenchmarks (no database needed).
+
+Compares filter rendering with and without compiled templates:
+- cold: cache_size=0, every call walks the expression and renders SQL
+- compiled: cached shapes and templates, repeated filters only
+  build a light key and extract values
+
+Run:
+    pytest benchmarks/test_filter_parser.py -v --benchmark-only
+
+Or standalone:
+    python -m benchmarks.test_filter_parser
+"""
+
+import pytest
+
+from dotorm.builder.builder import Builder
+from dotorm.components.dialect import POSTGRES
+from dotorm.components.filter_parser import FilterParser
+
+from .standalone import per_call, print_table
+
+# Typical list-view filter: active users of some roles, searched by name
+FILTER = [
+    ("active", "=", True),
+    ("role_id", "in", [1, 2, 3, 4, 5]),
+    [("name", "ilike", "john"), "or", ("email", "ilike", "john")],
+    ("not", [("deleted_at", "is not null", None)]),
+]
+
+
+class _Field:
+    store = True
+
+
+FIELDS = {
+    name: _Field()
+    for name in ("id", "name", "email", "active", "role_id", "deleted_at")
+}
+
+
+def _builder(cache_size: int) -> Builder:
+    return Builder(
+        table="users", fields=FIELDS, dialect=POSTGRES, cache_size=cache_size
+    )
+
+
+class TestFilterParser:
+    """FilterParser.parse benchmarks."""
+
+    @pytest.mark.benchmark(group="filter-parse")
+    def test_parse_cold(self, benchmark):
+        """Render SQL on every call (templates disabled)."""
+        parser = FilterParser(POSTGRES, cache_size=0)
+        benchmark(parser.parse, FILTER)
+
+    @pytest.mark.benchmark(group="filter-parse")
+    def test_parse_compiled(self, benchmark):
+        """Reuse compiled template, only extract values."""
+        parser = FilterParser(POSTGRES)
+        benchmark(parser.parse, FILTER)
+
+
+class TestBuilderSearch:
+    """Builder.build_search benchmarks."""
+
+    @pytest.mark.benchmark(group="build-search")
+    def test_build_search_cold(self, benchmark):
+        builder = _builder(cache_size=0)
+        benchmark(
+            builder.build_search,
+            fields=["id", "name", "email"],
+            filter=FILTER,
+            sort="id",
+            order="DESC",
+        )
+
+    @pytest.mark.benchmark(group="build-search")
+    def test_build_search_compiled(self, benchmark):
+        builder = _builder(cache_size=256)
+        benchmark(
+            builder.build_search,
+            fields=["id", "name", "email"],
+            filter=FILTER,
+            sort="id",
+            order="DESC",
+        )
+
+
+def run(number: int = 100_000) -> None:
+    """Print per-call timings for cold vs compiled paths."""
+    cases = {
+        "parse": lambda p, b: p.parse(FILTER),
+        "build_search": lambda p, b: b.build_search(
+            fields=["id", "name", "email"], filter=FILTER, sort="id"
+        ),
+        "build_search_count": lambda p, b: b.build_search_count(FILTER),
+    }
+    rows = []
+    for name, case in cases.items():
+        timings = []
+        for cache_size in (0, 256):
+            parser = FilterParser(POSTGRES, cache_size=cache_size)
+            builder = _builder(cache_size)
+            seconds = per_call(lambda: case(parser, builder), number)
+            timings.append(seconds * 1e6)
+        cold, compiled = timings
+        rows.append((name, cold, compiled, f"{cold / compiled:.2f}x"))
+    print_table(("case", "cold, us", "compiled, us", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    run()
@@ -109,6 +109,40 @@ class TestDotORMInsert:
             rounds=2,
         )
 
+    @pytest.mark.benchmark(group="insert-bulk-large")
+    async def test_insert_bulk_copy_10000(
+        self, dotorm_pool, clean_tables, benchmark
+    ):
+        """Bulk insert 10000 records with COPY (method="copy").
+
+        Same group as test_insert_bulk_10000 (unnest) for comparison,
+        ids are reserved from sequence (returning=True).
+        """
+        from dotorm import Boolean, Char, DotModel, Integer
+        from dotorm.components import POSTGRES
+
+        class BenchmarkUser(DotModel):
+            __table__ = "benchmark_users"
+            _dialect = POSTGRES
+            _pool = dotorm_pool
+
+            id: int = Integer(primary_key=True)
+            name: str = Char(max_length=100)
+            email: str = Char(max_length=255)
+            active: bool = Boolean(default=True)
+
+        data = generate_user_data(10000)
+
+        async def run():
+            users = [BenchmarkUser(**item) for item in data]
+            await BenchmarkUser.create_bulk(users, method="copy")
+
+        benchmark.pedantic(
+            lambda: asyncio.get_event_loop().run_until_complete(run()),
+            iterations=3,
+            rounds=2,
+        )
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Raw asyncpg Benchmarks (baseline)
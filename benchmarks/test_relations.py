@@ -0,0 +1,131 @@
+"""Relation mapping microbenchmarks (no database needed).
+
+Attaching batch-loaded relations to 1000 parents with 50 000 children:
+- nested: previous scan of all parents for every child, O(N x M)
+- indexed: _map_relation_results, parents indexed by id, O(N + M)
+
+Run:
+    pytest benchmarks/test_relations.py -v --benchmark-only
+
+Or standalone:
+    python -m benchmarks.test_relations
+"""
+
+import pytest
+
+from dotorm import Char, DotModel, Integer, Many2many, Many2one, One2many
+from dotorm.fields import Field
+
+from .standalone import per_call, print_table
+
+PARENTS = 1000
+CHILDREN = 50_000
+
+
+class BenchTag(DotModel):
+    __table__ = "bench_tags"
+
+    id: int = Integer(primary_key=True)
+    name: str = Char()
+    order_id: int = Integer()
+
+
+class BenchOrder(DotModel):
+    __table__ = "bench_orders"
+
+    id: int = Integer(primary_key=True)
+    tag_id: BenchTag = Many2one(lambda: BenchTag)
+    line_ids: list[BenchTag] = One2many(lambda: BenchTag, "order_id")
+    tag_ids: list[BenchTag] = Many2many(
+        relation_table=lambda: BenchTag,
+        many2many_table="bench_order_tags",
+        column1="order_id",
+        column2="tag_id",
+    )
+
+
+def _parents() -> list[BenchOrder]:
+    return BenchOrder.prepare_list_ids(
+        [{"id": i, "tag_id": i % 100} for i in range(PARENTS)]
+    )
+
+
+def _children(parent_attr: str) -> list[BenchTag]:
+    return BenchTag.prepare_list_ids(
+        [
+            {"id": i, "name": "tag", parent_attr: i % PARENTS}
+            for i in range(CHILDREN)
+        ]
+    )
+
+
+def _map_nested(field_name: str, parent_attr: str, records, result):
+    """Previous implementation (x2many branch), kept for comparison."""
+    for rec in records:
+        if isinstance(getattr(rec, field_name), Field):
+            setattr(rec, field_name, [])
+    for res_model in result:
+        for rec in records:
+            if rec.id == getattr(res_model, parent_attr):
+                getattr(rec, field_name).append(res_model)
+                break
+
+
+def _map_indexed(field_name: str, parent_attr: str, records, result):
+    BenchOrder._map_relation_results(
+        BenchOrder.get_fields()[field_name], field_name, records, result
+    )
+
+
+class TestOne2manyMapping:
+    """1k parents x 50k children, One2many."""
+
+    @pytest.mark.benchmark(group="relations-o2m")
+    def test_o2m_nested(self, benchmark):
+        children = _children("order_id")
+        benchmark.pedantic(
+            lambda: _map_nested("line_ids", "order_id", _parents(), children),
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(group="relations-o2m")
+    def test_o2m_indexed(self, benchmark):
+        children = _children("order_id")
+        benchmark(
+            lambda: _map_indexed("line_ids", "order_id", _parents(), children)
+        )
+
+
+class TestMany2oneMapping:
+    """1k parents, 100 distinct related records, Many2one."""
+
+    @pytest.mark.benchmark(group="relations-m2o")
+    def test_m2o_indexed(self, benchmark):
+        tags = BenchTag.prepare_list_ids(
+            [{"id": i, "name": "tag"} for i in range(100)]
+        )
+        benchmark(
+            lambda: BenchOrder._map_relation_results(
+                BenchOrder.tag_id, "tag_id", _parents(), tags
+            )
+        )
+
+
+def run() -> None:
+    """Print timings for nested vs indexed One2many mapping."""
+    children = _children("order_id")
+    rows = []
+    for name, mapper, number in (
+        ("nested", _map_nested, 1),
+        ("indexed", _map_indexed, 20),
+    ):
+        seconds = per_call(
+            lambda: mapper("line_ids", "order_id", _parents(), children),
+            number,
+        )
+        rows.append((name, seconds * 1e3))
+    print_table(("mapping", "ms"), rows)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,78 @@
+"""DotModel.json() serialization microbenchmarks (no database needed).
+
+Typical list response: 1000 records with scalar, JSON and relation
+fields serialized with json() in LIST and FORM modes.
+
+Run:
+    pytest benchmarks/test_serializer.py -v --benchmark-only
+
+Or standalone:
+    python -m benchmarks.test_serializer
+"""
+
+import pytest
+
+from dotorm import Boolean, Char, DotModel, Integer, JSONField, Many2one
+from dotorm.model import JsonMode
+
+from .standalone import per_call, print_table
+
+
+class BenchRole(DotModel):
+    __table__ = "bench_roles"
+
+    id: int = Integer(primary_key=True)
+    name: str = Char(max_length=100)
+
+
+class BenchUser(DotModel):
+    __table__ = "bench_users"
+
+    id: int = Integer(primary_key=True)
+    name: str = Char(max_length=100)
+    email: str = Char(max_length=255)
+    active: bool = Boolean(default=True)
+    settings: dict = JSONField()
+    role_id: BenchRole = Many2one(lambda: BenchRole)
+
+
+ROLE = BenchRole(id=1, name="admin")
+RECORDS = [
+    BenchUser(
+        id=i,
+        name=f"user {i}",
+        email=f"user{i}@example.com",
+        settings={"theme": "dark"},
+        role_id=ROLE,
+    )
+    for i in range(1000)
+]
+
+
+def serialize(mode: JsonMode = JsonMode.LIST) -> list[dict]:
+    return [record.json(mode=mode) for record in RECORDS]
+
+
+class TestSerializer:
+    """json() over list of records."""
+
+    @pytest.mark.benchmark(group="json")
+    def test_json_list(self, benchmark):
+        benchmark(serialize, JsonMode.LIST)
+
+    @pytest.mark.benchmark(group="json")
+    def test_json_form(self, benchmark):
+        benchmark(serialize, JsonMode.FORM)
+
+
+def run(number: int = 200) -> None:
+    """Print per-record timings."""
+    rows = [
+        (mode.name, per_call(lambda: serialize(mode), number) / len(RECORDS) * 1e6)
+        for mode in (JsonMode.LIST, JsonMode.FORM)
+    ]
+    print_table(("mode", "us/record"), rows)
+
+
+if __name__ == "__main__":
+    run()
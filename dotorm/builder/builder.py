@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from ..components.filter_parser import FilterParser
 
+from .cache import StatementCache
 from .mixins import (
     CRUDMixin,
     Many2ManyMixin,
@@ -50,22 +51,28 @@ class Builder(
             limit=10,
         )
 
+        # Statement cache: repeated query shapes reuse SQL text
+        builder.statement_cache.info()
+        # {"hits": 120, "misses": 3, "size": 3, "maxsize": 256}
+
     MRO ensures BuilderBase.__init__ is called and provides
     all attributes that mixins expect.
     """
 
-    __slots__ = ("table", "fields", "dialect", "filter_parser")
+    __slots__ = ("table", "fields", "dialect", "filter_parser", "statement_cache")
 
     def __init__(
         self,
         table: str,
         fields: dict[str, "Field"],
         dialect: "Dialect",
+        cache_size: int = 256,
     ) -> None:
         self.table = table
         self.fields = fields
         self.dialect = dialect
-        self.filter_parser = FilterParser(dialect)
+        self.filter_parser = FilterParser(dialect, cache_size, fields)
+        self.statement_cache = StatementCache(cache_size)
 
     def get_store_fields(self) -> list[str]:
         """Returns only fields that are stored in DB (store=True)."""
@@ -0,0 +1,73 @@
+"""Statement cache for query builder."""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class StatementCache:
+    """
+    Bounded LRU cache of finished SQL statements.
+
+    Key is the query shape (fields, sort, order, pagination mode,
+    filter shape without values). Only SQL text is cached,
+    values are re-bound on every call.
+
+    Example:
+        cache = StatementCache(maxsize=256)
+        stmt = cache.get(key)
+        if stmt is None:
+            stmt = build(...)
+            cache.put(key, stmt)
+
+        cache.info()
+        # {"hits": 10, "misses": 1, "size": 1, "maxsize": 256}
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_data")
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """
+        Args:
+            maxsize: Max number of cached statements (0 = disabled)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return cached statement or None. Counts hit/miss."""
+        stmt = self._data.get(key)
+        if stmt is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return stmt
+
+    def put(self, key: Hashable, stmt: Any) -> None:
+        """Store statement, evict least recently used if full."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = stmt
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all statements and reset counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Hit/miss counters for monitoring hit rate."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
@@ -1,13 +1,17 @@
 """Helper functions for SQL building."""
 
 from __future__ import annotations
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..components.dialect import Dialect
 
 
 def build_sql_update_from_schema(
     sql: str,
     payload_dict: dict[str, Any],
     id: int | list[int],
+    dialect: Dialect | None = None,
 ) -> tuple[str, tuple]:
     """Составляет запрос обновления (update).
 
@@ -15,6 +19,8 @@ def build_sql_update_from_schema(
         sql -- текст шаблона запроса
         payload_dict -- сериализованные данные модели
         id -- идентификатор или список идентификаторов
+        dialect -- диалект для нативных плейсхолдеров ($1 в Postgres),
+            по умолчанию %s
 
     Returns:
         sql -- текст запроса с подстановками (биндингами)
@@ -26,14 +32,18 @@ def build_sql_update_from_schema(
     fields_list, values_list = zip(*payload_dict.items())
     values_list = tuple(values_list)
 
+    count = len(fields_list)
     if isinstance(id, list):
         values_list += tuple(id)
-        where_placeholder = ", ".join(["%s"] * len(id))
+        where_placeholder = _placeholders(dialect, len(id), count + 1)
     else:
         values_list += (id,)
-        where_placeholder = "%s"
+        where_placeholder = _placeholders(dialect, 1, count + 1)
 
-    query_placeholders = ", ".join(f"{field}=%s" for field in fields_list)
+    query_placeholders = ", ".join(
+        f"{field}={_placeholders(dialect, 1, i)}"
+        for i, field in enumerate(fields_list, 1)
+    )
     sql = sql % (query_placeholders, where_placeholder)
     return sql, values_list
 
@@ -41,12 +51,15 @@ def build_sql_update_from_schema(
 def build_sql_create_from_schema(
     sql: str,
     payload_dict: dict[str, Any],
+    dialect: Dialect | None = None,
 ) -> tuple[str, tuple]:
     """Составляет запрос создания (insert).
 
     Arguments:
         sql -- текст шаблона запроса
         payload_dict -- сериализованные данные модели
+        dialect -- диалект для нативных плейсхолдеров ($1 в Postgres),
+            по умолчанию %s
 
     Returns:
         sql -- текст запроса с подстановками (биндингами)
@@ -58,6 +71,13 @@ def build_sql_create_from_schema(
     fields_list, values_list = zip(*payload_dict.items())
 
     query_columns = ", ".join(fields_list)
-    query_placeholders = ", ".join(["%s"] * len(values_list))
+    query_placeholders = _placeholders(dialect, len(values_list))
     sql = sql % (query_columns, query_placeholders)
     return sql, values_list
+
+
+def _placeholders(dialect: Dialect | None, count: int, start: int = 1) -> str:
+    """Плейсхолдеры диалекта (или %s, если диалект не задан)."""
+    if dialect is None:
+        return ", ".join(["%s"] * count)
+    return dialect.make_placeholders(count, start)
@@ -2,6 +2,7 @@
 
 from typing import TYPE_CHECKING, Any, Literal
 
+from ...components.dialect import get_pg_array_type
 from ...components.filter_parser import FilterExpression
 
 if TYPE_CHECKING:
@@ -30,7 +31,7 @@ class CRUDMixin:
     __slots__ = ()
 
     def build_delete(self: "BuilderProtocol") -> str:
-        return f"DELETE FROM {self.table} WHERE id=%s"
+        return f"DELETE FROM {self.table} WHERE id={self.dialect.make_placeholder(1)}"
 
     def build_delete_bulk(self: "BuilderProtocol", count: int) -> str:
         """Build bulk DELETE by ids.
@@ -50,41 +51,21 @@ class CRUDMixin:
     ) -> tuple[str, tuple]:
         """Build INSERT query from dict."""
         stmt = f"INSERT INTO {self.table} (%s) VALUES (%s)"
-        stmt, values_list = build_sql_create_from_schema(stmt, payload_dict)
+        stmt, values_list = build_sql_create_from_schema(
+            stmt, payload_dict, self.dialect
+        )
         return stmt, values_list
 
-    # Mapping of SQL types to PostgreSQL array cast types for unnest
-    _PG_ARRAY_TYPE_MAP = {
-        "INTEGER": "int4",
-        "SERIAL": "int4",
-        "BIGINT": "int8",
-        "BIGSERIAL": "int8",
-        "SMALLINT": "int2",
-        "SMALLSERIAL": "int2",
-        "TEXT": "text",
-        "BOOL": "bool",
-        "TIMESTAMPTZ": "timestamptz",
-        "DATE": "date",
-        "TIME": "time",
-        "TIMETZ": "timetz",
-        "DOUBLE PRECISION": "float8",
-        "JSONB": "jsonb",
-        "JSON": "jsonb",
-    }
-
     def _get_pg_array_type(self: "BuilderProtocol", sql_type: str) -> str:
         """Map SQL type to PostgreSQL array cast type for unnest."""
-        # Exact match
-        upper = sql_type.upper()
-        if upper in self._PG_ARRAY_TYPE_MAP:
-            return self._PG_ARRAY_TYPE_MAP[upper]
-        # VARCHAR(N) -> text
-        if upper.startswith("VARCHAR"):
-            return "text"
-        # DECIMAL(M,N) -> numeric
-        if upper.startswith("DECIMAL"):
-            return "numeric"
-        # Fallback
+        return get_pg_array_type(sql_type)
+
+    def _get_column_array_type(self: "BuilderProtocol", field_name: str) -> str:
+        """PostgreSQL array element type of column (for unnest casts)."""
+        field_obj = self.fields.get(field_name)
+        if field_obj:
+            # sql_type can be class attr (str) or property
+            return self._get_pg_array_type(field_obj.sql_type)
         return "text"
 
     def build_create_bulk(
@@ -109,6 +90,88 @@ class CRUDMixin:
 
         return self._build_create_bulk_values(payloads_dicts, fields_list)
 
+    def build_upsert_bulk(
+        self: "BuilderProtocol",
+        payloads_dicts: list[dict[str, Any]],
+        conflict_fields: list[str],
+        update_fields: list[str] | None = None,
+    ) -> tuple[str, list]:
+        """Build bulk INSERT or UPDATE on conflict (build_create_bulk + clause).
+
+        Postgres: INSERT ... SELECT * FROM unnest(...)
+            ON CONFLICT (conflict_fields) DO UPDATE SET f = EXCLUDED.f
+        MySQL:    INSERT ... VALUES (...), (...)
+            ON DUPLICATE KEY UPDATE f = VALUES(f)
+            (conflict is any unique key, conflict_fields not used in SQL)
+
+        update_fields=None - all payload fields except conflict_fields.
+        Empty update_fields - no-op update of conflict field, so that
+        RETURNING still gives ids of existing rows (DO NOTHING skips them).
+        All payloads must have the same fields, update_fields must be
+        among them (otherwise existing rows get NULL/default values).
+        """
+        if not payloads_dicts:
+            raise ValueError("payloads_dicts cannot be empty")
+        if not conflict_fields:
+            raise ValueError("conflict_fields cannot be empty")
+
+        first = payloads_dicts[0]
+        fields_list = list(first.keys())
+        for row in payloads_dicts:
+            if row.keys() != first.keys():
+                raise ValueError("All payloads must have the same fields")
+        store_fields = self.get_store_fields()
+        for name in (*conflict_fields, *(update_fields or ())):
+            if name not in store_fields:
+                raise ValueError(f"Invalid field: {name}")
+        for name in conflict_fields:
+            if name not in fields_list:
+                raise ValueError(f"Conflict field {name} not in payload")
+        for name in update_fields or ():
+            if name not in fields_list:
+                raise ValueError(f"Update field {name} not in payload")
+
+        if update_fields is None:
+            update_fields = [
+                name for name in fields_list if name not in conflict_fields
+            ]
+        if not update_fields:
+            update_fields = conflict_fields[:1]
+
+        if self.dialect.name == "postgres":
+            stmt, values = self._build_create_bulk_unnest(
+                payloads_dicts, fields_list
+            )
+            set_clause = ", ".join(
+                f"{name} = EXCLUDED.{name}" for name in update_fields
+            )
+            stmt += (
+                f" ON CONFLICT ({', '.join(conflict_fields)}) "
+                f"DO UPDATE SET {set_clause}"
+            )
+            return stmt, values
+
+        stmt, values = self._build_create_bulk_values(
+            payloads_dicts, fields_list
+        )
+        set_clause = ", ".join(
+            f"{name} = VALUES({name})" for name in update_fields
+        )
+        stmt += f" ON DUPLICATE KEY UPDATE {set_clause}"
+        return stmt, values
+
+    def build_reserve_ids(self: "BuilderProtocol", count: int) -> tuple[str, list]:
+        """Postgres: take count ids from serial sequence of id column.
+
+        Used by COPY insert (create_bulk(method="copy")), which has
+        no RETURNING: ids are reserved first and copied explicitly.
+        """
+        stmt = (
+            f"SELECT nextval(pg_get_serial_sequence('{self.table}', 'id')) "
+            f"AS id FROM generate_series(1, $1)"
+        )
+        return stmt, [count]
+
     def _build_create_bulk_unnest(
         self: "BuilderProtocol",
         payloads_dicts: list[dict[str, Any]],
@@ -123,15 +186,7 @@ class CRUDMixin:
         for i, field_name in enumerate(fields_list, 1):
             col_values = [row[field_name] for row in payloads_dicts]
             column_arrays.append(col_values)
-
-            # Get PostgreSQL array type from field definition
-            field_obj = self.fields.get(field_name)
-            if field_obj:
-                # sql_type can be class attr (str) or property
-                sql_type = field_obj.sql_type
-                pg_type = self._get_pg_array_type(sql_type)
-            else:
-                pg_type = "text"
+            pg_type = self._get_column_array_type(field_name)
             unnest_params.append(f"${i}::{pg_type}[]")
 
         unnest_clause = ", ".join(unnest_params)
@@ -171,7 +226,7 @@ class CRUDMixin:
         """Build UPDATE query from dict."""
         stmt = f"UPDATE {self.table} SET %s WHERE id = %s"
         stmt, values_list = build_sql_update_from_schema(
-            stmt, payload_dict, id
+            stmt, payload_dict, id, self.dialect
         )
         return stmt, values_list
 
@@ -191,19 +246,24 @@ class CRUDMixin:
         fields_list = list(payload_dict.keys())
         values_list = [payload_dict[f] for f in fields_list]
 
-        # SET field1=%s, field2=%s
-        set_clause = ", ".join(f"{field}=%s" for field in fields_list)
+        # SET field1=$1, field2=$2 (Postgres) / field1=%s (MySQL)
+        placeholder = self.dialect.make_placeholder
+        set_clause = ", ".join(
+            f"{field}={placeholder(i)}"
+            for i, field in enumerate(fields_list, 1)
+        )
+        next_index = len(fields_list) + 1
 
         if self.dialect.name == "postgres":
             # ids as single array parameter: ANY($N::int[])
             values_list.append(ids)
             stmt = (
                 f"UPDATE {self.table} SET {set_clause} "
-                f"WHERE id = ANY(%s::int[])"
+                f"WHERE id = ANY({placeholder(next_index)}::int[])"
             )
         else:
             # ids as individual parameters: IN (%s, %s, ...)
-            placeholders = self.dialect.make_placeholders(len(ids))
+            placeholders = self.dialect.make_placeholders(len(ids), next_index)
             values_list.extend(ids)
             stmt = (
                 f"UPDATE {self.table} SET {set_clause} "
@@ -212,6 +272,67 @@ class CRUDMixin:
 
         return stmt, tuple(values_list)
 
+    def build_update_many(
+        self: "BuilderProtocol",
+        rows: list[list[Any]],
+        fields: list[str],
+    ) -> tuple[str, list]:
+        """Build UPDATE of many rows with own values per row.
+
+        rows: [id, value of fields[0], value of fields[1], ...] per row.
+
+        Postgres: column arrays, one param per column.
+          UPDATE t SET a = v.a FROM unnest($1::int4[], $2::text[])
+          AS v(id, a) WHERE t.id = v.id
+        MySQL: CASE per column.
+          UPDATE t SET a = CASE id WHEN %s THEN %s ... END
+          WHERE id IN (%s, ...)
+        """
+        if not rows:
+            raise ValueError("rows cannot be empty")
+        if not fields:
+            raise ValueError("fields cannot be empty")
+        store_fields = self.get_store_fields()
+        for name in fields:
+            if name not in store_fields or name == "id":
+                raise ValueError(f"Invalid field: {name}")
+
+        columns = ["id", *fields]
+        if self.dialect.name == "postgres":
+            # transpose rows→columns
+            column_arrays = [list(values) for values in zip(*rows)]
+            unnest_clause = ", ".join(
+                f"${i}::{self._get_column_array_type(name)}[]"
+                for i, name in enumerate(columns, 1)
+            )
+            set_clause = ", ".join(f"{name} = v.{name}" for name in fields)
+            stmt = (
+                f"UPDATE {self.table} AS t SET {set_clause} "
+                f"FROM unnest({unnest_clause}) AS v({', '.join(columns)}) "
+                f"WHERE t.id = v.id"
+            )
+            return stmt, column_arrays
+
+        placeholder = self.dialect.make_placeholder(1)
+        when_clause = " ".join(
+            f"WHEN {placeholder} THEN {placeholder}" for _ in rows
+        )
+        set_clause = ", ".join(
+            f"{name} = CASE id {when_clause} END" for name in fields
+        )
+        values: list = []
+        for i in range(1, len(columns)):
+            for row in rows:
+                values.append(row[0])
+                values.append(row[i])
+        ids = [row[0] for row in rows]
+        values.extend(ids)
+        stmt = (
+            f"UPDATE {self.table} SET {set_clause} "
+            f"WHERE id IN ({self.dialect.make_placeholders(len(ids))})"
+        )
+        return stmt, values
+
     def build_get(
         self: "BuilderProtocol",
         id: int,
@@ -232,9 +353,47 @@ class CRUDMixin:
             f"{escape}{name}{escape}" for name in selected_fields
         )
 
-        stmt = f"SELECT {fields_stmt} FROM {self.table} WHERE id = %s LIMIT 1"
+        stmt = (
+            f"SELECT {fields_stmt} FROM {self.table} "
+            f"WHERE id = {self.dialect.make_placeholder(1)} LIMIT 1"
+        )
         return stmt, [id]
 
+    def build_get_many(
+        self: "BuilderProtocol",
+        ids: list[int],
+        fields: list[str] | None = None,
+    ) -> tuple[str, list]:
+        """
+        Build SELECT by several IDs.
+
+        Postgres: ANY($1::int[]) — single array param, same SQL for any count.
+        MySQL:    IN (%s, %s, ...) — individual params.
+
+        Args:
+            ids: Record IDs
+            fields: Fields to select (empty = all stored)
+        """
+        escape = self.dialect.escape
+        selected_fields = fields if fields else self.get_store_fields()
+        fields_stmt = ", ".join(
+            f"{escape}{name}{escape}" for name in selected_fields
+        )
+
+        if self.dialect.name == "postgres":
+            return (
+                f"SELECT {fields_stmt} FROM {self.table} "
+                f"WHERE id = ANY($1::int[])",
+                [list(ids)],
+            )
+
+        placeholders = self.dialect.make_placeholders(len(ids))
+        stmt = (
+            f"SELECT {fields_stmt} FROM {self.table} "
+            f"WHERE id IN ({placeholders})"
+        )
+        return stmt, list(ids)
+
     def build_table_len(self: "BuilderProtocol") -> tuple[str, None]:
         stmt = f"SELECT COUNT(*) FROM {self.table}"
         return stmt, None
@@ -262,7 +421,39 @@ class CRUDMixin:
             sort: Sort field
             filter: Filter expression
             raw: Return raw dict instead of model
+
+        SQL text is cached by query shape (see StatementCache)
+        with native dialect placeholders ($1 for Postgres),
+        on repeated shapes only values are re-bound.
         """
+        if end is not None and start is not None:
+            pagination = "offset"
+            val: tuple = (end - start, start)
+        elif limit:
+            pagination = "limit"
+            val = (limit,)
+        else:
+            pagination = None
+            val = ()
+
+        filter_shape = None
+        if filter:
+            filter_shape, where_values = self.filter_parser.signature(filter)
+            # Prepend where values
+            val = where_values + val
+
+        key = (
+            "search",
+            tuple(fields) if fields is not None else None,
+            sort,
+            order,
+            pagination,
+            filter_shape,
+        )
+        stmt = self.statement_cache.get(key)
+        if stmt is not None:
+            return stmt, val
+
         escape = self.dialect.escape
         store_fields = self.get_store_fields()
 
@@ -289,29 +480,22 @@ class CRUDMixin:
         )
 
         where = ""
-        where_values: tuple = ()
 
-        if filter:
-            where_clause, where_values = self.filter_parser.parse(filter)
+        if filter_shape is not None:
+            where_clause = self.filter_parser.template(filter_shape).clause
             where = f"WHERE {where_clause}"
 
         stmt = f"SELECT {fields_store_stmt} FROM {self.table} " f"{where} "
         if sort and order:
             stmt += f"ORDER BY {sort} {order_upper} "
 
-        val: tuple = ()
-
-        if end is not None and start is not None:
+        if pagination == "offset":
             stmt += "LIMIT %s OFFSET %s"
-            val = (end - start, start)
-        elif limit:
+        elif pagination == "limit":
             stmt += "LIMIT %s"
-            val = (limit,)
-
-        # Prepend where values
-        if where_values:
-            val = where_values + val
 
+        stmt = self.dialect.native_placeholders(stmt)
+        self.statement_cache.put(key, stmt)
         return stmt, val
 
     def build_search_count(
@@ -329,13 +513,24 @@ class CRUDMixin:
         """
         where = ""
         where_values: tuple = ()
+        compiled = None
 
         if filter:
-            where_clause, where_values = self.filter_parser.parse(filter)
-            where = f"WHERE {where_clause}"
+            compiled, where_values = self.filter_parser.compile(filter)
+
+        key = ("count", compiled.shape if compiled else None)
+        stmt = self.statement_cache.get(key)
+        if stmt is not None:
+            return stmt, where_values
 
-        stmt = f"SELECT COUNT(*) as count FROM {self.table} {where}"
+        if compiled:
+            where = f"WHERE {compiled.clause}"
 
+        stmt = self.dialect.native_placeholders(
+            f"SELECT COUNT(*) as count FROM {self.table} {where}"
+        )
+
+        self.statement_cache.put(key, stmt)
         return stmt, where_values
 
     def build_exists(
@@ -353,11 +548,22 @@ class CRUDMixin:
         """
         where = ""
         where_values: tuple = ()
+        compiled = None
 
         if filter:
-            where_clause, where_values = self.filter_parser.parse(filter)
-            where = f"WHERE {where_clause}"
+            compiled, where_values = self.filter_parser.compile(filter)
+
+        key = ("exists", compiled.shape if compiled else None)
+        stmt = self.statement_cache.get(key)
+        if stmt is not None:
+            return stmt, where_values
 
-        stmt = f"SELECT 1 FROM {self.table} {where} LIMIT 1"
+        if compiled:
+            where = f"WHERE {compiled.clause}"
+
+        stmt = self.dialect.native_placeholders(
+            f"SELECT 1 FROM {self.table} {where} LIMIT 1"
+        )
 
+        self.statement_cache.put(key, stmt)
         return stmt, where_values
@@ -54,7 +54,7 @@ class Many2ManyMixin:
             stmt += "LIMIT %s"
             val += (limit,)
 
-        return stmt, val
+        return self.dialect.native_placeholders(stmt), val
 
     def build_get_many2many_multiple(
         self: "BuilderProtocol",
@@ -64,18 +64,32 @@ class Many2ManyMixin:
         column1: str,
         column2: str,
         fields: list[str] | None = None,
-        limit: int = 80,
+        limit: int | None = 80,
+        sort: str = "id",
+        order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
     ) -> tuple[str, tuple]:
         """
         Оптимизированная версия, когда необходимо получить сразу несколько свзяей m2m
         у нескольких записей. Не просто один список на одну записиь.
         А N списков на N записей.
 
+        limit применяется к каждой записи отдельно (не больше limit
+        связанных записей на родителя) через
+        ROW_NUMBER() OVER (PARTITION BY ...), записи каждого родителя
+        отсортированы по sort/order. limit=None - без ограничения.
+
         Returns:
             tuple[str, tuple]: SQL statement and parameter values
         """
+        store_fields = relation_table.get_store_fields()
         if not fields:
-            fields = relation_table.get_store_fields()
+            fields = store_fields
+
+        order_upper = order.upper()
+        if order_upper not in ("ASC", "DESC"):
+            raise ValueError(f"Invalid order: {order}")
+        if sort not in store_fields:
+            sort = "id"
 
         # явно указать для sql запроса что эти поля относятся
         # к связанной таблице
@@ -84,28 +98,104 @@ class Many2ManyMixin:
         # добавляем ид из таблицы связи для последующего маппинга записей
         # имеется ввиду за один запрос достаются все записи для всех ид
         # а далее в питоне для каждого ид остаются только его
-        fields_prefixed.append(f"pt.{column2} as m2m_id")
-
-        fields_select_stmt = ", ".join(fields_prefixed)
-        query_placeholders = ", ".join(["%s"] * len(ids))
-
-        stmt = f"""
-        SELECT {fields_select_stmt}
+        fields_prefixed.append(f"pt.{column2} AS m2m_id")
+
+        if self.dialect.name == "postgres":
+            # ids as single array param, SQL does not depend on len(ids)
+            cast = self.filter_parser.array_cast("id")
+            where = f"pt.{column2} = ANY(%s{cast})"
+            val: tuple = (list(ids),)
+        else:
+            query_placeholders = ", ".join(["%s"] * len(ids))
+            where = f"pt.{column2} IN ({query_placeholders})"
+            val = tuple(ids)
+
+        if not limit:
+            stmt = f"""
+        SELECT {", ".join(fields_prefixed)}
         FROM {relation_table.__table__} p
         JOIN {many2many_table} pt ON p.id = pt.{column1}
-        JOIN {self.table} t ON pt.{column2} = t.id
-        WHERE t.id IN ({query_placeholders})
-        LIMIT %s
+        WHERE {where}
+        ORDER BY pt.{column2}, p.{sort} {order_upper}
         """
+            return self.dialect.native_placeholders(stmt), val
 
-        val = (*ids, limit)
-        return stmt, val
+        fields_select_stmt = ", ".join([*fields, "m2m_id"])
+        stmt = f"""
+        SELECT {fields_select_stmt} FROM (
+            SELECT {", ".join(fields_prefixed)},
+                ROW_NUMBER() OVER (
+                    PARTITION BY pt.{column2} ORDER BY p.{sort} {order_upper}
+                ) AS rn
+            FROM {relation_table.__table__} p
+            JOIN {many2many_table} pt ON p.id = pt.{column1}
+            WHERE {where}
+        ) sub
+        WHERE rn <= %s
+        ORDER BY m2m_id, rn
+        """
 
+        return self.dialect.native_placeholders(stmt), (*val, limit)
 
-#         SELECT * FROM (
-#     SELECT p.*, pt.column2 as m2m_id,
-#            ROW_NUMBER() OVER (PARTITION BY pt.column2 ORDER BY p.id) as rn
-#     FROM relation_table p
-#     JOIN m2m_table pt ON p.id = pt.column1
-#     WHERE pt.column2 IN (%s, %s, ...)
-# ) sub WHERE rn <= {limit_per_parent}
+    def build_link_many2many(
+        self: "BuilderProtocol",
+        many2many_table: str,
+        column1: str,
+        column2: str,
+        values: list,
+        ignore_conflicts: bool = False,
+    ) -> tuple[str, list]:
+        """
+        Build INSERT of M2M links.
+
+        values: (column2 value, column1 value) per link.
+
+        Postgres: one statement, one array param per column.
+          INSERT INTO t (c2, c1) SELECT * FROM unnest($1::int[], $2::int[])
+          [ON CONFLICT DO NOTHING]
+        MySQL: INSERT [IGNORE] ... VALUES (%s, %s) for executemany,
+          values are returned as rows.
+        """
+        if self.dialect.name == "postgres":
+            stmt = (
+                f"INSERT INTO {many2many_table} ({column2}, {column1}) "
+                f"SELECT * FROM unnest($1::int[], $2::int[])"
+            )
+            if ignore_conflicts:
+                stmt += " ON CONFLICT DO NOTHING"
+            return stmt, [
+                [row[0] for row in values],
+                [row[1] for row in values],
+            ]
+
+        ignore = " IGNORE" if ignore_conflicts else ""
+        stmt = (
+            f"INSERT{ignore} INTO {many2many_table} ({column2}, {column1}) "
+            f"VALUES (%s, %s)"
+        )
+        return stmt, [tuple(row) for row in values]
+
+    def build_unlink_many2many(
+        self: "BuilderProtocol",
+        many2many_table: str,
+        column1: str,
+        ids: list[int],
+    ) -> tuple[str, list]:
+        """
+        Build DELETE of M2M links by related ids (column1).
+
+        Postgres: = ANY($1::int[]) — single array param.
+        MySQL:    IN (%s, %s, ...) — individual params.
+        """
+        if self.dialect.name == "postgres":
+            return (
+                f"DELETE FROM {many2many_table} "
+                f"WHERE {column1} = ANY($1::int[])",
+                [list(ids)],
+            )
+
+        placeholders = self.dialect.make_placeholders(len(ids))
+        stmt = (
+            f"DELETE FROM {many2many_table} WHERE {column1} IN ({placeholders})"
+        )
+        return stmt, list(ids)
@@ -1,12 +1,20 @@
 """Relations query builder."""
 
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from ..protocol import BuilderProtocol
 
 from ..request_builder import RequestBuilder
-from ...fields import PolymorphicMany2one, Field, Many2many, Many2one, One2many
+from ...fields import (
+    PolymorphicMany2one,
+    PolymorphicOne2many,
+    Field,
+    Many2many,
+    Many2one,
+    One2many,
+    One2one,
+)
 
 
 class RelationsMixin:
@@ -19,10 +27,18 @@ class RelationsMixin:
         fields_relation: list[tuple[str, Field]],
         records: list | None = None,
         fields_nested: dict[str, list[str]] | None = None,
+        limit: int | None = 80,
+        sort: str = "id",
+        order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
     ) -> list[RequestBuilder]:
         """
         Build optimized queries for loading relations.
-        Avoids N+1 by batching relation queries.
+        Avoids N+1 by batching relation queries: one query per
+        relation field (Many2one, One2many, Many2many,
+        PolymorphicMany2one, PolymorphicOne2many, One2one).
+
+        limit, sort, order - per parent for One2many/Many2many:
+        every record gets at most limit related records.
         """
         if records is None:
             records = []
@@ -34,23 +50,62 @@ class RelationsMixin:
             return request_list
 
         for name, field in fields_relation:
-            # TODO: взможно ошибка от дублирвоания полей
-            # Default fields for relations
-            # добавить вложенные поля от пользователя
-            fields = []
-            if fields_nested:
-                custom_fields = fields_nested.get(name)
-                if custom_fields:
-                    fields += custom_fields
-            if field.relation_table:
-                fields = field.relation_table.get_store_fields()
+            if not field.relation_table:
+                continue
+            fields = self._relation_select_fields(
+                field, fields_nested.get(name) if fields_nested else None
+            )
 
             req: RequestBuilder | None = None
 
             if isinstance(field, One2many):
-                stmt, val = field.relation_table._builder.build_search(
-                    fields=[*fields, field.relation_table_field],
-                    filter=[(field.relation_table_field, "in", ids)],
+                builder = field.relation_table._builder
+                stmt, val = builder.build_search_one2many_multiple(
+                    ids=ids,
+                    relation_field=field.relation_table_field,
+                    fields=fields,
+                    limit=limit,
+                    sort=sort,
+                    order=order,
+                )
+                req = RequestBuilder(
+                    stmt=stmt,
+                    value=val,
+                    field_name=name,
+                    field=field,
+                    fields=fields,
+                )
+
+            elif isinstance(field, PolymorphicOne2many):
+                # res_model = $1 AND res_id = ANY($2)
+                builder = field.relation_table._builder
+                stmt, val = builder.build_search_one2many_multiple(
+                    ids=ids,
+                    relation_field=field.relation_table_field,
+                    fields=fields,
+                    limit=limit,
+                    sort=sort,
+                    order=order,
+                    res_model=self.table,
+                )
+                req = RequestBuilder(
+                    stmt=stmt,
+                    value=val,
+                    field_name=name,
+                    field=field,
+                    fields=fields,
+                )
+
+            elif isinstance(field, One2one):
+                # одна запись на родителя: тот же запрос с limit 1
+                builder = field.relation_table._builder
+                stmt, val = builder.build_search_one2many_multiple(
+                    ids=ids,
+                    relation_field=field.relation_table_field,
+                    fields=fields,
+                    limit=1,
+                    sort=sort,
+                    order=order,
                 )
                 req = RequestBuilder(
                     stmt=stmt,
@@ -68,6 +123,9 @@ class RelationsMixin:
                     column1=field.column1,
                     column2=field.column2,
                     fields=fields,
+                    limit=limit,
+                    sort=sort,
+                    order=order,
                 )
                 req = RequestBuilder(
                     stmt=stmt,
@@ -104,3 +162,184 @@ class RelationsMixin:
                 request_list.append(req)
 
         return request_list
+
+    @staticmethod
+    def _relation_select_fields(
+        field: Field, nested: list[str] | None
+    ) -> list[str]:
+        """
+        Columns of relation table to select.
+
+        Requested nested fields (fields_nested) are pushed into SQL,
+        only stored ones, plus "id" as join key (FK of One2many and
+        m2m_id of Many2many are added by their builders).
+        Without nested fields - all store fields.
+        """
+        store_fields = field.relation_table.get_store_fields()
+        if not nested:
+            return store_fields
+        fields = [name for name in nested if name in store_fields]
+        if "id" not in fields:
+            fields.insert(0, "id")
+        return fields
+
+    def build_search_one2many_multiple(
+        self: "BuilderProtocol",
+        ids: list[int],
+        relation_field: str,
+        fields: list[str],
+        limit: int | None = 80,
+        sort: str = "id",
+        order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
+        res_model: str | None = None,
+    ) -> tuple[str, tuple]:
+        """
+        Build batch SELECT of One2many children for several parents.
+
+        Called on builder of child table. limit is per parent
+        (ROW_NUMBER() OVER (PARTITION BY relation_field ...)),
+        children of each parent are ordered by sort/order.
+        limit=None - all children.
+        Also used for PolymorphicOne2many (res_model is set)
+        and One2one (limit=1).
+
+        Args:
+            ids: Parent ids
+            relation_field: FK column in child table (relation_table_field)
+            fields: Child fields to select (id and FK are added)
+            limit: Max children per parent
+            sort: Sort field of child table
+            order: ASC/DESC
+            res_model: Parent table of polymorphic relation
+                (res_model = $1 AND res_id = ANY($2))
+
+        Returns:
+            Tuple of (query, values)
+        """
+        filter: list = [(relation_field, "in", ids)]
+        if res_model is not None:
+            filter.insert(0, ("res_model", "=", res_model))
+        filter_shape, val = self.filter_parser.signature(filter)
+        key = (
+            "o2m",
+            tuple(fields),
+            relation_field,
+            sort,
+            order,
+            bool(limit),
+            filter_shape,
+        )
+        if limit:
+            val = (*val, limit)
+
+        stmt = self.statement_cache.get(key)
+        if stmt is not None:
+            return stmt, val
+
+        escape = self.dialect.escape
+        store_fields = self.get_store_fields()
+
+        order_upper = order.upper()
+        if order_upper not in ("ASC", "DESC"):
+            raise ValueError(f"Invalid order: {order}")
+        if sort not in store_fields:
+            sort = "id"
+
+        select = ["id", *fields, relation_field]
+        columns = ", ".join(
+            f"{escape}{name}{escape}"
+            for name in dict.fromkeys(select)
+            if name in store_fields
+        )
+        where = self.filter_parser.template(filter_shape).clause
+        fk = f"{escape}{relation_field}{escape}"
+        sort_sql = f"{escape}{sort}{escape} {order_upper}"
+
+        if limit:
+            stmt = (
+                f"SELECT {columns} FROM ("
+                f"SELECT {columns}, ROW_NUMBER() OVER ("
+                f"PARTITION BY {fk} ORDER BY {sort_sql}) AS rn "
+                f"FROM {self.table} WHERE {where}"
+                f") sub WHERE rn <= %s ORDER BY {fk}, rn"
+            )
+        else:
+            stmt = (
+                f"SELECT {columns} FROM {self.table} WHERE {where} "
+                f"ORDER BY {fk}, {sort_sql}"
+            )
+
+        stmt = self.dialect.native_placeholders(stmt)
+        self.statement_cache.put(key, stmt)
+        return stmt, val
+
+    def build_search_join(
+        self: "BuilderProtocol",
+        stmt: str,
+        joins: list[tuple[str, Field, list[str]]],
+        sort: str | None = None,
+        order: Literal["DESC", "ASC", "desc", "asc"] | None = None,
+    ) -> str:
+        """
+        Wrap search query with LEFT JOIN of Many2one tables.
+
+        Parent query (build_search: filter, ORDER BY, LIMIT) becomes
+        a subquery, so filter columns stay unambiguous and limit
+        applies to parents. Columns of joined table come aliased
+        as "<field>__<column>". Values of stmt are not changed.
+
+        Example:
+            SELECT p.*, j0."id" AS "role_id__id", ...
+            FROM (SELECT ... LIMIT $2) p
+            LEFT JOIN roles j0 ON j0.id = p."role_id"
+
+        Args:
+            stmt: Parent query from build_search()
+            joins: (field name, Many2one field, columns of joined table)
+            sort: Sort field of parent query
+            order: ASC/DESC
+
+        Returns:
+            Query text
+        """
+        key = (
+            "search_join",
+            stmt,
+            sort,
+            order,
+            tuple((name, tuple(columns)) for name, _, columns in joins),
+        )
+        cached = self.statement_cache.get(key)
+        if cached is not None:
+            return cached
+
+        escape = self.dialect.escape
+        select = ["p.*"]
+        tables = []
+        for i, (name, field, columns) in enumerate(joins):
+            alias = f"j{i}"
+            select += [
+                f"{alias}.{escape}{column}{escape} "
+                f"AS {escape}{name}__{column}{escape}"
+                for column in columns
+            ]
+            tables.append(
+                f"LEFT JOIN {field.relation_table.__table__} {alias} "
+                f"ON {alias}.id = p.{escape}{name}{escape}"
+            )
+
+        join_stmt = f"SELECT {', '.join(select)} FROM ({stmt}) p " + " ".join(
+            tables
+        )
+        # порядок родителей после JOIN не гарантирован
+        if sort and order:
+            order_upper = order.upper()
+            if order_upper not in ("ASC", "DESC"):
+                raise ValueError(f"Invalid order: {order}")
+            store_fields = self.get_store_fields()
+            if sort not in store_fields:
+                sort = store_fields[0]
+            join_stmt += f" ORDER BY p.{escape}{sort}{escape} {order_upper}"
+
+        self.statement_cache.put(key, join_stmt)
+        return join_stmt
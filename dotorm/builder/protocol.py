@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from ..fields import Field
     from ..components.dialect import Dialect
     from ..components.filter_parser import FilterParser
+    from .cache import StatementCache
 
 
 @runtime_checkable
@@ -19,6 +20,7 @@ class BuilderProtocol(Protocol):
     fields: dict[str, "Field"]
     dialect: "Dialect"
     filter_parser: "FilterParser"
+    statement_cache: "StatementCache"
 
     def get_store_fields(self) -> list[str]:
         """Returns field names that are stored in DB."""
@@ -44,7 +46,20 @@ class BuilderProtocol(Protocol):
         column1: str,
         column2: str,
         fields: list[str] | None = None,
-        limit: int = 80,
+        limit: int | None = 80,
+        sort: str = "id",
+        order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
+    ) -> tuple[str, tuple]: ...
+
+    def build_search_one2many_multiple(
+        self,
+        ids: list[int],
+        relation_field: str,
+        fields: list[str],
+        limit: int | None = 80,
+        sort: str = "id",
+        order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
+        res_model: str | None = None,
     ) -> tuple[str, tuple]: ...
 
     def build_get_many2many(
@@ -12,6 +12,7 @@ from ..fields import (
     Many2many,
     Many2one,
     One2many,
+    One2one,
 )
 
 
@@ -53,6 +54,7 @@ class RequestBuilder:
         Many2one: "prepare_list_ids",
         PolymorphicMany2one: "prepare_list_ids",
         PolymorphicOne2many: "prepare_list_ids",
+        One2one: "prepare_list_ids",
     }
 
     @property
@@ -48,6 +48,25 @@ class Dialect:
             return f"${index}"
         return "%s"
 
+    def native_placeholders(self, stmt: str) -> str:
+        """
+        Convert %s placeholders to native dialect format.
+
+        Used by builder once per statement shape (before caching),
+        so sessions get ready SQL and do not rewrite it per execute.
+
+        For Postgres: %s, %s -> $1, $2
+        For MySQL/Clickhouse: unchanged
+        """
+        if self.name != "postgres" or "%s" not in stmt:
+            return stmt
+        parts = stmt.split("%s")
+        result = [parts[0]]
+        for i, part in enumerate(parts[1:], 1):
+            result.append(f"${i}")
+            result.append(part)
+        return "".join(result)
+
     def get_no_transaction_session(self):
         """Get appropriate session class for this dialect."""
         if self.name == "postgres":
@@ -87,6 +106,43 @@ CLICKHOUSE = Dialect(
 )
 
 
+# Mapping of SQL types to PostgreSQL array element types
+# (unnest in bulk insert, = ANY(...) in filters)
+PG_ARRAY_TYPE_MAP = {
+    "INTEGER": "int4",
+    "SERIAL": "int4",
+    "BIGINT": "int8",
+    "BIGSERIAL": "int8",
+    "SMALLINT": "int2",
+    "SMALLSERIAL": "int2",
+    "TEXT": "text",
+    "BOOL": "bool",
+    "TIMESTAMPTZ": "timestamptz",
+    "DATE": "date",
+    "TIME": "time",
+    "TIMETZ": "timetz",
+    "DOUBLE PRECISION": "float8",
+    "JSONB": "jsonb",
+    "JSON": "jsonb",
+}
+
+
+def get_pg_array_type(sql_type: str) -> str:
+    """Map SQL type to PostgreSQL array element type."""
+    # Exact match
+    upper = sql_type.upper()
+    if upper in PG_ARRAY_TYPE_MAP:
+        return PG_ARRAY_TYPE_MAP[upper]
+    # VARCHAR(N) -> text
+    if upper.startswith("VARCHAR"):
+        return "text"
+    # DECIMAL(M,N) -> numeric
+    if upper.startswith("DECIMAL"):
+        return "numeric"
+    # Fallback
+    return "text"
+
+
 def get_dialect(name: str) -> Dialect:
     """Get dialect by name."""
     if name == "postgres":
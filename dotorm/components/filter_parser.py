@@ -5,9 +5,14 @@ Converts filter expressions to SQL WHERE clauses.
 Extracted to avoid code duplication in builders.
 """
 
-from typing import Any, Literal, Union
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Literal, Union
 
-from .dialect import Dialect
+from ..builder.cache import StatementCache
+from .dialect import Dialect, get_pg_array_type
+
+if TYPE_CHECKING:
+    from ..fields import Field
 
 
 # Type definitions
@@ -34,6 +39,9 @@ SQLOperator = Literal[
 
 FilterTriplet = tuple[str, SQLOperator, Any]
 
+_IN_OPERATORS = ("in", "not in", "IN", "NOT IN")
+_LIKE_OPERATORS = ("like", "ilike", "=like", "=ilike", "not like", "not ilike")
+
 # Рекурсивный тип для фильтров
 # FilterExpression - список элементов, где каждый элемент это:
 #   - FilterTriplet: ("field", "=", value) - условие
@@ -66,6 +74,11 @@ class FilterParser:
     - Nested logic: [("a", "=", 1), "or", ("b", "=", 2)]
     - Complex nesting with AND/OR
 
+    Postgres: in / not in bind the whole list as one typed array
+    parameter ("id" = ANY($1::int4[])), so SQL does not depend on
+    list length. Array type is taken from field sql_type if fields
+    are given. MySQL/Clickhouse: IN (%s, %s, ...).
+
     Example:
         parser = FilterParser(POSTGRES)
         clause, values = parser.parse([
@@ -77,8 +90,20 @@ class FilterParser:
         # values: (True, "admin", True)
     """
 
-    def __init__(self, dialect: Dialect):
+    def __init__(
+        self,
+        dialect: Dialect,
+        cache_size: int = 512,
+        fields: dict[str, "Field"] | None = None,
+    ):
         self.dialect = dialect
+        self.fields = fields or {}
+        self.use_arrays = dialect.name == "postgres"
+        # shape -> CompiledFilter, repeated filters skip rendering
+        self._templates = StatementCache(cache_size)
+        # key -> (shape, extract), repeated filters skip validation
+        # and shape building (see signature())
+        self._shapes = StatementCache(cache_size)
 
     def _is_triplet(self, expr: Any) -> bool:
         """Check if expression is a simple triplet."""
@@ -88,24 +113,107 @@ class FilterParser:
             and isinstance(expr[0], str)
         )
 
-    def parse(self, filter_expr: FilterExpression) -> tuple[str, tuple]:
-        """Recursively parse filter expression."""
-        escape = self.dialect.escape
-
+    def array_cast(self, field: str) -> str:
+        """Postgres array cast for field ("::int4[]"), empty if unknown."""
+        field_obj = self.fields.get(field)
+        sql_type = getattr(field_obj, "sql_type", None)
+        if not isinstance(sql_type, str):
+            return ""
+        return f"::{get_pg_array_type(sql_type)}[]"
+
+    def signature(self, filter_expr: FilterExpression) -> tuple[tuple, tuple]:
+        """
+        Split filter expression into shape and values.
+
+        Shape keeps fields, operators, nesting and list arity,
+        but not the values. Same shape always gives the same SQL,
+        so it can be used as a cache key for built statements.
+        Values are returned in the same order as in parse().
+
+        Shapes are cached too: a repeated filter is validated and
+        converted to shape once, later calls only build a light key
+        (_key()) and extract values with generated code.
+
+        Example:
+            shape, values = parser.signature([("id", "in", [1, 2])])
+            # MySQL:    shape ("group", (("id", "in", 2),)), values (1, 2)
+            # Postgres: shape ("group", (("id", "in", "array"),)),
+            #           values ([1, 2],)
+        """
+        if self._shapes.maxsize > 0:
+            raw: list[Any] = []
+            key = self._key(filter_expr, raw)
+            if key is not None:
+                cached = self._shapes.get(key)
+                if cached is not None:
+                    shape, extract = cached
+                    return shape, extract(raw)
+                shape, values = self._walk(filter_expr)
+                self._shapes.put(key, (shape, _make_extractor(shape)))
+                return shape, values
+        return self._walk(filter_expr)
+
+    def _walk(self, filter_expr: FilterExpression) -> tuple[tuple, tuple]:
+        """Validate expression, build shape and values (uncached)."""
+        values: list[Any] = []
+        shape = self._signature(filter_expr, values)
+        return shape, tuple(values)
+
+    def _key(self, filter_expr: Any, raw: list[Any]) -> tuple | None:
+        """
+        Cache key of expression, appends raw triplet values in place.
+
+        Cheaper than _signature(): no validation, no lowercasing and
+        no per-operator handling. Key keeps everything the shape
+        depends on: fields and operators as given, nesting, None
+        values and length of list values (not of Postgres in-lists).
+        None - unsupported element, expression goes through _walk()
+        (which raises).
+        """
+        if isinstance(filter_expr, (list, tuple)):
+            size = len(filter_expr)
+            if size == 2 and filter_expr[0] == "not":
+                inner = self._key(filter_expr[1], raw)
+                return None if inner is None else ("not", inner)
+            if size == 3 and isinstance(filter_expr[0], str):
+                field, op, value = filter_expr
+                if not isinstance(op, str):
+                    return None
+                raw.append(value)
+                if value is None:
+                    return (field, op, None)
+                if isinstance(value, (list, tuple)):
+                    # Postgres binds in-list as one array: any length
+                    if self.use_arrays and op in _IN_OPERATORS:
+                        return (field, op, "array")
+                    return (field, op, len(value))
+                return (field, op, -1)
+        if not isinstance(filter_expr, list):
+            return None
+        items: list[Any] = []
+        for item in filter_expr:
+            if isinstance(item, str):
+                items.append(item)
+                continue
+            key = self._key(item, raw)
+            if key is None:
+                return None
+            items.append(key)
+        return tuple(items)
+
+    def _signature(self, filter_expr: Any, values: list[Any]) -> tuple:
+        """Recursive part of signature(), appends values in place."""
         # NOT expression: ("not", expr)
         if (
             isinstance(filter_expr, (list, tuple))
             and len(filter_expr) == 2
             and filter_expr[0] == "not"
         ):
-            inner_expr = filter_expr[1]
-            clause, values = self.parse(inner_expr)  # type: ignore
-            return f"NOT ({clause})", values
+            return ("not", self._signature(filter_expr[1], values))
 
         # Simple triplet: ("field", "op", value)
         if self._is_triplet(filter_expr):
             field, op, value = filter_expr
-            field = f"{escape}{field}{escape}"
             assert isinstance(op, str)
             op = op.lower()
 
@@ -114,103 +222,210 @@ class FilterParser:
                     raise ValueError(
                         f"Operator '{op}' requires list/tuple value"
                     )
-                placeholders = ", ".join(["%s"] * len(value))
-                clause = f"{field} {op.upper()} ({placeholders})"
-                return clause, tuple(value)
-
-            elif op in (
-                "like",
-                "ilike",
-                "=like",
-                "=ilike",
-                "not like",
-                "not ilike",
-            ):
-                clause = f"{field} {op.upper()} %s"
-                return clause, ("%" + str(value) + "%",)
+                if self.use_arrays:
+                    values.append(list(value))
+                    return (field, op, "array")
+                values.extend(value)
+                return (field, op, len(value))
+
+            elif op in _LIKE_OPERATORS:
+                values.append("%" + str(value) + "%")
+                return (field, op, 1)
 
             elif op in ("=", "!=", ">", "<", ">=", "<="):
-                # None -> IS NULL / IS NOT NULL
                 if value is None:
-                    if op == "=":
-                        return f"{field} IS NULL", ()
-                    elif op == "!=":
-                        return f"{field} IS NOT NULL", ()
-                    else:
+                    if op not in ("=", "!="):
                         raise ValueError(
                             f"Operator '{op}' cannot be used with None"
                         )
-                # != с значением должен включать NULL строки
-                # В SQL: NULL != 1 возвращает NULL (не TRUE)
-                # Поэтому добавляем OR IS NULL
-                # if op == "!=":
-                #     clause = f"({field} IS NULL OR {field} != %s)"
-                #     return clause, (value,)
-                clause = f"{field} {op} %s"
-                return clause, (value,)
-
-            elif op == "is null":
-                return f"{field} IS NULL", ()
+                    return (field, op, None)
+                values.append(value)
+                return (field, op, 1)
 
-            elif op == "is not null":
-                return f"{field} IS NOT NULL", ()
+            elif op in ("is null", "is not null"):
+                return (field, op, 0)
 
             elif op in ("between", "not between"):
                 if not isinstance(value, (list, tuple)) or len(value) != 2:
                     raise ValueError(
                         f"Operator '{op}' requires list of two values"
                     )
-                clause = f"{field} {op.upper()} %s AND %s"
-                return clause, (value[0], value[1])
+                values.append(value[0])
+                values.append(value[1])
+                return (field, op, 2)
 
             else:
                 raise ValueError(f"Unsupported operator: {op}")
 
         # Nested expression: list with possible AND/OR
         elif isinstance(filter_expr, list):
-            parts: list[tuple[str, str, bool]] = []
-            values: list[Any] = []
-
-            i = 0
-            while i < len(filter_expr):
-                item = filter_expr[i]
-
+            items: list[tuple] = []
+            for i, item in enumerate(filter_expr):
                 if isinstance(item, (list, tuple)):
-                    clause, clause_values = self.parse(item)  # type: ignore
-                    wrap = not self._is_triplet(item)
-                    parts.append(("EXPR", clause, wrap))
-                    values.extend(clause_values)
-                    i += 1
-
+                    items.append(self._signature(item, values))
                 elif isinstance(item, str) and item.lower() in ("and", "or"):
-                    parts.append(("OP", item.upper(), False))
-                    i += 1
-
+                    items.append(("op", item.upper()))
                 else:
                     raise ValueError(
                         f"Invalid filter element at position {i}: {item}"
                     )
+            return ("group", tuple(items))
+
+        else:
+            raise ValueError("Unsupported filter expression format")
 
+    def compile(
+        self, filter_expr: FilterExpression
+    ) -> tuple["CompiledFilter", tuple]:
+        """
+        Compile filter expression into reusable template and values.
+
+        Template is rendered once per filter shape and cached,
+        repeated filters only extract values (see signature()).
+
+        Example:
+            compiled, values = parser.compile([("active", "=", True)])
+            compiled.clause  # '"active" = %s'
+            values           # (True,)
+        """
+        shape, values = self.signature(filter_expr)
+        return self.template(shape), values
+
+    def template(self, shape: tuple) -> "CompiledFilter":
+        """Get compiled template for filter shape (render on miss)."""
+        compiled = self._templates.get(shape)
+        if compiled is None:
+            compiled = CompiledFilter(shape, self._render(shape))
+            self._templates.put(shape, compiled)
+        return compiled
+
+    def parse(self, filter_expr: FilterExpression) -> tuple[str, tuple]:
+        """Parse filter expression into WHERE clause and values."""
+        compiled, values = self.compile(filter_expr)
+        return compiled.clause, values
+
+    def _render(self, shape: tuple) -> str:
+        """Recursively render SQL clause from filter shape."""
+        # Triplet: (field, op, arity)
+        if len(shape) == 3:
+            return self._render_triplet(*shape)
+
+        kind, inner = shape
+
+        # NOT expression: ("not", shape)
+        if kind == "not":
+            return f"NOT ({self._render(inner)})"
+
+        # Nested expression: ("group", (shape | ("op", "AND"/"OR"), ...))
+        sql_parts: list[str] = []
+        prev_expr = False
+        for item in inner:
+            if item[0] == "op" and isinstance(item[1], str):
+                sql_parts.append(item[1])
+                prev_expr = False
+                continue
             # Auto-insert AND between consecutive expressions
-            normalized: list[tuple[str, str, bool]] = []
-            for idx, part in enumerate(parts):
-                if (
-                    idx > 0
-                    and part[0] == "EXPR"
-                    and parts[idx - 1][0] == "EXPR"
-                ):
-                    normalized.append(("OP", "AND", False))
-                normalized.append(part)
-
-            sql_parts: list[str] = []
-            for part in normalized:
-                kind, content, wrap = part
-                if kind == "EXPR":
-                    sql_parts.append(f"({content})" if wrap else content)
-                elif kind == "OP":
-                    sql_parts.append(content)
-
-            return " ".join(sql_parts), tuple(values)
+            if prev_expr:
+                sql_parts.append("AND")
+            clause = self._render(item)
+            # triplets are not wrapped, groups and NOT are
+            sql_parts.append(clause if len(item) == 3 else f"({clause})")
+            prev_expr = True
+
+        return " ".join(sql_parts)
+
+    def _render_triplet(
+        self, field: str, op: str, arity: int | str | None
+    ) -> str:
+        """Render single condition. Operator is already validated."""
+        escape = self.dialect.escape
+        name = field
+        field = f"{escape}{field}{escape}"
+
+        if arity == "array":
+            cast = self.array_cast(name)
+            if op == "in":
+                return f"{field} = ANY(%s{cast})"
+            return f"{field} <> ALL(%s{cast})"
+
+        if op in ("in", "not in"):
+            placeholders = ", ".join(["%s"] * arity)  # type: ignore
+            return f"{field} {op.upper()} ({placeholders})"
+
+        if op in ("=", "!=", ">", "<", ">=", "<="):
+            # None -> IS NULL / IS NOT NULL
+            if arity is None:
+                return (
+                    f"{field} IS NULL" if op == "=" else f"{field} IS NOT NULL"
+                )
+            # != с значением должен включать NULL строки
+            # В SQL: NULL != 1 возвращает NULL (не TRUE)
+            # Поэтому добавляем OR IS NULL
+            # if op == "!=":
+            #     return f"({field} IS NULL OR {field} != %s)"
+            return f"{field} {op} %s"
+
+        if op == "is null":
+            return f"{field} IS NULL"
+
+        if op == "is not null":
+            return f"{field} IS NOT NULL"
+
+        if op in ("between", "not between"):
+            return f"{field} {op.upper()} %s AND %s"
+
+        # like, ilike, =like, =ilike, not like, not ilike
+        return f"{field} {op.upper()} %s"
+
+
+def _make_extractor(shape: tuple) -> Callable[[list[Any]], tuple]:
+    """
+    Generate function: raw triplet values (see _key()) -> query values.
 
+    Same values as _signature() gives for the shape, e.g. for
+    ("group", (("a", "=", 1), ("b", "ilike", 1))):
+        def extract(v):
+            return (v[0], "%" + str(v[1]) + "%",)
+    """
+    triplets: list[tuple] = []
+
+    def collect(node: tuple) -> None:
+        if len(node) == 3:
+            triplets.append(node)
+        elif node[0] == "not":
+            collect(node[1])
+        elif node[0] == "group":
+            for item in node[1]:
+                collect(item)
+
+    collect(shape)
+    parts = []
+    for i, (_, op, arity) in enumerate(triplets):
+        value = f"v[{i}]"
+        if arity is None or arity == 0:
+            continue
+        if arity == "array":
+            parts.append(f"list({value})")
+        elif op in _LIKE_OPERATORS:
+            parts.append(f'"%" + str({value}) + "%"')
+        elif op in ("in", "not in", "between", "not between"):
+            parts.append(f"*{value}")
         else:
-            raise ValueError("Unsupported filter expression format")
+            parts.append(value)
+    body = f"({', '.join(parts)},)" if parts else "()"
+    namespace: dict[str, Any] = {}
+    exec(f"def extract(v):\n    return {body}\n", namespace)
+    return namespace["extract"]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFilter:
+    """
+    Compiled filter template.
+
+    shape -- filter shape without values (cache key)
+    clause -- WHERE clause with %s placeholders
+    """
+
+    shape: tuple
+    clause: str
@@ -2,7 +2,14 @@
 
 from .pool import PoolAbstract
 from .session import SessionAbstract
-from .dialect import Dialect, PostgresDialect, MySQLDialect, ClickHouseDialect, CursorType
+from .dialect import (
+    Dialect,
+    PostgresDialect,
+    MySQLDialect,
+    ClickHouseDialect,
+    CursorType,
+    RawRows,
+)
 from .types import (
     ContainerSettings,
     PostgresPoolSettings,
@@ -18,6 +25,7 @@ __all__ = [
     "MySQLDialect",
     "ClickHouseDialect",
     "CursorType",
+    "RawRows",
     "ContainerSettings",
     "PostgresPoolSettings",
     "MysqlPoolSettings",
@@ -1,7 +1,7 @@
 """Database dialect abstraction (Strategy pattern)."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Literal
+from typing import Any, Literal, NamedTuple
 
 
 # Unified cursor types for all dialects
@@ -13,9 +13,29 @@ CursorType = Literal[
     "executemany",
     "lastrowid",  # MySQL-specific
     "void",  # Execute without returning results
+    "fetchraw",  # Driver rows as is + column names (RawRows)
 ]
 
 
+class RawRows(NamedTuple):
+    """
+    Result of cursor="fetchraw": driver rows without per-row copy.
+
+    rows -- asyncpg Records (Postgres) or tuples (MySQL, ClickHouse),
+        values in order of columns
+    columns -- column names (empty if driver gives no description
+        and there are no rows)
+
+    Example:
+        columns, rows = await session.execute(stmt, values, cursor="fetchraw")
+        for row in rows:
+            row[0]  # by position (all drivers)
+    """
+
+    columns: tuple[str, ...]
+    rows: list
+
+
 class Dialect(ABC):
     """
     Abstract dialect defining database-specific behavior.
@@ -50,10 +70,15 @@ class PostgresDialect(Dialect):
         "fetch": "fetch",
         "fetchrow": "fetchrow",
         "fetchval": "fetchval",
+        "fetchraw": "fetch",
     }
 
     def convert_placeholders(self, stmt: str) -> str:
-        """Convert %s to $1, $2, $3... in a single pass."""
+        """Convert %s to $1, $2, $3... in a single pass.
+
+        Statements from Builder already use $N and return as is,
+        conversion is kept for hand-written SQL.
+        """
         if "%s" not in stmt:
             return stmt
         parts = stmt.split("%s")
@@ -65,7 +90,7 @@ class PostgresDialect(Dialect):
 
     def convert_result(self, rows: Any, cursor: CursorType) -> Any:
         """Convert asyncpg Record objects to dicts."""
-        if rows is None or cursor in ("void", "executemany"):
+        if rows is None or cursor in ("void", "executemany", "fetchraw"):
             return rows
 
         if cursor == "fetchval":
@@ -86,11 +111,17 @@ class MySQLDialect(Dialect):
         "fetch": "fetchall",
         "fetchrow": "fetchone",
         "fetchval": "fetchone",
+        "fetchraw": "fetchall",
     }
 
     def convert_result(self, rows: Any, cursor: CursorType) -> Any:
         """Convert MySQL results."""
-        if rows is None or cursor in ("void", "executemany", "lastrowid"):
+        if rows is None or cursor in (
+            "void",
+            "executemany",
+            "lastrowid",
+            "fetchraw",
+        ):
             return rows
 
         if cursor == "fetchval":
@@ -114,11 +145,12 @@ class ClickHouseDialect(Dialect):
         "fetch": "fetchall",
         "fetchrow": "fetchone",
         "fetchval": "fetchone",
+        "fetchraw": "fetchall",
     }
 
     def convert_result(self, rows: Any, cursor: CursorType) -> Any:
         """Convert ClickHouse results to dicts."""
-        if rows is None or cursor in ("void", "executemany"):
+        if rows is None or cursor in ("void", "executemany", "fetchraw"):
             return rows
 
         if cursor == "fetchval":
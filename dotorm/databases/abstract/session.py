@@ -23,6 +23,7 @@ class SessionAbstract(ABC):
         *,
         prepare: Callable | None = None,
         cursor: "CursorType" = "fetchall",
+        prepared: bool = False,
     ) -> Any:
         """
         Execute SQL query.
@@ -40,6 +41,11 @@ class SessionAbstract(ABC):
                 - "executemany": Execute multiple inserts
                 - "lastrowid": Return last inserted row ID (MySQL only)
                 - "void": Execute without returning rows (INSERT/UPDATE/DELETE)
+                - "fetchraw": Return RawRows(columns, rows) with driver rows
+                  as is (asyncpg Records / tuples), no per-row dict copy
+            prepared: Hint for hot queries - execute through explicitly
+                prepared statement cached per connection (Postgres).
+                Other dialects ignore it.
 
         Returns:
             Query results based on cursor mode
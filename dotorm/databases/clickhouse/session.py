@@ -3,7 +3,7 @@
 from typing import Any, Callable, TYPE_CHECKING
 
 from ..abstract.session import SessionAbstract
-from ..abstract.dialect import ClickHouseDialect, CursorType
+from ..abstract.dialect import ClickHouseDialect, CursorType, RawRows
 
 
 if TYPE_CHECKING:
@@ -59,7 +59,12 @@ class ClickhouseSession(SessionAbstract):
         method_name = _dialect.get_cursor_method(cursor_type)
         if method_name:
             method = getattr(cursor, method_name)
-            return await method()
+            result = await method()
+            # raw - tuple rows + column names from cursor description
+            if cursor_type == "fetchraw":
+                columns = tuple(col[0] for col in cursor.description or ())
+                return RawRows(columns, list(result or ()))
+            return result
         return None
 
 
@@ -87,6 +92,7 @@ class NoTransactionSession(ClickhouseSession):
         *,
         prepare: Callable | None = None,
         cursor: CursorType = "fetchall",
+        prepared: bool = False,
     ) -> Any:
         stmt = _dialect.convert_placeholders(stmt)
 
@@ -3,7 +3,7 @@
 from typing import Any, Callable, TYPE_CHECKING
 
 from ..abstract.session import SessionAbstract
-from ..abstract.dialect import MySQLDialect, CursorType
+from ..abstract.dialect import MySQLDialect, CursorType, RawRows
 
 
 if TYPE_CHECKING:
@@ -59,7 +59,13 @@ class MysqlSession(SessionAbstract):
 
         # fetch operations
         method = getattr(cursor, _dialect.get_cursor_method(cursor_type))
-        return await method()
+        result = await method()
+
+        # raw - tuple rows + column names from cursor description
+        if cursor_type == "fetchraw":
+            columns = tuple(col[0] for col in cursor.description or ())
+            return RawRows(columns, list(result or ()))
+        return result
 
 
 class TransactionSession(MysqlSession):
@@ -81,8 +87,16 @@ class TransactionSession(MysqlSession):
         *,
         prepare: Callable | None = None,
         cursor: CursorType = "fetchall",
+        prepared: bool = False,
     ) -> Any:
         stmt = _dialect.convert_placeholders(stmt)
+        if cursor == "fetchraw":
+            # transaction cursor is DictCursor, raw mode needs tuples
+            import aiomysql
+
+            async with self.connection.cursor(aiomysql.Cursor) as cur:
+                return await self._do_execute(cur, stmt, values, cursor)
+
         result = await self._do_execute(self.cursor, stmt, values, cursor)
         result = _dialect.convert_result(result, cursor)
 
@@ -113,13 +127,19 @@ class NoTransactionSession(MysqlSession):
         *,
         prepare: Callable | None = None,
         cursor: CursorType = "fetchall",
+        prepared: bool = False,
     ) -> Any:
         import aiomysql
         
         stmt = _dialect.convert_placeholders(stmt)
 
+        # raw mode reads plain tuples, without dict per row
+        cursor_class = (
+            aiomysql.Cursor if cursor == "fetchraw" else aiomysql.DictCursor
+        )
+
         async with self.pool.acquire() as conn:
-            async with conn.cursor(aiomysql.DictCursor) as cur:
+            async with conn.cursor(cursor_class) as cur:
                 result = await self._do_execute(cur, stmt, values, cursor)
                 result = _dialect.convert_result(result, cursor)
 
@@ -1,5 +1,6 @@
 """PostgreSQL database support."""
 
+from .codecs import JsonCodecs
 from .pool import ContainerPostgres
 from .session import (
     PostgresSession,
@@ -12,6 +13,7 @@ from ..abstract.dialect import CursorType, PostgresDialect
 
 __all__ = [
     "ContainerPostgres",
+    "JsonCodecs",
     "PostgresSession",
     "TransactionSession",
     "NoTransactionSession",
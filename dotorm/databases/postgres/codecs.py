@@ -0,0 +1,146 @@
+"""JSON/JSONB type codecs for asyncpg connections."""
+
+import json
+from contextvars import ContextVar
+from typing import Any, Callable
+from weakref import WeakSet
+
+try:
+    import asyncpg
+except ImportError:
+    ...
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# JSON колонки результата, который сейчас разбирает prepare функция,
+# уже декодированы драйвером (см. JsonCodecs.prepare)
+_decoded: ContextVar[bool] = ContextVar("json_decoded", default=False)
+
+
+def _default_loads() -> Callable[[str | bytes], Any]:
+    """orjson.loads если установлен, иначе json.loads."""
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
+
+
+def _default_dumps() -> Callable[[Any], str]:
+    """orjson.dumps (bytes -> str) если установлен, иначе json.dumps."""
+    if orjson is not None:
+        return lambda value: orjson.dumps(value).decode()
+    return lambda value: json.dumps(value, ensure_ascii=False)
+
+
+class JsonCodecs:
+    """
+    Decode json/jsonb columns in the driver instead of DotModel.__init__.
+
+    Installed once per connection (init= of asyncpg pool), after that
+    JSON columns come from asyncpg already decoded and models with
+    JSONField stay on the fast path of prepare_list_ids.
+
+    Installation is tracked per connection: sessions pass rows
+    to prepare functions through JsonCodecs.prepare(), so rows of
+    connections without codecs (pool without init=) are still
+    decoded by DotModel.__init__.
+
+    Decoder is pluggable, by default orjson (if installed) or json.
+    Encoder passes str as is: ORM already serializes JSONField to
+    JSON text before write (get_json(only_store=True)).
+    Codecs use binary format, so COPY (create_bulk(method="copy"))
+    works for models with JSON columns.
+
+    Example:
+        JsonCodecs.loads = orjson.loads
+        pool = await asyncpg.create_pool(..., init=JsonCodecs.init)
+        async with pool.acquire() as conn:
+            JsonCodecs.installed_on(conn)  # True
+    """
+
+    # gets bytes (binary format), json.loads and orjson.loads accept them
+    loads: Callable[[str | bytes], Any] = staticmethod(_default_loads())
+    dumps: Callable[[Any], str] = staticmethod(_default_dumps())
+    # соединения с установленными кодеками
+    # weak: закрытые соединения пула удаляются сами
+    _connections: "WeakSet[Any]" = WeakSet()
+
+    @classmethod
+    def encode(cls, value: Any) -> str:
+        """Уже сериализованный JSON (str) отдаётся как есть."""
+        if isinstance(value, str):
+            return value
+        return cls.dumps(value)
+
+    @classmethod
+    def decode(cls, value: str | bytes) -> Any:
+        return cls.loads(value)
+
+    # Binary format: json - UTF-8 text, jsonb - version byte 1 + text.
+    # Binary codecs are required by COPY (copy_records_to_table),
+    # and the driver skips text decoding of the column.
+
+    @classmethod
+    def encode_json(cls, value: Any) -> bytes:
+        return cls.encode(value).encode()
+
+    @classmethod
+    def encode_jsonb(cls, value: Any) -> bytes:
+        return b"\x01" + cls.encode(value).encode()
+
+    @classmethod
+    def decode_jsonb(cls, data: bytes) -> Any:
+        if data[:1] != b"\x01":
+            raise ValueError(f"Unsupported jsonb format version: {data[:1]!r}")
+        return cls.loads(data[1:])
+
+    @classmethod
+    async def init(cls, conn: "asyncpg.Connection") -> None:
+        """Install codecs on connection (asyncpg pool init= hook)."""
+        codecs = (
+            ("json", cls.encode_json, cls.decode),
+            ("jsonb", cls.encode_jsonb, cls.decode_jsonb),
+        )
+        for typename, encoder, decoder in codecs:
+            await conn.set_type_codec(
+                typename,
+                encoder=encoder,
+                decoder=decoder,
+                schema="pg_catalog",
+                format="binary",
+            )
+        cls._connections.add(conn)
+
+    @classmethod
+    def installed_on(cls, conn: "asyncpg.Connection") -> bool:
+        """Codecs are installed on connection (init was called)."""
+        # pool.acquire() returns proxy, codecs are on real connection
+        conn = getattr(conn, "_con", None) or conn
+        return conn in cls._connections
+
+    @classmethod
+    def prepare(
+        cls,
+        conn: "asyncpg.Connection",
+        prepare: Callable[[Any], Any],
+        rows: Any,
+    ) -> Any:
+        """
+        Call prepare function with rows fetched on conn.
+
+        While prepare runs, decoded() tells whether JSON columns
+        of rows are already decoded by the driver.
+        """
+        token = _decoded.set(cls.installed_on(conn))
+        try:
+            return prepare(rows)
+        finally:
+            _decoded.reset(token)
+
+    @staticmethod
+    def decoded() -> bool:
+        """JSON columns of rows in current prepare() are decoded."""
+        return _decoded.get()
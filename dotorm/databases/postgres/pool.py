@@ -9,6 +9,7 @@ try:
 except ImportError:
     ...
 
+from .codecs import JsonCodecs
 from .transaction import ContainerTransaction
 from ..abstract.types import ContainerSettings, PostgresPoolSettings
 from .session import NoTransactionNoPoolSession
@@ -43,6 +44,8 @@ class ContainerPostgres:
                 min_size=5,
                 max_size=15,
                 command_timeout=60,
+                # json/jsonb decoded by driver, not in DotModel.__init__
+                init=JsonCodecs.init,
                 # 15 minutes
                 # max_inactive_connection_lifetime
                 # pool_recycle=60 * 15,
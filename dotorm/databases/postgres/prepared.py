@@ -0,0 +1,160 @@
+"""Per-connection prepared statements for hot queries."""
+
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+try:
+    import asyncpg
+except ImportError:
+    ...
+
+if TYPE_CHECKING:
+    from asyncpg.prepared_stmt import PreparedStatement
+
+    from ..abstract.dialect import CursorType
+
+
+log = logging.getLogger("dotorm")
+
+
+# Cursor -> PreparedStatement method
+_PREPARED_METHODS = {
+    "fetchall": "fetch",
+    "fetch": "fetch",
+    "fetchrow": "fetchrow",
+    "fetchval": "fetchval",
+    "fetchraw": "fetch",
+}
+
+
+class PreparedStatements:
+    """
+    LRU of prepared statements for every pooled connection.
+
+    Hot queries (get, search shapes, relation loaders) are prepared
+    once per connection with conn.prepare() and then executed
+    without parse/plan on the server. Key is the SQL text, so
+    statements from Builder (cached by shape) are reused as is.
+
+    Statements become invalid after schema changes (ALTER TABLE,
+    type change), in this case statement is dropped and prepared
+    again. Inside transaction asyncpg forbids retry, error is raised
+    and the statement is prepared on the next call.
+
+    Disabled by default (maxsize = 0): queries run through asyncpg
+    as usual. Enable only with direct connections to PostgreSQL or
+    pgbouncer in session mode - in transaction pooling mode (and with
+    statement_cache_size=0 pools) named statements prepared on one
+    server connection do not exist on another one.
+
+    Example:
+        # on startup, before the first query
+        PreparedStatements.maxsize = 256
+        rows = await PreparedStatements.execute(conn, stmt, values, "fetch")
+        PreparedStatements.info()
+        # {"hits": 120, "misses": 4, "connections": 5, "maxsize": 256}
+    """
+
+    # max prepared statements per connection (0 = disabled, opt-in)
+    maxsize: int = 0
+    hits: int = 0
+    misses: int = 0
+
+    # connection -> OrderedDict[stmt, PreparedStatement]
+    # weak: statements are dropped together with closed connection
+    _cache: "WeakKeyDictionary[Any, OrderedDict[str, PreparedStatement]]" = (
+        WeakKeyDictionary()
+    )
+
+    @classmethod
+    def supports(cls, cursor: "CursorType") -> bool:
+        """Only fetch cursors go through prepared statements."""
+        return cls.maxsize > 0 and cursor in _PREPARED_METHODS
+
+    @classmethod
+    async def get(
+        cls, conn: "asyncpg.Connection", stmt: str
+    ) -> "PreparedStatement":
+        """Get prepared statement for connection (prepare on miss)."""
+        # pool.acquire() returns proxy, cache on real connection
+        conn = getattr(conn, "_con", None) or conn
+        statements = cls._cache.get(conn)
+        if statements is None:
+            statements = cls._cache[conn] = OrderedDict()
+
+        prepared = statements.get(stmt)
+        if prepared is not None:
+            cls.hits += 1
+            statements.move_to_end(stmt)
+            return prepared
+
+        cls.misses += 1
+        prepared = await conn.prepare(stmt)
+        statements[stmt] = prepared
+        if len(statements) > cls.maxsize:
+            statements.popitem(last=False)
+        return prepared
+
+    @classmethod
+    def discard(cls, conn: "asyncpg.Connection", stmt: str) -> None:
+        """Drop statement for connection (after invalidation)."""
+        conn = getattr(conn, "_con", None) or conn
+        statements = cls._cache.get(conn)
+        if statements is not None:
+            statements.pop(stmt, None)
+
+    @classmethod
+    async def execute(
+        cls,
+        conn: "asyncpg.Connection",
+        stmt: str,
+        values: Any,
+        cursor: "CursorType",
+    ) -> Any:
+        """
+        Execute query through prepared statement.
+
+        Args:
+            conn: asyncpg connection
+            stmt: SQL with $1, $2... placeholders
+            values: Query values
+            cursor: fetchall/fetch/fetchrow/fetchval/fetchraw
+
+        Returns:
+            Raw result from asyncpg
+        """
+        method = _PREPARED_METHODS[cursor]
+        args = values or ()
+        prepared = await cls.get(conn, stmt)
+        try:
+            return await getattr(prepared, method)(*args)
+        except (
+            asyncpg.InvalidCachedStatementError,
+            asyncpg.OutdatedSchemaCacheError,
+        ):
+            # Schema changed, plan/result types are stale
+            cls.discard(conn, stmt)
+            if conn.is_in_transaction():
+                raise
+            log.debug("Re-preparing statement after schema change: %s", stmt)
+            prepared = await cls.get(conn, stmt)
+            return await getattr(prepared, method)(*args)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all statements and reset counters."""
+        cls._cache.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def info(cls) -> dict[str, int]:
+        """Hit/miss counters for monitoring."""
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "connections": len(cls._cache),
+            "maxsize": cls.maxsize,
+        }
@@ -4,7 +4,9 @@ from typing import Any, Callable, TYPE_CHECKING
 
 from ..abstract.types import PostgresPoolSettings
 from ..abstract.session import SessionAbstract
-from ..abstract.dialect import PostgresDialect, CursorType
+from ..abstract.dialect import PostgresDialect, CursorType, RawRows
+from .codecs import JsonCodecs
+from .prepared import PreparedStatements
 
 
 if TYPE_CHECKING:
@@ -25,6 +27,7 @@ class PostgresSession(SessionAbstract):
         stmt: str,
         values: Any,
         cursor: CursorType,
+        prepared: bool = False,
     ) -> Any:
         """
         Execute query on connection (shared logic).
@@ -34,10 +37,20 @@ class PostgresSession(SessionAbstract):
             stmt: SQL with $1, $2... placeholders (already converted)
             values: Query values
             cursor: Cursor type
+            prepared: Use per-connection prepared statement
+                (see PreparedStatements), only for fetch cursors
 
         Returns:
             Raw result from asyncpg
         """
+        if prepared and PreparedStatements.supports(cursor):
+            result = await PreparedStatements.execute(
+                conn, stmt, values, cursor
+            )
+            if cursor == "fetchraw":
+                return PostgresSession._raw_rows(result)
+            return result
+
         # executemany
         if cursor == "executemany":
             if not values:
@@ -50,8 +63,8 @@ class PostgresSession(SessionAbstract):
                 and isinstance(values[0][0], (list, tuple))
                 else values
             )
-            for row in rows:
-                await conn.execute(stmt, *row)
+            # pipelined: one round trip for all rows
+            await conn.executemany(stmt, rows)
             return None
 
         # void - execute only (INSERT/UPDATE/DELETE without return)
@@ -65,8 +78,41 @@ class PostgresSession(SessionAbstract):
         # fetch operations
         method = getattr(conn, _dialect.get_cursor_method(cursor))
         if values:
-            return await method(stmt, *values)
-        return await method(stmt)
+            result = await method(stmt, *values)
+        else:
+            result = await method(stmt)
+
+        # raw - Records as is, no dict() copy
+        if cursor == "fetchraw":
+            return PostgresSession._raw_rows(result)
+        return result
+
+    @staticmethod
+    async def _do_copy(
+        conn: "asyncpg.Connection",
+        table: str,
+        columns: list[str],
+        records: list[tuple],
+        chunk_size: int,
+    ) -> None:
+        """
+        COPY rows into table (binary protocol), chunk_size rows per COPY.
+
+        No SQL parsing and planning per row, values are encoded
+        by asyncpg codecs of column types.
+        """
+        for start in range(0, len(records), chunk_size):
+            await conn.copy_records_to_table(
+                table,
+                records=records[start : start + chunk_size],
+                columns=columns,
+            )
+
+    @staticmethod
+    def _raw_rows(records: list) -> RawRows:
+        """Wrap asyncpg Records into RawRows (no copy)."""
+        columns = tuple(records[0].keys()) if records else ()
+        return RawRows(columns, records)
 
 
 class TransactionSession(PostgresSession):
@@ -88,20 +134,37 @@ class TransactionSession(PostgresSession):
         *,
         prepare: Callable | None = None,
         cursor: CursorType = "fetchall",
+        prepared: bool = False,
     ) -> Any:
+        # Builder emits native $N placeholders, only hand-written
+        # %s SQL is rewritten here (no-op check otherwise)
         stmt = _dialect.convert_placeholders(stmt)
-        result = await self._do_execute(self.connection, stmt, values, cursor)
+        result = await self._do_execute(
+            self.connection, stmt, values, cursor, prepared
+        )
 
         # Fast path: skip dict() conversion for fetch + prepare
         if prepare and result and cursor in ("fetchall", "fetch"):
-            return prepare(result)
+            return JsonCodecs.prepare(self.connection, prepare, result)
 
         result = _dialect.convert_result(result, cursor)
 
         if prepare and result:
-            return prepare(result)
+            return JsonCodecs.prepare(self.connection, prepare, result)
         return result
 
+    async def copy_records(
+        self,
+        table: str,
+        columns: list[str],
+        records: list[tuple],
+        chunk_size: int = 10000,
+    ) -> None:
+        """COPY rows on transaction connection (see _do_copy)."""
+        await self._do_copy(
+            self.connection, table, columns, records, chunk_size
+        )
+
 
 class NoTransactionSession(PostgresSession):
     """
@@ -125,24 +188,46 @@ class NoTransactionSession(PostgresSession):
         *,
         prepare: Callable | None = None,
         cursor: CursorType = "fetchall",
+        prepared: bool = False,
     ) -> Any:
+        # Builder emits native $N placeholders, only hand-written
+        # %s SQL is rewritten here (no-op check otherwise)
         stmt = _dialect.convert_placeholders(stmt)
 
         async with self.pool.acquire() as conn:
-            result = await self._do_execute(conn, stmt, values, cursor)
+            result = await self._do_execute(
+                conn, stmt, values, cursor, prepared
+            )
 
             # Fast path: when prepare callback is provided for fetch results,
             # skip dict() conversion — asyncpg Records support ** unpacking,
             # so prepare_list_ids(records) works directly.
             if prepare and result and cursor in ("fetchall", "fetch"):
-                return prepare(result)
+                return JsonCodecs.prepare(conn, prepare, result)
 
             result = _dialect.convert_result(result, cursor)
 
             if prepare and result:
-                return prepare(result)
+                return JsonCodecs.prepare(conn, prepare, result)
             return result
 
+    async def copy_records(
+        self,
+        table: str,
+        columns: list[str],
+        records: list[tuple],
+        chunk_size: int = 10000,
+    ) -> None:
+        """
+        COPY rows on one pool connection (see _do_copy).
+
+        All chunks run in one transaction: either all rows
+        are inserted or none.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await self._do_copy(conn, table, columns, records, chunk_size)
+
 
 class NoTransactionNoPoolSession(PostgresSession):
     """
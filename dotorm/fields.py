@@ -73,6 +73,8 @@ class Field[FieldType]:
     relation: bool = False
     relation_table_field: str | None = None
     _relation_table: Type["DotModel"] | None = None
+    # имя атрибута в модели (__set_name__)
+    _field_name: str | None = None
 
     def __init__(self, **kwargs: Any) -> None:
         # schema_required - переопределяет обязательность в API схеме
@@ -116,6 +118,25 @@ class Field[FieldType]:
     def __new__(cls, *args: Any, **kwargs: Any) -> FieldType:
         return super().__new__(cls)
 
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._field_name = name
+
+    def __get__(self, instance: "DotModel | None", owner: type | None = None):
+        """
+        Non-data descriptor: значение из __dict__ экземпляра имеет приоритет.
+
+        Не заданное поле возвращает сам Field (как обычный атрибут класса).
+        Вычисляемое поле (compute, store=False) считается при первом
+        чтении и кэшируется в __dict__ экземпляра, сброс кэша при
+        изменении полей из @depends (см. DotModel._compute_invalidation).
+        """
+        if instance is None or self.compute is None or self.store:
+            return self
+        value = self.compute(instance)
+        if self._field_name is not None:
+            instance.__dict__[self._field_name] = value
+        return value
+
     def validation(self):
         if not self.indexable and (self.unique or self.index):
             raise OrmConfigurationFieldException(
@@ -3,6 +3,7 @@
 from abc import ABCMeta
 import asyncio
 from enum import IntEnum
+from functools import partial
 import json
 from types import UnionType
 from typing import (
@@ -36,6 +37,7 @@ if TYPE_CHECKING:
 from .databases.postgres.session import (
     NoTransactionSession as PostgresNoTransactionSession,
 )
+from .databases.postgres.codecs import JsonCodecs
 
 # from .databases.clickhouse.session import (
 #     NoTransactionSession as ClickhouseNoTransactionSession,
@@ -53,6 +55,37 @@ from .fields import (
 )
 
 
+def _loads_json_value(value: Any) -> Any:
+    """json.loads для строк из БД (без кодека asyncpg), иначе как есть."""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return value
+
+
+class _ValueKinds(dict):
+    """type значения -> вид для сериализатора (0 значение, 1 Field, 2 DotModel).
+
+    isinstance с ABCMeta (DotModel) медленный, поэтому вид считается
+    один раз на тип значения.
+    """
+
+    def __missing__(self, klass: type) -> int:
+        if issubclass(klass, Field):
+            kind = 1
+        elif issubclass(klass, DotModel):
+            kind = 2
+        else:
+            kind = 0
+        self[klass] = kind
+        return kind
+
+
+_VALUE_KINDS = _ValueKinds()
+
+
 class JsonMode(IntEnum):
     FORM = 1
     LIST = 2
@@ -143,6 +176,13 @@ class DotModel(
     __schema_read_search_input__: ClassVar[Type]
     __schema_update__: ClassVar[Type]
     __response_model_exclude__: ClassVar[set[str] | None] = None
+    # coalesce concurrent get()/get_or_none() into one query (BatchLoader)
+    # True - same loop tick, float - collect window in seconds
+    __batch_get__: ClassVar[bool | float] = False
+    # budget of one bulk statement (create_bulk, update_bulk, delete_bulk,
+    # link/unlink_many2many): bigger batches are split into chunks
+    __bulk_max_params__: ClassVar[int] = 65535
+    __bulk_max_rows__: ClassVar[int | None] = None
     # its auto
     # __schema_output_search__: ClassVar[Type]
 
@@ -172,9 +212,18 @@ class DotModel(
         cls._cache_store_fields: list[str] | None = None
         cls._cache_store_fields_dict: dict[str, Field] | None = None
         cls._cache_json_fields: list[str] | None = None
-        cls._cache_compute_fields: list[tuple[str, Field]] | None = None
         cls._cache_has_json_fields: bool | None = None
-        cls._cache_has_compute_fields: bool | None = None
+        # (columns, extra) -> (compact class, hydrate function)
+        cls._cache_compact_classes: dict[tuple, tuple[type, Callable]] = {}
+        # (mode, only_store, exclude_unset, include, exclude, exclude_none)
+        # -> generated serializer function
+        cls._cache_serializers: dict[tuple, Callable] = {}
+
+        # Ленивые compute поля: поле из @depends -> compute поля,
+        # закэшированные значения которых сбрасываются при записи
+        cls._compute_invalidation = cls._collect_compute_invalidation()
+        if cls._compute_invalidation and "__setattr__" not in cls.__dict__:
+            cls.__setattr__ = DotModel._setattr_invalidate_compute
 
     @classmethod
     def _ensure_field_cache(cls):
@@ -200,13 +249,50 @@ class DotModel(
             for name, field in fields.items()
             if isinstance(field, JSONField)
         ]
-        cls._cache_compute_fields = [
-            (name, field)
-            for name, field in fields.items()
-            if field.compute and not field.store
-        ]
         cls._cache_has_json_fields = bool(cls._cache_json_fields)
-        cls._cache_has_compute_fields = bool(cls._cache_compute_fields)
+
+    @classmethod
+    def _collect_compute_invalidation(cls) -> dict[str, tuple[str, ...]]:
+        """Поле -> compute поля, зависящие от него (с учётом цепочек).
+
+        Зависимости берутся из @depends на функции compute.
+        """
+        compute_deps: dict[str, set[str]] = {}
+        for klass in reversed(cls.__mro__):
+            for attr_name, attr in klass.__dict__.items():
+                if isinstance(attr, Field):
+                    if attr.compute and not attr.store:
+                        compute_deps[attr_name] = set(
+                            getattr(attr.compute, "compute_deps", ())
+                        )
+                    else:
+                        compute_deps.pop(attr_name, None)
+
+        dependents: dict[str, set[str]] = {}
+        for name, deps in compute_deps.items():
+            for dep in deps:
+                dependents.setdefault(dep, set()).add(name)
+
+        def affected(name: str, seen: set[str]) -> set[str]:
+            for dependent in dependents.get(name, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    affected(dependent, seen)
+            return seen
+
+        return {
+            name: tuple(sorted(affected(name, set())))
+            for name in dependents
+        }
+
+    def _setattr_invalidate_compute(self, name: str, value: Any) -> None:
+        """__setattr__ моделей с @depends: сброс кэша compute полей."""
+        object.__setattr__(self, name, value)
+        dependents = self._compute_invalidation.get(name)
+        if dependents:
+            values = self.__dict__
+            for dependent in dependents:
+                values.pop(dependent, None)
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         # Fast path: bulk-assign all kwargs via __dict__
@@ -216,9 +302,11 @@ class DotModel(
         cls._ensure_field_cache()
 
         # Десериализация JSON полей (если пришла строка из БД)
-        # asyncpg не десериализует jsonb автоматически без кодека,
-        # поэтому нужен fallback json.loads для строковых значений.
-        if cls._cache_has_json_fields:
+        # Пул ContainerPostgres ставит кодеки json/jsonb (JsonCodecs),
+        # fallback json.loads нужен для соединений без кодека.
+        # Значение, декодированное драйвером, может само быть строкой
+        # (JSON "42"), повторно его не декодируем.
+        if cls._cache_has_json_fields and not cls._json_decoded_by_driver():
             for name in cls._cache_json_fields:
                 value = self.__dict__.get(name)
                 if isinstance(value, str):
@@ -227,56 +315,8 @@ class DotModel(
                     except (json.JSONDecodeError, TypeError):
                         pass
 
-        # Вычисляемые поля (compute, не хранящиеся в БД)
-        if cls._cache_has_compute_fields:
-            for name, field in cls._cache_compute_fields:
-                self.__dict__[name] = field.compute(self)
-
-    #             # Если есть функция вычисления (имя метода)
-    #             if isinstance(field.compute, str):
-    #                 # Проверяем, существует ли метод
-    #                 method_name = field.compute
-    #                 if hasattr(self, method_name):
-    #                     # Вычисляем значение сразу
-    #                     method = getattr(self, method_name)
-    #                     if hasattr(method, "compute_deps"):
-    #                         # Для методов с зависимостями - не вычисляем сразу
-    #                         # а оставляем как не вычисленное
-    #                         pass
-    #                     else:
-    #                         # Вычисляем значение
-    #                         setattr(self, name, method())
-    #                 else:
-    #                     raise AttributeError(
-    #                         f"Method '{method_name}' not found for field '{name}'"
-    #                     )
-
-    # def __setattr__(self, name: str, value: Any) -> None:
-    #     """Переопределяем для отслеживания изменений"""
-    #     # Если это поле модели и оно изменилось
-    #     if name in self.get_fields():
-    #         field = self.get_fields()[name]
-    #         if field.store:  # Только если поле хранится в БД
-    #             # Инвалидируем зависимые поля
-    #             self._invalidate_dependent_fields(name)
-    #     super().__setattr__(name, value)
-
-    # def _invalidate_dependent_fields(self, changed_field: str):
-    #     """Инвалидировать все зависимые поля"""
-    #     # Проходим по всем полям модели
-    #     for field_name, field in self.get_fields().items():
-    #         # Если это вычисляемое поле с зависимостями
-    #         if field.compute and not field.store:
-    #             method_name = field.compute
-    #             if isinstance(method_name, str) and hasattr(self, method_name):
-    #                 method = getattr(self, method_name)
-    #                 # Проверяем, есть ли зависимости
-    #                 if hasattr(method, "compute_deps"):
-    #                     deps = method.compute_deps
-    #                     if changed_field in deps:
-    #                         # Устанавливаем флаг, что поле нужно пересчитать
-    #                         # Вместо удаления атрибута - устанавливаем флаг
-    #                         setattr(self, f"_{field_name}_computed", False)
+        # Вычисляемые поля (compute, не хранящиеся в БД) считаются
+        # лениво при первом чтении, см. Field.__get__
 
     @classmethod
     def _get_db_session(cls, session=None):
@@ -315,24 +355,112 @@ class DotModel(
     def prepare_list_ids(cls, rows: list):
         """Десериализация из списка записей (dict или asyncpg Record) в список объектов.
 
-        Fast path: bypasses __init__ when model has no JSON/compute fields.
+        Fast path: bypasses __init__ when model has no JSON fields
+        (JSON fields are fine when asyncpg decodes them, see JsonCodecs).
+        Compute fields are lazy (Field.__get__) and don't need __init__.
         Uses object.__new__ + __dict__.update — same approach as SQLAlchemy.
         """
         cls._ensure_field_cache()
-        # Fast path: no JSON deserialization, no compute fields
-        if (
-            not cls._cache_has_json_fields
-            and not cls._cache_has_compute_fields
-        ):
+        # Fast path: no JSON deserialization
+        if not cls._cache_has_json_fields or cls._json_decoded_by_driver():
             result = []
             for r in rows:
                 obj = object.__new__(cls)
                 obj.__dict__.update(r)
                 result.append(obj)
             return result
-        # Slow path: has JSON or compute fields — use full __init__
+        # Slow path: JSON strings from DB — use full __init__
         return [cls(**r) for r in rows]
 
+    @classmethod
+    def _json_decoded_by_driver(cls) -> bool:
+        """JSON колонки приходят уже декодированными (кодеки asyncpg).
+
+        Определяется по соединению, с которого получены строки
+        (сессия вызывает prepare через JsonCodecs.prepare).
+        """
+        return JsonCodecs.decoded()
+
+    @classmethod
+    def prepare_list_compact(cls, rows: list, extra: tuple[str, ...] = ()):
+        """Десериализация в компактные записи (search(compact=True)).
+
+        Для набора колонок генерируется подкласс модели со __slots__,
+        значения хранятся в слотах, а не в __dict__ на каждую запись.
+        Атрибуты, json(), update() и isinstance работают как у модели.
+
+        Arguments:
+            rows -- записи из БД (dict или asyncpg Record)
+            extra -- поля, которые будут заполнены позже (relations),
+                до загрузки содержат Field как и у обычной модели
+        """
+        if not rows:
+            return []
+        key = (
+            tuple(rows[0].keys()),
+            extra,
+            not cls._json_decoded_by_driver(),
+        )
+        compact = cls._cache_compact_classes.get(key)
+        if compact is None:
+            compact = cls._cache_compact_classes[key] = cls._make_compact(
+                *key
+            )
+        return compact[1](rows)
+
+    @classmethod
+    def _make_compact(
+        cls,
+        columns: tuple[str, ...],
+        extra: tuple[str, ...],
+        decode_json: bool = True,
+    ):
+        """Сгенерировать slotted подкласс и функцию заполнения из строк."""
+        cls._ensure_field_cache()
+        json_fields = (
+            [n for n in cls._cache_json_fields if n in columns]
+            if decode_json
+            else []
+        )
+        extra = tuple(n for n in extra if n not in columns)
+        # compute поля не в слотах: считаются лениво в __dict__
+        slots = (*columns, *extra)
+
+        compact = type(cls)(
+            f"{cls.__name__}Compact",
+            (cls,),
+            {
+                "__slots__": slots,
+                "__module__": cls.__module__,
+                "__qualname__": f"{cls.__qualname__}Compact",
+            },
+        )
+
+        # Тело цикла генерируется один раз: o.name = r["name"] ...
+        lines = [f"        o.{name} = r[{name!r}]" for name in columns]
+        lines += [f"        o.{name} = {name}" for name in extra]
+        lines += [f"        o.{name} = _json(o.{name})" for name in json_fields]
+        src = (
+            "def hydrate(rows):\n"
+            "    result = []\n"
+            "    append = result.append\n"
+            "    for r in rows:\n"
+            "        o = _new(_cls)\n"
+            + "\n".join(lines)
+            + "\n        append(o)\n"
+            "    return result\n"
+        )
+        namespace: dict[str, Any] = {
+            "_new": object.__new__,
+            "_cls": compact,
+            "_json": _loads_json_value,
+        }
+        # До загрузки relations значение = Field, как у обычной модели
+        for name in extra:
+            namespace[name] = getattr(cls, name)
+        exec(src, namespace)
+        return compact, namespace["hydrate"]
+
     @classmethod
     def prepare_list_id(cls, r: list):
         """Десериализация из словаря в объект.
@@ -662,99 +790,161 @@ class DotModel(
         """Возвращает все поля модели.
         Для экземпляра класса. В экземпляре поля (класс Field)
         преобразуются в реальные данные например Integer -> int"""
-        fields_json = {}
-        # fields - это поля описанные в модели (классе)
+        return self._get_serializer(mode, only_store, exclude_unset)(self)
+
+    @classmethod
+    def _get_serializer(
+        cls,
+        mode=JsonMode.LIST,
+        only_store=None,
+        exclude_unset=False,
+        include=None,
+        exclude=None,
+        exclude_none=False,
+    ) -> Callable[["DotModel"], dict]:
+        """Сериализатор для набора параметров json() (генерируется один раз)."""
+        key = (
+            mode,
+            bool(only_store),
+            bool(exclude_unset),
+            frozenset(include) if include else None,
+            frozenset(exclude) if exclude else None,
+            bool(exclude_none),
+        )
+        serializer = cls._cache_serializers.get(key)
+        if serializer is None:
+            serializer = cls._cache_serializers[key] = cls._make_serializer(
+                *key
+            )
+        return serializer
+
+    @classmethod
+    def _make_serializer(
+        cls,
+        mode,
+        only_store: bool,
+        exclude_unset: bool,
+        include: frozenset | None,
+        exclude: frozenset | None,
+        exclude_none: bool,
+    ) -> Callable[["DotModel"], dict]:
+        """Сгенерировать функцию сериализации экземпляра в dict.
+
+        Проверки по классу поля (x2m, JSONField) и по mode выполняются
+        здесь один раз, в функции остаётся только вид значения
+        (не задано -> Field, many2one -> DotModel), по типу из
+        _VALUE_KINDS. Результат совпадает с прежним обходом полей
+        в get_json + фильтрами json().
+        """
         if only_store:
-            fields = self.get_store_fields_dict().items()
+            fields = cls.get_store_fields_dict()
         else:
-            fields = self.get_fields().items()
-
-        for field_name, field_class in fields:
-            # field - это поле из экземпляра.
-            # 1. оно может содержать данные, если задано.
-            # 2. оно может содержать класс Field, если не задано.
-            field = getattr(self, field_name)
-
-            # НЕ ЗАДАНО
-            # если поле экземпляра класса, осталось классом Field
-            # это значит что оно не было считано из БД
-            if isinstance(field, Field):
-                # если установлен флаг исключить не заданные,
-                # то ничего не делать
-                if not exclude_unset:
-                    # иначе взять значение по умолчанию или None
-                    if field.default is not None:
-                        # если default - callable (лямбда или функция), вызываем её
-                        if callable(field.default):
-                            fields_json[field_name] = field.default()
-                        else:
-                            fields_json[field_name] = field.default
-                    else:
-                        fields_json[field_name] = None
+            fields = cls.get_fields()
+
+        def put(key: str, expr: str, indent: str) -> list[str]:
+            if exclude_none:
+                return [
+                    f"{indent}x = {expr}",
+                    f"{indent}if x is not None:",
+                    f"{indent}    d[{key}] = x",
+                ]
+            return [f"{indent}d[{key}] = {expr}"]
+
+        lines = []
+        for name, field_class in fields.items():
+            if include and name not in include:
+                continue
+            if exclude and name in exclude:
+                continue
+            key = repr(name)
+            i2, i3 = " " * 8, " " * 12
+            lines.append(f"    v = o.{name}")
+            lines.append("    k = _kinds[v.__class__]")
+
+            # НЕ ЗАДАНО: значение по умолчанию или None
+            lines.append("    if k == 1:")
+            if exclude_unset:
+                lines.append(f"{i2}pass")
+            else:
+                lines += [
+                    f"{i2}dv = v.default",
+                    f"{i2}if dv is None:",
+                    *put(key, "None", i3),
+                    f"{i2}elif _callable(dv):",
+                    *put(key, "dv()", i3),
+                    f"{i2}else:",
+                    *put(key, "dv", i3),
+                ]
 
             # ЗАДАНО как many2one
-            # если поле является моделью то это many2one
-            elif isinstance(field, DotModel):
-                if mode == JsonMode.LIST:
-                    # обрубаем, исключаем все релейшен поля
-                    fields_json[field_name] = {
-                        "id": field.id,
-                        "name": getattr(field, "name", str(field.id)),
-                    }
-                elif mode == JsonMode.FORM:
-                    fields_json[field_name] = field.json()
-                elif mode == JsonMode.CREATE or mode == JsonMode.UPDATE:
-                    fields_json[field_name] = field.id
+            lines.append("    elif k == 2:")
+            if mode == JsonMode.LIST:
+                expr = '{"id": v.id, "name": _getattr(v, "name", str(v.id))}'
+                lines += put(key, expr, i2)
+            elif mode == JsonMode.FORM:
+                lines += put(key, "v.json()", i2)
+            elif mode == JsonMode.CREATE or mode == JsonMode.UPDATE:
+                lines += put(key, "v.id", i2)
+            else:
+                lines.append(f"{i2}pass")
 
             # ЗАДАНО как many2many или one2many
-            elif isinstance(
+            if isinstance(
                 field_class, (Many2many, One2many, PolymorphicOne2many)
             ):
+                lines.append("    else:")
                 if mode == JsonMode.LIST:
-                    # При search: field это list
-                    fields_json[field_name] = [
-                        {
-                            "id": rec.id,
-                            "name": rec.name or str(rec.id),
-                        }
-                        for rec in field
-                    ]
+                    expr = (
+                        '[{"id": rec.id, "name": rec.name or str(rec.id)}'
+                        " for rec in v]"
+                    )
+                    lines += put(key, expr, i2)
                 elif mode == JsonMode.NESTED_LIST:
-                    # Вложенная сериализация оставляем как есть
-                    fields_json[field_name] = field
+                    lines += put(key, "v", i2)
                 elif mode == JsonMode.FORM:
-                    # При FORM (get) field может быть:
-                    # list объектов (get с fields_nested)
-                    # dict с data/fields/total (legacy)
-                    if isinstance(field, dict):
-                        fields_json[field_name] = {
-                            "data": [
-                                rec.json(mode=JsonMode.NESTED_LIST)
-                                for rec in field["data"]
-                            ],
-                            "fields": field["fields"],
-                            "total": field["total"],
-                        }
-                    elif isinstance(field, list):
-                        fields_json[field_name] = [
-                            rec.json(mode=JsonMode.NESTED_LIST)
-                            for rec in field
-                        ]
-                    else:
-                        fields_json[field_name] = field
+                    lines += [
+                        f"{i2}if _isinstance(v, dict):",
+                        *put(
+                            key,
+                            '{"data": [rec.json(mode=_NESTED)'
+                            ' for rec in v["data"]],'
+                            ' "fields": v["fields"], "total": v["total"]}',
+                            i3,
+                        ),
+                        f"{i2}elif _isinstance(v, list):",
+                        *put(key, "[rec.json(mode=_NESTED) for rec in v]", i3),
+                        f"{i2}else:",
+                        *put(key, "v", i3),
+                    ]
+                else:
+                    lines.append(f"{i2}pass")
+                continue
 
             # Сериализуем JSONField в строку при записи в БД
-            elif (
-                only_store
-                and isinstance(field_class, JSONField)
-                and isinstance(field, (dict, list))
-            ):
-                fields_json[field_name] = json.dumps(field, ensure_ascii=False)
+            if only_store and isinstance(field_class, JSONField):
+                lines.append("    elif _isinstance(v, (dict, list)):")
+                lines += put(key, "_dumps(v, ensure_ascii=False)", i2)
+
             # ЗАДАНО как значение (число строка время...)
-            # иначе поле считается прочитанным из БД и просто пробрасывается
-            else:
-                fields_json[field_name] = field
-        return fields_json
+            lines.append("    else:")
+            lines += put(key, "v", i2)
+
+        src = (
+            "def serialize(o):\n"
+            "    d = {}\n"
+            + "".join(line + "\n" for line in lines)
+            + "    return d\n"
+        )
+        namespace: dict[str, Any] = {
+            "_isinstance": isinstance,
+            "_callable": callable,
+            "_getattr": getattr,
+            "_kinds": _VALUE_KINDS,
+            "_NESTED": JsonMode.NESTED_LIST,
+            "_dumps": json.dumps,
+        }
+        exec(src, namespace)
+        return namespace["serialize"]
 
     def json(
         self,
@@ -776,14 +966,71 @@ class DotModel(
         Returns:
             python dict
         """
-        record = self.get_json(exclude_unset, only_store, mode)
-        if include:
-            record = {k: v for k, v in record.items() if k in include}
-        if exclude:
-            record = {k: v for k, v in record.items() if k not in exclude}
-        if exclude_none:
-            record = {k: v for k, v in record.items() if v is not None}
-        return record
+        cls = self.__class__
+        if cls.get_json is not DotModel.get_json:
+            # get_json переопределён в модели — фильтруем его результат
+            record = self.get_json(exclude_unset, only_store, mode)
+            if include:
+                record = {k: v for k, v in record.items() if k in include}
+            if exclude:
+                record = {
+                    k: v for k, v in record.items() if k not in exclude
+                }
+            if exclude_none:
+                record = {k: v for k, v in record.items() if v is not None}
+            return record
+        return cls._get_serializer(
+            mode, only_store, exclude_unset, include, exclude, exclude_none
+        )(self)
+
+    @classmethod
+    def dumps_many(
+        cls,
+        records: list["DotModel"],
+        mode=JsonMode.LIST,
+        include={},
+        exclude={},
+        exclude_none=False,
+    ) -> bytes:
+        """Сериализация списка записей сразу в UTF-8 JSON bytes.
+
+        Поля как у json(mode=...) (Many2one/One2many/Many2many в LIST
+        и FORM). Сериализатор берётся один раз на класс записей,
+        кодирование одним вызовом orjson (если установлен) или json.
+
+        Keyword Arguments:
+            mode -- JsonMode.LIST (по умолчанию) или JsonMode.FORM
+            include, exclude, exclude_none -- как в json()
+
+        Returns:
+            bytes, JSON массив объектов
+        """
+        data = []
+        append = data.append
+        klass = None
+        serializer = None
+        for record in records:
+            # compact записи - подкласс модели, сериализатор свой
+            if record.__class__ is not klass:
+                klass = record.__class__
+                if klass.get_json is DotModel.get_json:
+                    serializer = klass._get_serializer(
+                        mode, None, False, include, exclude, exclude_none
+                    )
+                else:
+                    serializer = partial(
+                        klass.json,
+                        include=include,
+                        exclude=exclude,
+                        exclude_none=exclude_none,
+                        mode=mode,
+                    )
+            append(serializer(record))
+
+        # dotorm.orm импортирует модель, поэтому импорт не на уровне модуля
+        from .orm.utils import dumps_json_bytes
+
+        return dumps_json_bytes(data)
 
     @classmethod
     def get_onchange_fields(cls) -> list[str]:
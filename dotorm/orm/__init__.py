@@ -6,8 +6,10 @@ from .mixins import (
     OrmPrimaryMixin,
     DDLMixin,
 )
+from .loader import BatchLoader
 
 __all__ = [
+    "BatchLoader",
     "DDLMixin",
     "OrmPrimaryMixin",
     "OrmMany2manyMixin",
@@ -0,0 +1,113 @@
+"""Coalescing of concurrent get() calls into one query (DataLoader)."""
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..model import DotModel
+
+# fields -> id -> futures of callers
+_Batch = dict[tuple[str, ...], dict[Any, list[asyncio.Future]]]
+
+
+class BatchLoader:
+    """
+    Batch get()/get_or_none() of one model by id.
+
+    Calls made in the same event loop tick (or within delay
+    seconds) are collected and loaded with one query
+    (build_get_many: id = ANY($1)), every caller gets its record.
+    Used when model sets __batch_get__ (see DotModel) and the call
+    is outside of transaction without explicit session.
+
+    Access checks are done by each caller before load().
+    Several callers of the same id get separate copies
+    of the record.
+
+    Example:
+        class User(DotModel):
+            __table__ = "users"
+            __batch_get__ = True  # or window in seconds: 0.002
+
+        # one SELECT ... WHERE id = ANY($1) for all three
+        users = await asyncio.gather(
+            User.get(1), User.get(2), User.get(3)
+        )
+    """
+
+    __slots__ = ("model", "delay", "_batch", "_loop", "_tasks")
+
+    def __init__(self, model: type["DotModel"], delay: float = 0) -> None:
+        """
+        Args:
+            model: Model class
+            delay: Collect window in seconds (0 = next loop tick)
+        """
+        self.model = model
+        self.delay = delay
+        self._batch: _Batch | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, id: Any, fields: tuple[str, ...]) -> asyncio.Future:
+        """Add id to current batch, return future of the record (or None)."""
+        loop = asyncio.get_running_loop()
+        batch = self._batch
+        # batch of another (closed) loop is never dispatched
+        if batch is None or self._loop is not loop:
+            batch = self._batch = {}
+            self._loop = loop
+            if self.delay:
+                loop.call_later(self.delay, self._dispatch, batch)
+            else:
+                loop.call_soon(self._dispatch, batch)
+        future = loop.create_future()
+        batch.setdefault(fields, {}).setdefault(id, []).append(future)
+        return future
+
+    def _dispatch(self, batch: _Batch) -> None:
+        """Close batch and start one query per set of fields."""
+        if self._batch is batch:
+            self._batch = None
+        for fields, waiters in batch.items():
+            task = asyncio.ensure_future(self._load(fields, waiters))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load(
+        self,
+        fields: tuple[str, ...],
+        waiters: dict[Any, list[asyncio.Future]],
+    ) -> None:
+        model = self.model
+        try:
+            session = model._no_transaction(model._pool)
+            stmt, values = model._builder.build_get_many(
+                list(waiters), list(fields)
+            )
+            records = await session.execute(
+                stmt, values, prepare=model.prepare_list_ids, prepared=True
+            )
+        except BaseException as e:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        records_by_id = {record.id: record for record in records or ()}
+        for id, futures in waiters.items():
+            record = records_by_id.get(id)
+            for i, future in enumerate(futures):
+                if future.done():
+                    # caller cancelled
+                    continue
+                if record is not None and i:
+                    # own instance for each caller of the same id
+                    copy = object.__new__(type(record))
+                    copy.__dict__.update(record.__dict__)
+                    future.set_result(copy)
+                else:
+                    future.set_result(record)
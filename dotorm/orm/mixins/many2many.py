@@ -9,7 +9,15 @@ if TYPE_CHECKING:
 else:
     _Base = object
 
-from ...fields import PolymorphicMany2one, Field, Many2many, Many2one, One2many
+from ...fields import (
+    PolymorphicMany2one,
+    PolymorphicOne2many,
+    Field,
+    Many2many,
+    Many2one,
+    One2many,
+    One2one,
+)
 from ...decorators import hybridmethod
 from ..utils import execute_maybe_parallel
 
@@ -71,7 +79,7 @@ class OrmMany2manyMixin(_Base):
             limit,
         )
         records = await session.execute(
-            stmt, values, prepare=comodel.prepare_list_ids
+            stmt, values, prepare=comodel.prepare_list_ids, prepared=True
         )
 
         # если есть хоть одна запись и вообще нужно читать поля связей
@@ -88,26 +96,75 @@ class OrmMany2manyMixin(_Base):
 
     @hybridmethod
     async def link_many2many(
-        self, field: Many2many, values: list, session=None
+        self,
+        field: Many2many,
+        values: list,
+        session=None,
+        ignore_conflicts: bool = False,
+        atomic: bool = False,
     ):
-        """Link records in M2M relation."""
-        cls = self.__class__
-        session = cls._get_db_session(session)
-        query_placeholders = ", ".join(["%s"] * len(values[0]))
-        stmt = f"""INSERT INTO {field.many2many_table}
-        ({field.column2}, {field.column1})
-        VALUES
-        ({query_placeholders})
         """
-        return await session.execute(stmt, [values], cursor="executemany")
+        Link records in M2M relation.
+
+        Postgres: one INSERT ... SELECT FROM unnest for all links
+        (one round trip), MySQL: executemany.
+
+        Args:
+            field: Many2many field
+            values: (column2 value, column1 value) per link
+            session: DB session
+            ignore_conflicts: Skip already existing links
+                (ON CONFLICT DO NOTHING / INSERT IGNORE), needs
+                unique index on (column1, column2) of many2many_table
+            atomic: Chunks of big batch in one transaction
+                (see _execute_chunked)
+        """
+        cls = self.__class__
+        if not values:
+            return None
+        is_postgres = cls._dialect.name == "postgres"
+
+        async def run(session, chunk):
+            stmt, stmt_values = cls._builder.build_link_many2many(
+                field.many2many_table,
+                field.column1,
+                field.column2,
+                chunk,
+                ignore_conflicts,
+            )
+            cursor = "void" if is_postgres else "executemany"
+            return await session.execute(stmt, stmt_values, cursor=cursor)
+
+        # Postgres unnest: 2 массива, MySQL: 2 параметра на связь
+        return await cls._execute_chunked(
+            session, values, 0 if is_postgres else 2, run, atomic
+        )
 
     @classmethod
-    async def unlink_many2many(cls, field: Many2many, ids: list, session=None):
-        """Unlink records from M2M relation."""
-        session = cls._get_db_session(session)
-        args: str = ",".join(["%s"] * len(ids))
-        stmt = f"DELETE FROM {field.many2many_table} WHERE {field.column1} in ({args})"
-        return await session.execute(stmt, ids)
+    async def unlink_many2many(
+        cls,
+        field: Many2many,
+        ids: list,
+        session=None,
+        atomic: bool = False,
+    ):
+        """Unlink records from M2M relation (one DELETE per chunk of ids)."""
+        if not ids:
+            return None
+
+        async def run(session, chunk):
+            stmt, values = cls._builder.build_unlink_many2many(
+                field.many2many_table, field.column1, chunk
+            )
+            return await session.execute(stmt, values, cursor="void")
+
+        return await cls._execute_chunked(
+            session,
+            ids,
+            0 if cls._dialect.name == "postgres" else 1,
+            run,
+            atomic,
+        )
 
     @classmethod
     async def _records_list_get_relation(
@@ -116,12 +173,22 @@ class OrmMany2manyMixin(_Base):
         fields_relation,
         records,
         fields_nested: dict[str, list[str]] | None = None,
+        nested_limit: int | None = 80,
+        nested_sort: str = "id",
+        nested_order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
     ):
-        """Load relations for a list of records (batch)."""
-        dialect = cls._dialect
+        """Load relations for a list of records (batch).
 
+        nested_limit/nested_sort/nested_order - per parent for
+        One2many/Many2many (at most nested_limit records each).
+        """
         request_list = cls._builder.build_search_relation(
-            fields_relation, records, fields_nested
+            fields_relation,
+            records,
+            fields_nested,
+            nested_limit,
+            nested_sort,
+            nested_order,
         )
         execute_list = [
             session.execute(
@@ -129,6 +196,7 @@ class OrmMany2manyMixin(_Base):
                 req.value,
                 prepare=req.function_prepare,
                 cursor=req.function_cursor,
+                prepared=True,
             )
             for req in request_list
         ]
@@ -137,51 +205,69 @@ class OrmMany2manyMixin(_Base):
 
         # маппинг (полученных оптимизированных запросов) полей связей
         # на конкретные записи (полученные при чтении store на предыдущем шаге)
-        for index, result in enumerate(results):
-            req = request_list[index]
-
-            if isinstance(req.field, (Many2one, PolymorphicMany2one)):
-                # Сначала инициализируем все записи None
-                for rec in records:
-                    rec_field_raw = getattr(rec, req.field_name)
-                    if isinstance(rec_field_raw, Field):
-                        setattr(rec, req.field_name, None)
-                # Теперь маппим найденные результаты
-                for rec in records:
-                    rec_field_raw = getattr(rec, req.field_name)
-                    for res_model in result:
-                        if rec_field_raw == res_model.id:
-                            setattr(rec, req.field_name, res_model)
-                            break
-
-            if isinstance(req.field, One2many):
-                # Сначала инициализируем все записи пустым списком
-                for rec in records:
-                    old_value = getattr(rec, req.field_name)
-                    if isinstance(old_value, Field):
-                        setattr(rec, req.field_name, [])
-                # Теперь добавляем найденные результаты
-                for res_model in result:
-                    res_field_id = getattr(
-                        res_model, req.field.relation_table_field
-                    )
-                    for rec in records:
-                        if rec.id == res_field_id:
-                            getattr(rec, req.field_name).append(res_model)
-                            break
-
-            if isinstance(req.field, Many2many):
-                # Сначала инициализируем все записи пустым списком
-                for rec in records:
-                    old_value = getattr(rec, req.field_name)
-                    if isinstance(old_value, Field):
-                        setattr(rec, req.field_name, [])
-                # Теперь добавляем найденные результаты
-                for res_model in result:
-                    for rec in records:
-                        if rec.id == res_model.m2m_id:
-                            getattr(rec, req.field_name).append(res_model)
-                            break
+        for req, result in zip(request_list, results):
+            cls._map_relation_results(req.field, req.field_name, records, result)
+
+    @staticmethod
+    def _map_relation_results(field: Field, field_name: str, records, result):
+        """
+        Attach loaded relation records to parents.
+
+        One pass over parents and one over results, parents are indexed
+        by id (Many2one - results by id). When ids repeat, the first
+        record wins, as with sequential scan.
+
+        Args:
+            field: Relation field
+            field_name: Field name in parent model
+            records: Parent records
+            result: Loaded related records
+        """
+        if isinstance(field, (Many2one, PolymorphicMany2one)):
+            results_by_id = {}
+            for res_model in result:
+                results_by_id.setdefault(res_model.id, res_model)
+            for rec in records:
+                rec_field_raw = getattr(rec, field_name)
+                # не прочитанное поле (Field) -> None
+                if isinstance(rec_field_raw, Field):
+                    setattr(rec, field_name, None)
+                    continue
+                res_model = results_by_id.get(rec_field_raw)
+                if res_model is not None:
+                    setattr(rec, field_name, res_model)
+
+        if isinstance(field, One2one):
+            # первая запись на родителя (запрос уже с limit 1)
+            results_by_parent = {}
+            for res_model in result:
+                results_by_parent.setdefault(
+                    getattr(res_model, field.relation_table_field), res_model
+                )
+            for rec in records:
+                setattr(rec, field_name, results_by_parent.get(rec.id))
+
+        if isinstance(field, (One2many, Many2many, PolymorphicOne2many)):
+            # список детей каждой записи, по id записи
+            children_by_id: dict = {}
+            for rec in records:
+                children = getattr(rec, field_name)
+                if isinstance(children, Field):
+                    children = []
+                    setattr(rec, field_name, children)
+                children_by_id.setdefault(rec.id, children)
+
+            parent_attr = (
+                "m2m_id"
+                if isinstance(field, Many2many)
+                else field.relation_table_field
+            )
+            for res_model in result:
+                children = children_by_id.get(getattr(res_model, parent_attr))
+                if children is not None:
+                    children.append(res_model)
+
+            if isinstance(field, Many2many):
                 # Удаляем служебный атрибут m2m_id
                 for res_model in result:
                     del res_model.__dict__["m2m_id"]
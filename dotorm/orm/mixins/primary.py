@@ -1,6 +1,6 @@
 """Primary ORM operations mixin."""
 
-from typing import TYPE_CHECKING, Self, TypeVar
+from typing import TYPE_CHECKING, Literal, Self, TypeVar
 
 from ...exceptions import RecordNotFound
 
@@ -10,6 +10,9 @@ from ...access import Operation
 from ...components.dialect import POSTGRES
 from ...model import JsonMode
 from ...decorators import hybridmethod
+from ...databases.postgres.transaction import get_current_session
+from ..loader import BatchLoader
+from ..utils import bulk_chunk_size, chunked
 
 if TYPE_CHECKING:
     from ..protocol import DotModelProtocol
@@ -29,9 +32,9 @@ class OrmPrimaryMixin(_Base):
     Mixin providing primary CRUD ORM operations.
 
     Provides:
-    - create, create_bulk
-    - get, table_len
-    - update, update_bulk
+    - create, create_bulk, upsert_bulk
+    - get, get_many, table_len
+    - update, update_bulk, update_many
     - delete, delete_bulk
 
     Expects DotModel to provide:
@@ -49,22 +52,98 @@ class OrmPrimaryMixin(_Base):
         stmt = self._builder.build_delete()
         return await session.execute(stmt, [self.id], cursor="void")
 
+    @classmethod
+    async def _execute_chunked(
+        cls,
+        session,
+        items: list,
+        params_per_row: int,
+        run,
+        atomic: bool = False,
+        fixed_params: int = 0,
+    ):
+        """
+        Run bulk operation by chunks within parameter/row budget.
+
+        Budget: __bulk_max_params__ (placeholders per statement,
+        fixed_params are taken by every chunk) and __bulk_max_rows__.
+        List results of chunks are merged.
+
+        Args:
+            session: DB session or None
+            items: Rows/ids of operation
+            params_per_row: Placeholders per item (0 - arrays, Postgres)
+            run: async run(session, chunk) - one statement for chunk
+            atomic: Several chunks in one transaction (when called
+                outside of transaction without explicit session)
+            fixed_params: Placeholders of statement not depending on items
+        """
+        size = bulk_chunk_size(
+            params_per_row,
+            cls.__bulk_max_params__ - fixed_params,
+            cls.__bulk_max_rows__,
+        )
+        chunks = chunked(items, size)
+        if len(chunks) == 1:
+            return await run(cls._get_db_session(session), items)
+
+        if atomic and session is None and get_current_session() is None:
+            async with cls._bulk_transaction() as transaction_session:
+                return await cls._run_chunks(
+                    transaction_session, chunks, run
+                )
+        return await cls._run_chunks(
+            cls._get_db_session(session), chunks, run
+        )
+
+    @staticmethod
+    async def _run_chunks(session, chunks: list, run):
+        """Последовательно выполнить чанки, объединить списки результатов."""
+        # None - ни один чанк не вернул результат (void запросы)
+        merged: list | None = None
+        for chunk in chunks:
+            result = await run(session, chunk)
+            if result is not None:
+                if merged is None:
+                    merged = []
+                merged.extend(result)
+        return merged
+
+    @classmethod
+    def _bulk_transaction(cls):
+        """Транзакция на пуле модели (для atomic bulk операций)."""
+        if cls._dialect.name == "postgres":
+            from ...databases.postgres.transaction import ContainerTransaction
+        elif cls._dialect.name == "mysql":
+            from ...databases.mysql.transaction import ContainerTransaction
+        else:
+            raise ValueError(
+                f"Atomic bulk operations are not supported "
+                f"for {cls._dialect.name}"
+            )
+        return ContainerTransaction(cls._pool)
+
     @hybridmethod
-    async def delete_bulk(self, ids: list[int], session=None):
+    async def delete_bulk(
+        self, ids: list[int], session=None, atomic: bool = False
+    ):
         cls = self.__class__
 
         # Одна проверка для всех ID
         await cls._check_access(Operation.DELETE, record_ids=ids)
 
-        session = cls._get_db_session(session)
-        stmt = cls._builder.build_delete_bulk(len(ids))
+        is_postgres = cls._dialect.name == "postgres"
 
-        if cls._dialect.name == "postgres":
-            # ANY($1::int[]) — ids as single array param
-            return await session.execute(stmt, [ids], cursor="void")
-        else:
-            # IN (%s, %s, ...) — ids as individual params
-            return await session.execute(stmt, ids, cursor="void")
+        async def run(session, chunk):
+            stmt = cls._builder.build_delete_bulk(len(chunk))
+            # ANY($1::int[]) — ids as single array param (Postgres)
+            # IN (%s, %s, ...) — ids as individual params (MySQL)
+            values = [chunk] if is_postgres else chunk
+            return await session.execute(stmt, values, cursor="void")
+
+        return await cls._execute_chunked(
+            session, ids, 0 if is_postgres else 1, run, atomic
+        )
 
     async def update(
         self,
@@ -163,14 +242,13 @@ class OrmPrimaryMixin(_Base):
         ids: list[int],
         payload: _M,
         session=None,
+        atomic: bool = False,
     ):
         cls = self.__class__
 
         # Одна проверка для всех ID
         await cls._check_access(Operation.UPDATE, record_ids=ids)
 
-        session = cls._get_db_session(session)
-
         payload_dict = payload.json(
             exclude=payload.get_none_update_fields_set(),
             exclude_none=True,
@@ -178,8 +256,90 @@ class OrmPrimaryMixin(_Base):
             only_store=True,
         )
 
-        stmt, values = cls._builder.build_update_bulk(payload_dict, ids)
-        return await session.execute(stmt, values, cursor="void")
+        async def run(session, chunk):
+            stmt, values = cls._builder.build_update_bulk(payload_dict, chunk)
+            return await session.execute(stmt, values, cursor="void")
+
+        # Postgres: ids одним массивом, MySQL: параметр на id
+        return await cls._execute_chunked(
+            session,
+            ids,
+            0 if cls._dialect.name == "postgres" else 1,
+            run,
+            atomic,
+            fixed_params=len(payload_dict),
+        )
+
+    @hybridmethod
+    async def update_many(
+        self,
+        records: list[_M],
+        fields: list[str],
+        session=None,
+        atomic: bool = False,
+    ):
+        """
+        Обновить много записей, у каждой свои значения, одним запросом.
+
+        В отличие от update_bulk (одни значения для всех id) значения
+        берутся из каждой записи. Postgres: UPDATE ... FROM unnest(...)
+        (один параметр-массив на колонку), MySQL: SET f = CASE id ... END
+        (2 параметра на запись и поле, запрос делится на чанки
+        по __bulk_max_params__ / __bulk_max_rows__).
+
+        Args:
+            records: Записи с id и новыми значениями fields.
+                Все fields должны быть заданы (загружены или присвоены)
+                у каждой записи, иначе ValueError: незаданное поле
+                было бы записано как default/None.
+            fields: Store поля для обновления
+            atomic: Все чанки в одной транзакции
+
+        Example:
+            for product in products:
+                product.price = new_prices[product.id]
+            await Product.update_many(products, ["price"])
+        """
+        cls = self.__class__
+        if not records:
+            return None
+
+        include = {"id", *fields}
+        rows = []
+        for record in records:
+            data = record.json(
+                include=include,
+                exclude_unset=True,
+                only_store=True,
+                mode=JsonMode.UPDATE,
+            )
+            if data.get("id") is None:
+                raise ValueError("update_many requires records with id")
+            missing = [name for name in fields if name not in data]
+            if missing:
+                raise ValueError(
+                    f"Fields {missing} are not set on record {data['id']}"
+                )
+            rows.append([data["id"], *(data[name] for name in fields)])
+
+        await cls._check_access(
+            Operation.UPDATE, record_ids=[row[0] for row in rows]
+        )
+
+        async def run(session, chunk):
+            stmt, values = cls._builder.build_update_many(chunk, fields)
+            return await session.execute(stmt, values, cursor="void")
+
+        # Postgres: массив на колонку, MySQL: (id, value) на поле + id в IN
+        is_postgres = cls._dialect.name == "postgres"
+        return await cls._execute_chunked(
+            session,
+            rows,
+            0 if is_postgres else 2 * len(fields) + 1,
+            run,
+            atomic,
+            fixed_params=len(fields) + 1 if is_postgres else 0,
+        )
 
     @hybridmethod
     async def create(self, payload: _M, session=None) -> int:
@@ -215,14 +375,48 @@ class OrmPrimaryMixin(_Base):
         return record_id
 
     @hybridmethod
-    async def create_bulk(self, payload: list[_M], session=None):
+    async def create_bulk(
+        self,
+        payload: list[_M],
+        session=None,
+        method: Literal["insert", "copy"] = "insert",
+        chunk_size: int = 10000,
+        returning: bool = True,
+        atomic: bool = False,
+    ):
+        """
+        Создать несколько записей.
+
+        Args:
+            payload: Записи для создания
+            session: DB сессия
+            method: "insert" - INSERT ... SELECT FROM unnest (RETURNING id),
+                "copy" - COPY (binary протокол asyncpg), только Postgres.
+                COPY быстрее на больших объёмах (импорт): нет разбора SQL
+                и планирования, значения кодируются кодеками типов.
+            chunk_size: Строк в одном COPY (только method="copy")
+            returning: Вернуть id созданных записей (method="copy":
+                id резервируются заранее из sequence)
+            atomic: Если записей больше бюджета одного запроса
+                (__bulk_max_params__ / __bulk_max_rows__) - выполнять
+                чанки в одной транзакции
+
+        Returns:
+            Список {"id": ...} созданных записей
+            (method="copy" с returning=False - None)
+
+        Example:
+            await User.create_bulk(users, method="copy", chunk_size=50000)
+        """
         cls = self.__class__
+        if method == "copy":
+            return await cls._create_bulk_copy(
+                payload, session, chunk_size, returning
+            )
 
         # Проверяем table access до создания
         await cls._check_access(Operation.CREATE)
 
-        session = cls._get_db_session(session)
-
         exclude_fields = {
             name
             for name, field in cls.get_fields().items()
@@ -236,12 +430,21 @@ class OrmPrimaryMixin(_Base):
             for p in payload
         ]
 
-        stmt, values = cls._builder.build_create_bulk(payloads_dicts)
-
-        if cls._dialect.supports_returning:
-            stmt += " RETURNING id"
-
-        records = await session.execute(stmt, values, cursor="fetch")
+        async def run(session, chunk):
+            stmt, values = cls._builder.build_create_bulk(chunk)
+            if cls._dialect.supports_returning:
+                stmt += " RETURNING id"
+            return await session.execute(stmt, values, cursor="fetch")
+
+        # Postgres unnest: параметр на колонку, MySQL VALUES: на значение
+        params_per_row = (
+            len(payloads_dicts[0])
+            if payloads_dicts and cls._dialect.name != "postgres"
+            else 0
+        )
+        records = await cls._execute_chunked(
+            session, payloads_dicts, params_per_row, run, atomic
+        )
 
         # Проверяем row access после создания
         if records:
@@ -250,6 +453,137 @@ class OrmPrimaryMixin(_Base):
 
         return records
 
+    @hybridmethod
+    async def upsert_bulk(
+        self,
+        payload: list[_M],
+        conflict_fields: list[str],
+        update_fields: list[str] | None = None,
+        session=None,
+    ):
+        """
+        Создать записи или обновить существующие одним запросом.
+
+        Postgres: INSERT ... SELECT FROM unnest ... ON CONFLICT DO UPDATE.
+        MySQL: INSERT ... VALUES ... ON DUPLICATE KEY UPDATE.
+        Без отдельного search и без гонки между чтением и записью.
+
+        Args:
+            payload: Записи (store поля, без id). Пишутся только заданные
+                поля, у всех записей должен быть один набор полей.
+            conflict_fields: Поля уникального ключа (UNIQUE / PK)
+            update_fields: Поля, обновляемые у существующих записей,
+                должны быть заданы в payload.
+                None - все заданные поля кроме conflict_fields.
+            session: DB сессия
+
+        Returns:
+            Список {"id": ...} созданных и обновлённых записей
+            (Postgres). MySQL - None.
+
+        Note:
+            В одном payload ключ конфликта должен быть уникален
+            (Postgres не обновляет строку дважды в одной команде).
+
+        Example:
+            ids = await Product.upsert_bulk(
+                products, conflict_fields=["sku"], update_fields=["price"]
+            )
+        """
+        cls = self.__class__
+        if not payload:
+            return []
+
+        await cls._check_access(Operation.CREATE)
+        await cls._check_access(Operation.UPDATE)
+
+        session = cls._get_db_session(session)
+
+        exclude_fields = {
+            name
+            for name, field in cls.get_fields().items()
+            if field.primary_key
+        }
+        # только заданные поля: незаданные не затирают существующие
+        # строки, у новых строк берётся DEFAULT колонки
+        payloads_dicts = [
+            p.json(
+                exclude=exclude_fields,
+                exclude_unset=True,
+                only_store=True,
+                mode=JsonMode.CREATE,
+            )
+            for p in payload
+        ]
+
+        stmt, values = cls._builder.build_upsert_bulk(
+            payloads_dicts, conflict_fields, update_fields
+        )
+
+        if not cls._dialect.supports_returning:
+            await session.execute(stmt, values, cursor="void")
+            return None
+
+        stmt += " RETURNING id"
+        records = await session.execute(stmt, values, cursor="fetch")
+
+        if records:
+            await cls._check_access(
+                Operation.UPDATE, record_ids=[r["id"] for r in records]
+            )
+        return records
+
+    @classmethod
+    async def _create_bulk_copy(
+        cls,
+        payload: list[_M],
+        session,
+        chunk_size: int,
+        returning: bool,
+    ) -> list[dict] | None:
+        """create_bulk(method="copy"): COPY rows, ids from sequence."""
+        if cls._dialect.name != "postgres":
+            raise ValueError("create_bulk(method='copy') requires Postgres")
+        if not payload:
+            return [] if returning else None
+
+        await cls._check_access(Operation.CREATE)
+
+        session = cls._get_db_session(session)
+
+        exclude_fields = {
+            name
+            for name, field in cls.get_fields().items()
+            if field.primary_key
+        }
+        payloads_dicts = [
+            p.json(
+                exclude=exclude_fields, only_store=True, mode=JsonMode.CREATE
+            )
+            for p in payload
+        ]
+        columns = list(payloads_dicts[0].keys())
+        records = [
+            tuple(row[name] for name in columns) for row in payloads_dicts
+        ]
+
+        ids = None
+        if returning:
+            stmt, values = cls._builder.build_reserve_ids(len(records))
+            rows = await session.execute(stmt, values, cursor="fetch")
+            ids = [row["id"] for row in rows]
+            columns = ["id", *columns]
+            records = [
+                (record_id, *row) for record_id, row in zip(ids, records)
+            ]
+
+        await session.copy_records(cls.__table__, columns, records, chunk_size)
+
+        if ids is None:
+            return None
+        await cls._check_access(Operation.CREATE, record_ids=ids)
+        return [{"id": record_id} for record_id in ids]
+
     @hybridmethod
     async def get(
         self,
@@ -323,6 +657,10 @@ class OrmPrimaryMixin(_Base):
         Returns:
             Экземпляр модели или None
 
+        Note:
+            При __batch_get__ у модели одновременные вызовы вне транзакции
+            объединяются в один запрос (см. BatchLoader).
+
         Example:
             # Проверка существования
             user = await User.get_or_none(user_id)
@@ -333,6 +671,12 @@ class OrmPrimaryMixin(_Base):
 
         await cls._check_access(Operation.READ, record_ids=[id])
 
+        # батчинг только вне транзакции и без явной сессии
+        batch = (
+            cls.__batch_get__
+            and session is None
+            and get_current_session() is None
+        )
         session = cls._get_db_session(session)
 
         # Фильтруем fields — оставляем только store поля для SQL
@@ -345,10 +689,16 @@ class OrmPrimaryMixin(_Base):
         if "id" not in fields_store:
             fields_store.append("id")
 
-        stmt, values = cls._builder.build_get(id, fields_store)
-        record = await session.execute(
-            stmt, values, prepare=cls.prepare_form_id
-        )
+        if batch:
+            # один запрос id = ANY на все get() этого тика
+            record = await cls._get_batch_loader().load(
+                id, tuple(fields_store)
+            )
+        else:
+            stmt, values = cls._builder.build_get(id, fields_store)
+            record = await session.execute(
+                stmt, values, prepare=cls.prepare_form_id, prepared=True
+            )
 
         if not record:
             return None
@@ -363,6 +713,97 @@ class OrmPrimaryMixin(_Base):
 
         return record
 
+    @classmethod
+    def _get_batch_loader(cls) -> BatchLoader:
+        """BatchLoader модели (свой у каждого класса, не наследуется)."""
+        loader = cls.__dict__.get("_batch_loader")
+        if loader is None:
+            delay = cls.__batch_get__
+            loader = BatchLoader(cls, 0 if delay is True else float(delay))
+            cls._batch_loader = loader
+        return loader
+
+    @hybridmethod
+    async def get_many(
+        self,
+        ids: list[int],
+        fields: list[str] = [],
+        fields_nested: dict[str, list[str]] | None = None,
+        session=None,
+    ) -> list[Self]:
+        """
+        Получить несколько записей по ID одним запросом.
+
+        Вместо get() в цикле: store поля читаются одним запросом
+        (id = ANY), relations загружаются batch-запросами как в search(),
+        один запрос на relation поле для всех записей.
+
+        Args:
+            ids: ID записей
+            fields: Список полей для загрузки (store + relation)
+            fields_nested: Словарь вложенных полей для relation,
+                как в get(). Если не передан — только store поля.
+            session: DB сессия
+
+        Returns:
+            Записи в порядке ids. Не найденные ID пропускаются.
+
+        Example:
+            chats = await Chat.get_many(
+                [5, 3, 9],
+                fields=["id", "name", "user_id", "message_ids"],
+                fields_nested={"user_id": ["id", "name"]},
+            )
+            [chat.id for chat in chats]  # → [5, 3, 9]
+        """
+        cls = self.__class__
+        if not ids:
+            return []
+
+        await cls._check_access(Operation.READ, record_ids=list(ids))
+
+        session = cls._get_db_session(session)
+
+        store_fields = cls.get_store_fields()
+        fields_store = (
+            [f for f in fields if f in store_fields] if fields else []
+        )
+        if not fields_store:
+            fields_store = list(store_fields)
+        if "id" not in fields_store:
+            fields_store.append("id")
+
+        unique_ids = list(dict.fromkeys(ids))
+        stmt, values = cls._builder.build_get_many(unique_ids, fields_store)
+        records = await session.execute(
+            stmt, values, prepare=cls.prepare_list_ids, prepared=True
+        )
+        if not records:
+            return []
+
+        if fields_nested is not None and fields:
+            fields_relation = [
+                (name, field)
+                for name, field in cls.get_relation_fields()
+                if name in fields
+            ]
+            if fields_relation:
+                # как get(): все связанные записи, без лимита на запись
+                await cls._records_list_get_relation(
+                    session,
+                    fields_relation,
+                    records,
+                    fields_nested,
+                    nested_limit=None,
+                )
+
+        records_by_id = {record.id: record for record in records}
+        return [
+            records_by_id[record_id]
+            for record_id in ids
+            if record_id in records_by_id
+        ]
+
     @hybridmethod
     async def table_len(self, session=None) -> int:
         cls = self.__class__
@@ -14,11 +14,16 @@ from ...fields import (
     One2many,
     One2one,
 )
-from ..utils import execute_maybe_parallel
+from ..utils import (
+    columns_to_numpy,
+    execute_maybe_parallel,
+    rows_to_columns,
+)
 
 if TYPE_CHECKING:
     from ..protocol import DotModelProtocol
-    from ...model import DotModel
+    from ...model import DotModel, JsonMode
+    from ...databases.abstract.dialect import RawRows
 
     _Base = DotModelProtocol
 else:
@@ -63,9 +68,14 @@ class OrmRelationsMixin(_Base):
         order: Literal["DESC", "ASC", "desc", "asc"] | None = None,
         sort: str | None = None,
         filter: FilterExpression | None = None,
-        raw: bool = False,
+        raw: bool | Literal["records"] = False,
         session=None,
-    ) -> list[Self]:
+        compact: bool = False,
+        nested_limit: int | None = 80,
+        nested_sort: str = "id",
+        nested_order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
+        join_m2o: bool | list[str] = False,
+    ) -> "list[Self] | RawRows":
         """
         Поиск записей с поддержкой фильтрации, пагинации и загрузки relations.
 
@@ -74,7 +84,10 @@ class OrmRelationsMixin(_Base):
 
         Args:
             fields: Список полей для загрузки (store + relation).
-                   По умолчанию ["id"].
+                   По умолчанию ["id"]. Пути через точку загружают
+                   вложенные relations по уровням, один batch-запрос
+                   на relation на уровень:
+                   ["name", "order_ids.line_ids.product_id.name"]
             start: Начальный индекс для пагинации (OFFSET)
             end: Конечный индекс (не используется напрямую, см. limit)
             limit: Максимальное количество записей. По умолчанию 1000.
@@ -83,7 +96,23 @@ class OrmRelationsMixin(_Base):
             filter: Фильтр в формате FilterExpression.
                    Например: [("active", "=", True), ("name", "ilike", "%test%")]
             raw: Если True - возвращает сырые данные без преобразования в модели
+                   Если "records" - возвращает RawRows(columns, rows) со строками
+                   драйвера как есть (asyncpg Record / tuple), без копирования
+                   в dict. Relations не загружаются. Для экспорта и агрегаций.
             session: DB сессия (опционально)
+            compact: Если True - записи создаются как экземпляры
+                   сгенерированного подкласса модели со __slots__
+                   (см. prepare_list_compact). Экономит память на больших
+                   выборках, поведение как у обычных записей.
+            nested_limit: Максимум связанных записей One2many/Many2many
+                   на каждую запись (не на всю выборку). По умолчанию 80,
+                   None - без ограничения.
+            nested_sort: Поле сортировки связанных записей. По умолчанию "id".
+            nested_order: Направление сортировки связанных записей.
+            join_m2o: Загрузить Many2one одним запросом через LEFT JOIN
+                   вместо отдельного batch-запроса (True - все
+                   запрошенные Many2one, список - только указанные).
+                   Колонки связанной таблицы ограничиваются fields_nested.
 
         Returns:
             Список экземпляров модели с загруженными данными.
@@ -115,6 +144,13 @@ class OrmRelationsMixin(_Base):
 
         if fields is None:
             fields = self.get_store_fields()
+        # "order_ids.line_ids.name" -> поле order_ids + вложенные пути
+        requested = fields
+        fields, nested_paths = cls._split_nested_paths(fields)
+        if nested_paths:
+            fields_nested = cls._merge_nested_paths(
+                fields_nested, nested_paths, requested
+            )
         # Access check + apply domain filter
         filter = await cls._check_access(Operation.READ, filter=filter)
 
@@ -123,23 +159,408 @@ class OrmRelationsMixin(_Base):
         stmt, values = cls._builder.build_search(
             fields, start, end, limit, order, sort, filter
         )
-        prepare = cls.prepare_list_ids if not raw else None
+        # запрошенные поля связей (загружаются отдельными batch-запросами)
+        fields_relation = [
+            (name, field)
+            for name, field in cls.get_relation_fields()
+            if name in fields
+        ]
+
+        if raw == "records":
+            # zero-copy: строки драйвера без dict() и без моделей
+            return await session.execute(
+                stmt, values, cursor="fetchraw", prepared=True
+            )
+
+        if raw:
+            prepare = None
+        elif compact:
+            extra = tuple(name for name, _ in fields_relation)
+
+            def prepare(rows):
+                return cls.prepare_list_compact(rows, extra)
+        else:
+            prepare = cls.prepare_list_ids
+
+        # Many2one через LEFT JOIN: тот же запрос, без второго round trip
+        fields_batch = fields_relation
+        if join_m2o and not raw:
+            joins = cls._m2o_joins(fields_relation, fields_nested, join_m2o)
+            if joins:
+                stmt = cls._builder.build_search_join(stmt, joins, sort, order)
+                prepare = cls._prepare_joined(prepare, joins)
+                joined = {name for name, _, _ in joins}
+                fields_batch = [
+                    (name, field)
+                    for name, field in fields_relation
+                    if name not in joined
+                ]
+
         records: list[Self] = await session.execute(
-            stmt, values, prepare=prepare
+            stmt, values, prepare=prepare, prepared=True
         )
 
-        # если есть хоть одна запись и вообще нужно читать поля связей
+        if records and fields_relation:
+            if fields_batch:
+                await cls._records_list_get_relation(
+                    session,
+                    fields_batch,
+                    records,
+                    fields_nested,
+                    nested_limit,
+                    nested_sort,
+                    nested_order,
+                )
+            # следующие уровни: один batch-запрос на relation на уровень
+            for name, field in fields_relation:
+                deeper = cls._deeper_paths(field, nested_paths.get(name))
+                if deeper:
+                    await field.relation_table._load_nested_paths(
+                        session,
+                        cls._collect_relation_records(records, name),
+                        deeper,
+                        nested_limit,
+                        nested_sort,
+                        nested_order,
+                    )
+
+        return records
+
+    @classmethod
+    def _m2o_joins(
+        cls,
+        fields_relation: list[tuple[str, Field]],
+        fields_nested: dict[str, list[str]] | None,
+        join_m2o: bool | list[str],
+    ) -> list[tuple[str, Field, list[str]]]:
+        """Many2one поля для LEFT JOIN и колонки их таблиц."""
+        joins = []
+        for name, field in fields_relation:
+            if type(field) is not Many2one or not field.relation_table:
+                continue
+            if join_m2o is not True and name not in join_m2o:
+                continue
+            columns = cls._builder._relation_select_fields(
+                field, fields_nested.get(name) if fields_nested else None
+            )
+            joins.append((name, field, columns))
+        return joins
+
+    @staticmethod
+    def _prepare_joined(prepare, joins: list[tuple[str, Field, list[str]]]):
+        """
+        Split joined rows into parent records and Many2one records.
+
+        Parent columns go first (p.*), joined ones are aliased
+        "<field>__<column>". Many2one records with the same id
+        are created once and shared between parents, as with
+        batch loading.
+
+        Args:
+            prepare: Prepare function of parent rows
+            joins: Result of _m2o_joins()
+        """
+        joined_count = sum(len(columns) for _, _, columns in joins)
+
+        def prepare_joined(rows):
+            keys = list(rows[0].keys())
+            parent_columns = keys[: len(keys) - joined_count]
+            records = prepare(
+                [{name: r[name] for name in parent_columns} for r in rows]
+            )
+            for name, field, columns in joins:
+                aliases = [(column, f"{name}__{column}") for column in columns]
+                id_alias = f"{name}__id"
+                rows_by_id: dict = {}
+                for r in rows:
+                    child_id = r[id_alias]
+                    if child_id is not None and child_id not in rows_by_id:
+                        rows_by_id[child_id] = {
+                            column: r[alias] for column, alias in aliases
+                        }
+                children = dict(
+                    zip(
+                        rows_by_id,
+                        field.relation_table.prepare_list_ids(
+                            list(rows_by_id.values())
+                        ),
+                    )
+                )
+                for rec in records:
+                    child = children.get(getattr(rec, name))
+                    if child is not None:
+                        setattr(rec, name, child)
+            return records
+
+        return prepare_joined
+
+    @staticmethod
+    def _split_nested_paths(
+        fields: list[str],
+    ) -> tuple[list[str], dict[str, list[str]]]:
+        """
+        Split dotted paths from field list.
+
+        Example:
+            _split_nested_paths(["name", "order_ids.line_ids.name"])
+            # (["name", "order_ids"], {"order_ids": ["line_ids.name"]})
+        """
+        if not any("." in name for name in fields):
+            return fields, {}
+        plain: list[str] = []
+        paths: dict[str, list[str]] = {}
+        for name in fields:
+            head, _, rest = name.partition(".")
+            if head not in plain:
+                plain.append(head)
+            if rest:
+                paths.setdefault(head, []).append(rest)
+        return plain, paths
+
+    @staticmethod
+    def _merge_nested_paths(
+        fields_nested: dict[str, list[str]] | None,
+        paths: dict[str, list[str]],
+        requested: list[str] | tuple[str, ...] = (),
+    ) -> dict[str, list[str]]:
+        """Добавить в fields_nested первые сегменты вложенных путей.
+
+        Relation, запрошенная и целиком (в requested без точки) и без
+        fields_nested, загружается со всеми store полями.
+        """
+        merged = dict(fields_nested or {})
+        for head, rests in paths.items():
+            if head in requested and not merged.get(head):
+                continue
+            nested = list(merged.get(head) or ())
+            for rest in rests:
+                name = rest.partition(".")[0]
+                if name not in nested:
+                    nested.append(name)
+            merged[head] = nested
+        return merged
+
+    @staticmethod
+    def _deeper_paths(field: Field, paths: list[str] | None) -> list[str]:
+        """Пути, загружаемые на следующем уровне (из записей relation).
+
+        Путь с точкой ("line_ids.name") или путь, который сам
+        называет relation поле ("line_ids", "item_id").
+        """
+        if not paths:
+            return []
+        relations = {name for name, _ in field.relation_table.get_relation_fields()}
+        return [p for p in paths if "." in p or p in relations]
+
+    @staticmethod
+    def _collect_relation_records(records: list, name: str) -> list:
+        """Загруженные записи relation поля всех записей (m2o и x2m)."""
+        collected = []
+        for rec in records:
+            value = getattr(rec, name)
+            if isinstance(value, list):
+                collected.extend(value)
+            # m2o: загруженная модель (не id и не Field)
+            elif value is not None and hasattr(value, "get_json"):
+                collected.append(value)
+        return collected
+
+    @classmethod
+    async def _load_nested_paths(
+        cls,
+        session,
+        records: list,
+        paths: list[str],
+        nested_limit: int | None = 80,
+        nested_sort: str = "id",
+        nested_order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
+    ) -> None:
+        """
+        Load relations of already loaded records by dotted paths.
+
+        One batch query per relation field on this level, then
+        recursion into the next level. Records with the same id
+        (same m2m record under several parents) are loaded once,
+        copies get the same values.
+
+        Args:
+            session: DB session
+            records: Records of this model
+            paths: Paths relative to this model, e.g. ["line_ids.name"]
+        """
+        if not records:
+            return
+        fields, nested_paths = cls._split_nested_paths(paths)
         fields_relation = [
             (name, field)
             for name, field in cls.get_relation_fields()
             if name in fields
         ]
-        if records and fields_relation:
-            await cls._records_list_get_relation(
-                session, fields_relation, records, fields_nested
+        if not fields_relation:
+            return
+
+        unique: dict = {}
+        for rec in records:
+            unique.setdefault(rec.id, rec)
+        loaded = list(unique.values())
+
+        await cls._records_list_get_relation(
+            session,
+            fields_relation,
+            loaded,
+            cls._merge_nested_paths(None, nested_paths, paths),
+            nested_limit,
+            nested_sort,
+            nested_order,
+        )
+
+        if len(loaded) != len(records):
+            for rec in records:
+                source = unique[rec.id]
+                if source is rec:
+                    continue
+                for name, _ in fields_relation:
+                    value = getattr(source, name)
+                    setattr(
+                        rec, name, list(value) if isinstance(value, list) else value
+                    )
+
+        for name, field in fields_relation:
+            deeper = cls._deeper_paths(field, nested_paths.get(name))
+            if deeper:
+                await field.relation_table._load_nested_paths(
+                    session,
+                    cls._collect_relation_records(loaded, name),
+                    deeper,
+                    nested_limit,
+                    nested_sort,
+                    nested_order,
+                )
+
+    @hybridmethod
+    async def search_json_bytes(
+        self,
+        fields: list[str] | None = None,
+        fields_nested: dict[str, list[str]] | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = 1000,
+        order: Literal["DESC", "ASC", "desc", "asc"] | None = None,
+        sort: str | None = None,
+        filter: FilterExpression | None = None,
+        mode: "JsonMode | None" = None,
+        session=None,
+        nested_limit: int | None = 80,
+        nested_sort: str = "id",
+        nested_order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
+        join_m2o: bool | list[str] = False,
+    ) -> bytes:
+        """
+        Поиск записей сразу в JSON bytes для ответа API.
+
+        То же, что search() + dumps_many(): записи создаются компактными
+        (compact=True), сериализуются сгенерированным сериализатором
+        и кодируются одним вызовом orjson (если установлен).
+
+        Args:
+            fields, fields_nested, start, end, limit, order, sort,
+            filter, session, nested_limit, nested_sort, nested_order,
+            join_m2o:
+                как в search()
+            mode: JsonMode.LIST (по умолчанию) или JsonMode.FORM
+
+        Returns:
+            bytes: JSON массив записей, как json(mode=mode) каждой записи
+
+        Example:
+            body = await User.search_json_bytes(
+                fields=["id", "name", "role_id"], limit=80
             )
+            return Response(body, media_type="application/json")
+        """
+        cls = self.__class__
+        records = await self.search(
+            fields=fields,
+            fields_nested=fields_nested,
+            start=start,
+            end=end,
+            limit=limit,
+            order=order,
+            sort=sort,
+            filter=filter,
+            session=session,
+            compact=True,
+            nested_limit=nested_limit,
+            nested_sort=nested_sort,
+            nested_order=nested_order,
+            join_m2o=join_m2o,
+        )
+        if mode is None:
+            return cls.dumps_many(records)
+        return cls.dumps_many(records, mode)
 
-        return records
+    @hybridmethod
+    async def search_columns(
+        self,
+        fields: list[str] | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = 1000,
+        order: Literal["DESC", "ASC", "desc", "asc"] | None = None,
+        sort: str | None = None,
+        filter: FilterExpression | None = None,
+        numpy: bool = False,
+        session=None,
+    ) -> dict[str, Any]:
+        """
+        Поиск записей в колоночном виде (для аналитики).
+
+        Тот же запрос и та же проверка доступа, что и в search(),
+        но модели не создаются: строки драйвера сразу транспонируются
+        в колонки. Relation поля (кроме m2o id) не загружаются.
+
+        Args:
+            fields: Список store полей. "id" добавляется всегда.
+            start, end, limit, order, sort, filter: как в search()
+            numpy: Если True - числовые поля (Integer, Float, Decimal,
+                   Boolean) возвращаются как NumPy массивы
+                   (NULL -> nan). Требует numpy: pip install dotorm[numpy]
+            session: DB сессия (опционально)
+
+        Returns:
+            dict: имя поля -> list значений (или numpy.ndarray)
+
+        Example:
+            data = await Order.search_columns(
+                fields=["amount", "status"],
+                filter=[("status", "=", "paid")],
+                numpy=True,
+            )
+            data["amount"].sum()
+        """
+        cls = self.__class__
+
+        store_fields = cls.get_store_fields()
+        fields = [f for f in fields or store_fields if f in store_fields]
+        # Access check + apply domain filter
+        filter = await cls._check_access(Operation.READ, filter=filter)
+
+        session = cls._get_db_session(session)
+
+        stmt, values = cls._builder.build_search(
+            fields, start, end, limit, order, sort, filter
+        )
+        columns, rows = await session.execute(
+            stmt, values, cursor="fetchraw", prepared=True
+        )
+        # без строк драйвер не отдаёт имена колонок - берём как в build_search
+        if not columns:
+            columns = fields if "id" in fields else ["id", *fields]
+
+        data = rows_to_columns(columns, rows)
+        if numpy:
+            columns_to_numpy(data, cls.get_store_fields_dict())
+        return data
 
     @hybridmethod
     async def search_count(
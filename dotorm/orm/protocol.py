@@ -4,6 +4,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Literal,
     Protocol,
     Self,
     Type,
@@ -31,6 +32,9 @@ class DotModelProtocol(Protocol):
 
     __table__: ClassVar[str]
     __auto_create__: ClassVar[bool] = True
+    __batch_get__: ClassVar[bool | float]
+    __bulk_max_params__: ClassVar[int]
+    __bulk_max_rows__: ClassVar[int | None]
     _pool: ClassVar[Union["aiomysql.Pool", "asyncpg.Pool"]]
     _no_transaction: ClassVar[Type]
     _dialect: ClassVar["Dialect"]
@@ -87,6 +91,16 @@ class DotModelProtocol(Protocol):
         mode: Any = ...,
     ) -> dict[str, Any]: ...
 
+    @classmethod
+    def dumps_many(
+        cls,
+        records: list[Any],
+        mode: Any = ...,
+        include: Any = ...,
+        exclude: Any = ...,
+        exclude_none: bool = ...,
+    ) -> bytes: ...
+
     @classmethod
     def get_none_update_fields_set(cls) -> set[str]: ...
 
@@ -124,6 +138,8 @@ class DotModelProtocol(Protocol):
         field: Any,
         values: list,
         session: Any = None,
+        ignore_conflicts: bool = False,
+        atomic: bool = False,
     ) -> Any: ...
 
     @classmethod
@@ -132,6 +148,18 @@ class DotModelProtocol(Protocol):
         field: Any,
         ids: list,
         session: Any = None,
+        atomic: bool = False,
+    ) -> Any: ...
+
+    @classmethod
+    async def _execute_chunked(
+        cls,
+        session: Any,
+        items: list,
+        params_per_row: int,
+        run: Any,
+        atomic: bool = False,
+        fixed_params: int = 0,
     ) -> Any: ...
 
     @classmethod
@@ -141,6 +169,9 @@ class DotModelProtocol(Protocol):
         fields_relation: list[tuple[str, "Field"]],
         records: list[Any],
         fields_nested: dict[str, list[str]] | None = None,
+        nested_limit: int | None = 80,
+        nested_sort: str = "id",
+        nested_order: Literal["DESC", "ASC", "desc", "asc"] = "ASC",
     ) -> None: ...
 
     # From OrmRelationsMixin
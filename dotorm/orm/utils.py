@@ -1,7 +1,29 @@
 """Utility functions for dotorm."""
 
 import asyncio
-from typing import Any, Coroutine, Sequence
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Coroutine, Sequence
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..fields import (
+    BigInteger,
+    Boolean,
+    Float,
+    Integer,
+    SmallInteger,
+)
+from ..fields import Decimal as DecimalField
+
+if TYPE_CHECKING:
+    from ..fields import Field
 
 
 async def execute_maybe_parallel(
@@ -37,3 +59,142 @@ async def execute_maybe_parallel(
     else:
         # Outside transaction - execute in parallel
         return list(await asyncio.gather(*coroutines))
+
+
+def bulk_chunk_size(
+    params_per_row: int,
+    max_params: int | None,
+    max_rows: int | None,
+) -> int | None:
+    """
+    Rows per bulk statement within parameter and row budget.
+
+    params_per_row=0 - parameters don't grow with rows
+    (Postgres unnest / ANY arrays), only max_rows applies.
+
+    Returns:
+        Rows per chunk or None (no chunking)
+
+    Example:
+        bulk_chunk_size(3, 65535, None)  # 21845 (MySQL VALUES, 3 columns)
+        bulk_chunk_size(0, 65535, 5000)  # 5000
+    """
+    sizes = []
+    if max_rows:
+        sizes.append(max_rows)
+    if max_params and params_per_row:
+        sizes.append(max(1, max_params // params_per_row))
+    return min(sizes) if sizes else None
+
+
+def chunked(items: Sequence[Any], size: int | None) -> list[Sequence[Any]]:
+    """Split items into chunks of size (None - single chunk)."""
+    if not size or len(items) <= size:
+        return [items]
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+# Field types converted to NumPy arrays in search_columns(numpy=True)
+_NUMPY_INT_FIELDS = (Integer, BigInteger, SmallInteger)
+_NUMPY_FLOAT_FIELDS = (Float, DecimalField)
+
+
+def rows_to_columns(
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+) -> dict[str, list]:
+    """
+    Transpose driver rows (asyncpg Record / tuple) into column lists.
+
+    Single zip(*rows) pass, no per-row dict.
+
+    Example:
+        rows_to_columns(("id", "name"), [(1, "a"), (2, "b")])
+        # {"id": [1, 2], "name": ["a", "b"]}
+    """
+    if not rows:
+        return {name: [] for name in columns}
+    return {
+        name: list(values) for name, values in zip(columns, zip(*rows))
+    }
+
+
+def columns_to_numpy(
+    data: dict[str, list],
+    fields: dict[str, "Field"],
+) -> dict[str, Any]:
+    """
+    Convert numeric columns to NumPy arrays (in place), others stay lists.
+
+    - Integer/BigInteger/SmallInteger -> int64 (float64 with nan if NULL)
+    - Float/Decimal -> float64 (NULL -> nan)
+    - Boolean -> bool (object array if NULL)
+
+    Requires numpy (pip install dotorm[numpy]).
+    """
+    import numpy as np
+
+    for name, values in data.items():
+        field = fields.get(name)
+        if isinstance(field, _NUMPY_INT_FIELDS):
+            if None in values:
+                data[name] = np.array(
+                    [np.nan if v is None else v for v in values],
+                    dtype=np.float64,
+                )
+            else:
+                data[name] = np.array(values, dtype=np.int64)
+        elif isinstance(field, _NUMPY_FLOAT_FIELDS):
+            # float() also converts Decimal
+            data[name] = np.array(
+                [np.nan if v is None else float(v) for v in values],
+                dtype=np.float64,
+            )
+        elif isinstance(field, Boolean):
+            dtype = object if None in values else np.bool_
+            data[name] = np.array(values, dtype=dtype)
+    return data
+
+
+def _json_default(value: Any) -> Any:
+    """Типы, которые не сериализуются в JSON напрямую.
+
+    - Decimal -> str (без потери точности)
+    - date/datetime/time -> isoformat
+    - bytes -> base64
+    - UUID -> str
+    - DotModel (вложенные записи в NESTED_LIST) -> json()
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode()
+    if isinstance(value, UUID):
+        return str(value)
+    if hasattr(value, "get_json"):
+        from ..model import JsonMode
+
+        return value.json(mode=JsonMode.NESTED_LIST)
+    raise TypeError(
+        f"Object of type {value.__class__.__name__} is not JSON serializable"
+    )
+
+
+def dumps_json_bytes(data: Any) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes.
+
+    Uses orjson if installed (pip install dotorm[orjson]),
+    otherwise json.dumps. Both produce compact JSON, non-JSON
+    types are converted the same way (see _json_default).
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default)
+    return json.dumps(
+        data,
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
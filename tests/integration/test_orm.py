@@ -104,6 +104,69 @@ class TestCreate:
             assert "id" in record
             assert record["id"] > 0
 
+    async def test_create_bulk_copy(self, session, clean_tables):
+        """Test bulk create with COPY, in chunks, ids reserved."""
+        from .models import Model
+
+        models = [Model(name=f"copy_{i}") for i in range(5)]
+        result = await Model.create_bulk(models, method="copy", chunk_size=2)
+
+        ids = [record["id"] for record in result]
+        assert len(set(ids)) == 5
+        created = await Model.get_many(ids)
+        assert [m.name for m in created] == [f"copy_{i}" for i in range(5)]
+
+        # без returning ids не резервируются
+        assert (
+            await Model.create_bulk(
+                [Model(name="copy_x")], method="copy", returning=False
+            )
+            is None
+        )
+        assert await Model.search_count([("name", "=", "copy_x")]) == 1
+
+    async def test_create_bulk_copy_json_codecs(self, session, clean_tables):
+        """Test COPY of JSON column on pool with JsonCodecs installed."""
+        import asyncpg
+
+        from dotorm.databases.postgres.codecs import JsonCodecs
+        from dotorm.databases.postgres.session import NoTransactionSession
+
+        from .conftest import (
+            DB_HOST,
+            DB_PASSWORD,
+            DB_PORT,
+            DB_USER,
+            TEST_DB_NAME,
+        )
+        from .models import AllFieldTypes
+
+        pool = await asyncpg.create_pool(
+            host=DB_HOST,
+            port=DB_PORT,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            database=TEST_DB_NAME,
+            min_size=1,
+            max_size=1,
+            init=JsonCodecs.init,
+        )
+        try:
+            codec_session = NoTransactionSession(pool)
+            payload = [AllFieldTypes(json_field={"n": i}) for i in range(3)]
+            result = await AllFieldTypes.create_bulk(
+                payload, method="copy", session=codec_session
+            )
+
+            records = await AllFieldTypes.get_many(
+                [record["id"] for record in result],
+                fields=["id", "json_field"],
+                session=codec_session,
+            )
+            assert [r.json_field for r in records] == [{"n": i} for i in range(3)]
+        finally:
+            await pool.close()
+
 
 class TestGet:
     """Tests for get (read) operations."""
@@ -985,3 +1048,756 @@ class TestEdgeCases:
 
         created = await AllFieldTypes.get(record_id)
         assert created.json_field == []
+
+
+# ====================
+# Prepared Statements Tests
+# ====================
+
+
+class TestPreparedStatements:
+    """Tests for per-connection prepared statements."""
+
+    def setup_method(self):
+        """Prepared statements are opt-in, enable for these tests."""
+        from dotorm.databases.postgres.prepared import PreparedStatements
+
+        PreparedStatements.clear()
+        PreparedStatements.maxsize = 128
+
+    def teardown_method(self):
+        from dotorm.databases.postgres.prepared import PreparedStatements
+
+        PreparedStatements.clear()
+        PreparedStatements.maxsize = 0
+
+    async def test_get_reuses_prepared_statement(self, sample_data):
+        """Test repeated get() hits prepared statement cache."""
+        from dotorm.databases.postgres.prepared import PreparedStatements
+
+        from .models import User
+
+        user_id = sample_data["users"][0]
+
+        for _ in range(3):
+            user = await User.get(user_id)
+            assert user.name == "John Doe"
+
+        info = PreparedStatements.info()
+        assert info["misses"] >= 1
+        assert info["hits"] >= 1
+
+    async def test_reprepare_after_schema_change(self, session, clean_tables):
+        """Test statement is prepared again after ALTER TABLE."""
+        from dotorm.databases.postgres.prepared import PreparedStatements
+
+        await session.execute(
+            "CREATE TABLE IF NOT EXISTS prepared_test (id SERIAL, a INTEGER)"
+        )
+        try:
+            await session.execute("INSERT INTO prepared_test (a) VALUES (1)")
+            stmt = "SELECT * FROM prepared_test WHERE a = $1"
+
+            rows = await session.execute(stmt, (1,), prepared=True)
+            assert rows == [{"id": 1, "a": 1}]
+            misses = PreparedStatements.info()["misses"]
+
+            await session.execute("ALTER TABLE prepared_test ADD COLUMN b TEXT")
+
+            rows = await session.execute(stmt, (1,), prepared=True)
+            assert rows == [{"id": 1, "a": 1, "b": None}]
+            assert PreparedStatements.info()["misses"] == misses + 1
+        finally:
+            await session.execute("DROP TABLE IF EXISTS prepared_test")
+
+    async def test_prepared_disabled(self, sample_data):
+        """Test maxsize=0 (default) falls back to regular execution."""
+        from dotorm.databases.postgres.prepared import PreparedStatements
+
+        from .models import User
+
+        PreparedStatements.maxsize = 0
+        users = await User.search(fields=["id", "name"])
+        assert len(users) == 2
+        assert PreparedStatements.info()["misses"] == 0
+
+
+# ====================
+# Compact Records Tests
+# ====================
+
+
+class TestCompactSearch:
+    """Tests for search(compact=True)."""
+
+    async def test_search_compact(self, sample_data):
+        """Test compact search returns same data as regular search."""
+        from .models import User
+
+        fields = ["id", "name", "email"]
+        regular = await User.search(fields=fields, sort="id", order="ASC")
+        compact = await User.search(
+            fields=fields, sort="id", order="ASC", compact=True
+        )
+
+        assert [r.json() for r in compact] == [r.json() for r in regular]
+        assert all(isinstance(r, User) for r in compact)
+
+    async def test_search_compact_update(self, sample_data):
+        """Test update() works on compact record."""
+        from .models import User
+
+        users = await User.search(fields=["id", "name"], compact=True)
+        user = users[0]
+        await user.update(User(name="Compact Updated"))
+
+        assert user.name == "Compact Updated"
+        reloaded = await User.get(user.id)
+        assert reloaded.name == "Compact Updated"
+
+
+# ====================
+# Raw Records Tests
+# ====================
+
+
+class TestRawRecordsSearch:
+    """Tests for search(raw="records")."""
+
+    async def test_search_raw_records(self, sample_data):
+        """Test raw records mode returns driver rows without copy."""
+        import asyncpg
+
+        from dotorm.databases.abstract import RawRows
+
+        from .models import User
+
+        result = await User.search(
+            fields=["id", "name"], sort="id", order="ASC", raw="records"
+        )
+
+        assert isinstance(result, RawRows)
+        assert result.columns == ("id", "name")
+        assert all(isinstance(row, asyncpg.Record) for row in result.rows)
+        assert result.rows[0]["name"] == "John Doe"
+        assert result.rows[0][1] == "John Doe"
+
+    async def test_session_fetchraw_empty(self, session, clean_tables):
+        """Test fetchraw on empty result."""
+        columns, rows = await session.execute(
+            "SELECT id, name FROM users WHERE id = %s", (-1,), cursor="fetchraw"
+        )
+
+        assert rows == []
+        assert columns == ()
+
+
+# ====================
+# Columnar Search Tests
+# ====================
+
+
+class TestSearchColumns:
+    """Tests for search_columns."""
+
+    async def test_search_columns_lists(self, sample_data):
+        """Test columns are returned as lists in row order."""
+        from .models import User
+
+        data = await User.search_columns(
+            fields=["name", "email"], sort="id", order="ASC"
+        )
+
+        assert data["name"] == ["John Doe", "Jane Smith"]
+        assert len(data["id"]) == 2
+        assert set(data) == {"id", "name", "email"}
+
+    async def test_search_columns_empty(self, session, clean_tables):
+        """Test empty result keeps requested columns."""
+        from .models import User
+
+        data = await User.search_columns(fields=["name"])
+
+        assert data == {"id": [], "name": []}
+
+    async def test_search_columns_numpy(self, sample_data):
+        """Test numeric columns as NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        from .models import User
+
+        data = await User.search_columns(fields=["name"], numpy=True)
+
+        assert isinstance(data["id"], np.ndarray)
+        assert isinstance(data["name"], list)
+
+
+# ====================
+# JSON Codecs Tests
+# ====================
+
+
+class TestJsonCodecs:
+    """Tests for json/jsonb decoded by asyncpg codecs."""
+
+    async def test_json_decoded_by_driver(self, session, clean_tables):
+        """Test JSON field round-trip through pool with codecs."""
+        import asyncpg
+
+        from dotorm.databases.postgres.codecs import JsonCodecs
+        from dotorm.databases.postgres.session import NoTransactionSession
+
+        from .conftest import (
+            DB_HOST,
+            DB_PASSWORD,
+            DB_PORT,
+            DB_USER,
+            TEST_DB_NAME,
+        )
+        from .models import AllFieldTypes
+
+        json_data = {"key": "value", "nested": {"a": [1, 2]}}
+        pool = await asyncpg.create_pool(
+            host=DB_HOST,
+            port=DB_PORT,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            database=TEST_DB_NAME,
+            min_size=1,
+            max_size=1,
+            init=JsonCodecs.init,
+        )
+        try:
+            codec_session = NoTransactionSession(pool)
+            record_id = await AllFieldTypes.create(
+                AllFieldTypes(json_field=json_data), session=codec_session
+            )
+
+            value = await codec_session.execute(
+                "SELECT json_field FROM all_field_types WHERE id = %s",
+                [record_id],
+                cursor="fetchval",
+            )
+            assert value == json_data
+
+            records = await AllFieldTypes.search(
+                fields=["id", "json_field"], session=codec_session
+            )
+            assert records[0].json_field == json_data
+
+            # JSON string value is decoded once, in search and get
+            # (str payload is written as JSON text as is)
+            string_id = await AllFieldTypes.create(
+                AllFieldTypes(json_field='"42"'), session=codec_session
+            )
+            records = await AllFieldTypes.search(
+                fields=["id", "json_field"],
+                filter=[("id", "=", string_id)],
+                session=codec_session,
+            )
+            record = await AllFieldTypes.get(string_id, session=codec_session)
+            assert records[0].json_field == "42"
+            assert record.json_field == "42"
+
+            # pool without codecs (fixture) is still decoded by the model
+            records = await AllFieldTypes.search(
+                fields=["id", "json_field"], filter=[("id", "=", record_id)]
+            )
+            assert records[0].json_field == json_data
+        finally:
+            await pool.close()
+
+
+# ====================
+# JSON Bytes Search Tests
+# ====================
+
+
+class TestSearchJsonBytes:
+    """Tests for search_json_bytes / dumps_many."""
+
+    async def test_search_json_bytes_matches_json(self, sample_data):
+        """Test bytes decode to the same dicts as json() of search()."""
+        import json
+
+        from .models import Role
+
+        fields = ["id", "name", "model_id"]
+        body = await Role.search_json_bytes(fields=fields, sort="id")
+        records = await Role.search(fields=fields, sort="id")
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == [record.json() for record in records]
+        assert json.loads(body)[0]["model_id"]["name"] == "users"
+
+    async def test_search_json_bytes_empty(self, session, clean_tables):
+        """Test empty result is empty JSON array."""
+        from .models import Role
+
+        assert await Role.search_json_bytes(fields=["id"]) == b"[]"
+
+
+# ====================
+# Per-parent Nested Limit Tests
+# ====================
+
+
+class TestNestedLimit:
+    """Tests for search(nested_limit, nested_sort, nested_order)."""
+
+    async def test_o2m_limit_per_parent(self, sample_data):
+        """Test every role gets its own limited, ordered ACL list."""
+        from .models import AccessList, Role
+
+        for role_id in sample_data["roles"]:
+            for i in range(3):
+                await AccessList.create(
+                    AccessList(name=f"acl_{role_id}_{i}", role_id=role_id)
+                )
+
+        roles = await Role.search(
+            fields=["id", "name", "acl_ids"],
+            nested_limit=2,
+            nested_sort="id",
+            nested_order="DESC",
+        )
+
+        assert len(roles) == 2
+        for role in roles:
+            names = [acl.name for acl in role.acl_ids]
+            assert names == [f"acl_{role.id}_2", f"acl_{role.id}_1"]
+
+    async def test_m2m_limit_per_parent(self, sample_data):
+        """Test every user gets at most nested_limit roles."""
+        from .models import User
+
+        role_field = User.get_fields()["role_ids"]
+        values = [
+            (user_id, role_id)
+            for user_id in sample_data["users"]
+            for role_id in sample_data["roles"]
+        ]
+        await User.link_many2many(role_field, values)
+
+        users = await User.search(
+            fields=["id", "name", "role_ids"], nested_limit=1
+        )
+        assert [len(user.role_ids) for user in users] == [1, 1]
+
+        users = await User.search(
+            fields=["id", "name", "role_ids"], nested_limit=None
+        )
+        assert [len(user.role_ids) for user in users] == [2, 2]
+
+
+# ====================
+# Dotted Nested Paths Tests
+# ====================
+
+
+class TestNestedPaths:
+    """Tests for search(fields=["rel.rel.field"]) multi-level prefetch."""
+
+    async def test_three_levels(self, sample_data):
+        """Test users -> roles -> (model, acl) loaded level by level."""
+        from .models import AccessList, Model, User
+
+        role_ids = sample_data["roles"]
+        for role_id in role_ids:
+            await AccessList.create(
+                AccessList(name=f"acl_{role_id}", role_id=role_id)
+            )
+        role_field = User.get_fields()["role_ids"]
+        await User.link_many2many(
+            role_field,
+            [
+                (user_id, role_id)
+                for user_id in sample_data["users"]
+                for role_id in role_ids
+            ],
+        )
+
+        users = await User.search(
+            fields=[
+                "name",
+                "role_ids.model_id.name",
+                "role_ids.acl_ids.name",
+            ],
+            sort="id",
+            order="ASC",
+        )
+
+        assert len(users) == 2
+        for user in users:
+            assert len(user.role_ids) == 2
+            for role in user.role_ids:
+                # same role under both users is loaded for each copy
+                assert isinstance(role.model_id, Model)
+                assert role.model_id.name == "users"
+                assert [acl.name for acl in role.acl_ids] == [
+                    f"acl_{role.id}"
+                ]
+
+    async def test_path_ending_with_relation(self, sample_data):
+        """Test last segment naming a relation is loaded, not left as id."""
+        from .models import AccessList, Model, User
+
+        role_ids = sample_data["roles"]
+        for role_id in role_ids:
+            await AccessList.create(
+                AccessList(name=f"acl_{role_id}", role_id=role_id)
+            )
+        role_field = User.get_fields()["role_ids"]
+        await User.link_many2many(
+            role_field, [(sample_data["users"][0], role_ids[0])]
+        )
+
+        users = await User.search(
+            fields=["name", "role_ids.model_id", "role_ids.acl_ids"],
+            filter=[("id", "=", sample_data["users"][0])],
+        )
+
+        (role,) = users[0].role_ids
+        assert isinstance(role.model_id, Model)
+        assert [acl.name for acl in role.acl_ids] == [f"acl_{role.id}"]
+
+
+# ====================
+# Nested Projection Tests
+# ====================
+
+
+class TestNestedProjection:
+    """Tests for fields_nested pushed into relation SELECT."""
+
+    async def test_only_requested_columns(self, sample_data):
+        """Test relation records carry only id and requested fields."""
+        from .models import User
+
+        role_field = User.get_fields()["role_ids"]
+        await User.link_many2many(
+            role_field,
+            [(sample_data["users"][0], sample_data["roles"][0])],
+        )
+
+        users = await User.search(
+            fields=["name", "role_ids"],
+            fields_nested={"role_ids": ["name"]},
+            filter=[("id", "=", sample_data["users"][0])],
+        )
+
+        (role,) = users[0].role_ids
+        assert role.name
+        assert "model_id" not in role.__dict__
+        assert "role_id" not in role.__dict__
+
+
+# ====================
+# Many2one JOIN Tests
+# ====================
+
+
+class TestJoinMany2one:
+    """Tests for search(join_m2o=...) single query loading."""
+
+    async def test_join_same_as_batch(self, sample_data):
+        """Test LEFT JOIN gives the same records as batch loading."""
+        from .models import Model, Role
+
+        kwargs = dict(
+            fields=["name", "model_id"],
+            filter=[("name", "in", ["admin", "user"])],
+            sort="id",
+            order="ASC",
+        )
+        batch = await Role.search(**kwargs)
+        joined = await Role.search(**kwargs, join_m2o=True)
+
+        assert [r.id for r in joined] == [r.id for r in batch]
+        for rec, expected in zip(joined, batch):
+            assert isinstance(rec.model_id, Model)
+            assert rec.model_id.id == expected.model_id.id
+            assert rec.model_id.name == expected.model_id.name
+        # одна запись Model на обе роли
+        assert joined[0].model_id is joined[1].model_id
+
+    async def test_join_nested_fields_and_null(self, sample_data):
+        """Test joined columns follow fields_nested, NULL FK -> None."""
+        from .models import Role
+
+        await Role.create(Role(name="orphan"))
+
+        roles = await Role.search(
+            fields=["name", "model_id"],
+            fields_nested={"model_id": ["name"]},
+            sort="id",
+            order="ASC",
+            join_m2o=["model_id"],
+        )
+
+        assert len(roles) == 3
+        assert roles[0].model_id.name == "users"
+        assert roles[2].model_id is None
+
+
+# ====================
+# Get Many Tests
+# ====================
+
+
+class TestGetMany:
+    """Tests for get_many() batched fetch by ids."""
+
+    async def test_input_order_and_missing(self, sample_data):
+        """Test records come in ids order, missing ids skipped."""
+        from .models import User
+
+        user1, user2 = sample_data["users"]
+
+        users = await User.get_many([user2, 999999, user1])
+
+        assert [u.id for u in users] == [user2, user1]
+        assert users[0].name == "Jane Smith"
+
+    async def test_empty_ids(self, sample_data):
+        """Test empty ids make no query."""
+        from .models import User
+
+        assert await User.get_many([]) == []
+
+    async def test_relations_same_as_get(self, sample_data):
+        """Test relations are loaded like get() does."""
+        from .models import Role, User
+
+        role_field = User.get_fields()["role_ids"]
+        await User.link_many2many(
+            role_field,
+            [
+                (user_id, role_id)
+                for user_id in sample_data["users"]
+                for role_id in sample_data["roles"]
+            ],
+        )
+        fields = ["id", "name", "role_ids"]
+        fields_nested = {"role_ids": ["id", "name"]}
+
+        users = await User.get_many(
+            sample_data["users"], fields, fields_nested
+        )
+
+        for user in users:
+            single = await User.get(user.id, fields, fields_nested)
+            assert all(isinstance(r, Role) for r in user.role_ids)
+            assert sorted(r.id for r in user.role_ids) == sorted(
+                r.id for r in single.role_ids
+            )
+
+
+# ====================
+# Batch Get Tests
+# ====================
+
+
+class TestBatchGet:
+    """Tests for __batch_get__ coalescing of concurrent get()."""
+
+    async def test_concurrent_get(self, sample_data, monkeypatch):
+        """Test concurrent get() resolve to the right records."""
+        import asyncio
+
+        from dotorm.exceptions import RecordNotFound
+
+        from .models import User
+
+        monkeypatch.setattr(User, "__batch_get__", True)
+        user1, user2 = sample_data["users"]
+
+        users = await asyncio.gather(User.get(user2), User.get(user1))
+
+        assert [u.id for u in users] == [user2, user1]
+        assert users[0].name == "Jane Smith"
+        assert await User.get_or_none(999999) is None
+        with pytest.raises(RecordNotFound):
+            await User.get(999999)
+
+
+# ====================
+# Polymorphic Batch Tests
+# ====================
+
+
+class TestPolymorphicBatch:
+    """Tests for PolymorphicOne2many loaded by search() in one query."""
+
+    async def test_search_image_ids(self, sample_data):
+        """Test attachments grouped by res_id, other res_model ignored."""
+        from .models import Attachment, User
+
+        user1, user2 = sample_data["users"]
+        for name, res_model, res_id in (
+            ("a.png", "users", user1),
+            ("b.png", "users", user1),
+            ("c.png", "roles", user2),
+        ):
+            await Attachment.create(
+                Attachment(name=name, res_model=res_model, res_id=res_id)
+            )
+
+        users = await User.search(
+            fields=["name", "image_ids"],
+            fields_nested={"image_ids": ["name"]},
+            sort="id",
+            order="ASC",
+        )
+
+        assert [a.name for a in users[0].image_ids] == ["a.png", "b.png"]
+        assert users[1].image_ids == []
+
+
+# ====================
+# Upsert Tests
+# ====================
+
+
+class TestUpsertBulk:
+    """Tests for upsert_bulk() INSERT ... ON CONFLICT."""
+
+    async def test_insert_and_update(self, session, clean_tables):
+        """Test new rows inserted, existing updated, ids of both returned."""
+        from .models import UniqueModel
+
+        existing_id = await UniqueModel.create(
+            UniqueModel(code="A", name="old", category="x")
+        )
+
+        result = await UniqueModel.upsert_bulk(
+            [
+                UniqueModel(code="A", name="new", category="y"),
+                UniqueModel(code="B", name="b", category="y"),
+            ],
+            conflict_fields=["code"],
+            update_fields=["name"],
+        )
+
+        ids = [record["id"] for record in result]
+        assert len(ids) == 2
+        assert existing_id in ids
+        updated = await UniqueModel.get(existing_id)
+        assert updated.name == "new"
+        # category не в update_fields
+        assert updated.category == "x"
+        assert await UniqueModel.search_count() == 2
+
+    async def test_unset_fields_not_overwritten(self, session, clean_tables):
+        """Test update_fields=None updates only fields set in payload."""
+        from .models import UniqueModel
+
+        existing_id = await UniqueModel.create(
+            UniqueModel(code="A", name="old", category="x")
+        )
+
+        await UniqueModel.upsert_bulk(
+            [UniqueModel(code="A", name="new")], conflict_fields=["code"]
+        )
+
+        updated = await UniqueModel.get(existing_id)
+        assert updated.name == "new"
+        assert updated.category == "x"
+
+
+# ====================
+# Update Many Tests
+# ====================
+
+
+class TestUpdateMany:
+    """Tests for update_many() per-row values in one statement."""
+
+    async def test_update_many(self, session, clean_tables):
+        """Test every record gets its own values, others untouched."""
+        from .models import UniqueModel
+
+        ids = [
+            await UniqueModel.create(
+                UniqueModel(code=f"C{i}", name=f"n{i}", category="old")
+            )
+            for i in range(3)
+        ]
+        records = await UniqueModel.get_many(ids[:2])
+        for record in records:
+            record.name = f"{record.name}_new"
+
+        await UniqueModel.update_many(records, ["name"])
+
+        updated = await UniqueModel.get_many(ids)
+        assert [r.name for r in updated] == ["n0_new", "n1_new", "n2"]
+        assert {r.category for r in updated} == {"old"}
+
+
+# ====================
+# M2M Link Tests
+# ====================
+
+
+class TestLinkMany2many:
+    """Tests for single-statement link/unlink of M2M."""
+
+    async def test_link_unlink(self, sample_data):
+        """Test links inserted and deleted in one statement each."""
+        from .models import User
+
+        user_id = sample_data["users"][0]
+        role_ids = sample_data["roles"]
+        role_field = User.get_fields()["role_ids"]
+
+        await User.link_many2many(
+            role_field, [(user_id, role_id) for role_id in role_ids]
+        )
+        user = await User.get(user_id, ["id", "role_ids"], {"role_ids": []})
+        assert sorted(r.id for r in user.role_ids) == sorted(role_ids)
+
+        await User.unlink_many2many(role_field, role_ids[:1])
+        user = await User.get(user_id, ["id", "role_ids"], {"role_ids": []})
+        assert [r.id for r in user.role_ids] == role_ids[1:]
+
+
+# ====================
+# Bulk Chunking Tests
+# ====================
+
+
+class TestBulkChunking:
+    """Tests for bulk operations split by __bulk_max_rows__."""
+
+    async def test_create_and_delete_chunked(
+        self, session, clean_tables, monkeypatch
+    ):
+        """Test chunk results merged, all rows created and deleted."""
+        from .models import Model
+
+        monkeypatch.setattr(Model, "__bulk_max_rows__", 2)
+
+        result = await Model.create_bulk(
+            [Model(name=f"chunk_{i}") for i in range(5)], atomic=True
+        )
+        ids = [record["id"] for record in result]
+        assert len(ids) == 5
+        assert await Model.search_count() == 5
+
+        await Model.delete_bulk(ids, atomic=True)
+        assert await Model.search_count() == 0
+
+    async def test_atomic_rollback(self, session, clean_tables, monkeypatch):
+        """Test failed chunk rolls back earlier chunks with atomic=True."""
+        from .models import UniqueModel
+
+        monkeypatch.setattr(UniqueModel, "__bulk_max_rows__", 1)
+
+        with pytest.raises(Exception):
+            await UniqueModel.create_bulk(
+                [
+                    UniqueModel(code="D", name="a"),
+                    UniqueModel(code="D", name="b"),
+                ],
+                atomic=True,
+            )
+        assert await UniqueModel.search_count() == 0
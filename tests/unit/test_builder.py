@@ -77,7 +77,7 @@ class TestBuilderDelete:
         """Test DELETE query for single record."""
         stmt = self.builder.build_delete()
 
-        assert stmt == "DELETE FROM users WHERE id=%s"
+        assert stmt == "DELETE FROM users WHERE id=$1"
 
     def test_build_delete_bulk(self):
         """Test DELETE query for multiple records."""
@@ -127,7 +127,7 @@ class TestBuilderCreate:
         payload = {"name": "John"}
         stmt, values = self.builder.build_create(payload)
 
-        assert stmt == "INSERT INTO users (name) VALUES (%s)"
+        assert stmt == "INSERT INTO users (name) VALUES ($1)"
         assert values == ("John",)
 
     def test_build_create_multiple_fields(self):
@@ -172,6 +172,100 @@ class TestBuilderCreate:
             "jane@example.com",
         ]
 
+    def _upsert_builder(self):
+        """Builder with real fields (unnest needs sql_type)."""
+        from dotorm import Char, Integer
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import POSTGRES
+
+        fields = {
+            "id": Integer(primary_key=True),
+            "name": Char(max_length=100),
+            "email": Char(max_length=255),
+        }
+        return Builder(table="users", fields=fields, dialect=POSTGRES)
+
+    def test_build_upsert_bulk(self):
+        """Test bulk upsert: unnest INSERT + ON CONFLICT DO UPDATE."""
+        payloads = [
+            {"email": "a@example.com", "name": "A"},
+            {"email": "b@example.com", "name": "B"},
+        ]
+        stmt, values = self._upsert_builder().build_upsert_bulk(
+            payloads, ["email"]
+        )
+
+        assert stmt.startswith("INSERT INTO users (email, name) SELECT * ")
+        assert stmt.endswith(
+            "ON CONFLICT (email) DO UPDATE SET name = EXCLUDED.name"
+        )
+        assert values == [
+            ["a@example.com", "b@example.com"],
+            ["A", "B"],
+        ]
+
+    def test_build_upsert_bulk_no_update_fields(self):
+        """Test empty update_fields still updates (ids of existing rows)."""
+        payloads = [{"email": "a@example.com", "name": "A"}]
+        stmt, _ = self._upsert_builder().build_upsert_bulk(
+            payloads, ["email"], []
+        )
+
+        assert stmt.endswith("DO UPDATE SET email = EXCLUDED.email")
+
+    def test_build_upsert_bulk_mysql(self):
+        """Test MySQL upsert: VALUES + ON DUPLICATE KEY UPDATE."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL
+
+        builder = Builder(table="users", fields=self.fields, dialect=MYSQL)
+        payloads = [{"email": "a@example.com", "name": "A", "active": True}]
+        stmt, values = builder.build_upsert_bulk(
+            payloads, ["email"], ["name"]
+        )
+
+        assert stmt == (
+            "INSERT INTO users (email, name, active) VALUES (%s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE name = VALUES(name)"
+        )
+        assert values == ["a@example.com", "A", True]
+
+    def test_build_upsert_bulk_invalid_fields(self):
+        """Test unknown or missing conflict fields raise ValueError."""
+        payloads = [{"name": "A"}]
+
+        with pytest.raises(ValueError, match="Invalid field"):
+            self.builder.build_upsert_bulk(payloads, ["name; DROP"])
+        with pytest.raises(ValueError, match="not in payload"):
+            self.builder.build_upsert_bulk(payloads, ["email"])
+
+    def test_build_upsert_bulk_update_field_not_in_payload(self):
+        """Test update fields must be inserted columns."""
+        payloads = [{"email": "a@example.com"}]
+
+        with pytest.raises(ValueError, match="Update field name"):
+            self.builder.build_upsert_bulk(payloads, ["email"], ["name"])
+
+    def test_build_upsert_bulk_different_fields(self):
+        """Test payloads with different sets of fields are rejected."""
+        payloads = [
+            {"email": "a@example.com", "name": "A"},
+            {"email": "b@example.com"},
+        ]
+
+        with pytest.raises(ValueError, match="same fields"):
+            self.builder.build_upsert_bulk(payloads, ["email"])
+
+    def test_build_reserve_ids(self):
+        """Test ids reserved from serial sequence for COPY insert."""
+        stmt, values = self.builder.build_reserve_ids(3)
+
+        assert stmt == (
+            "SELECT nextval(pg_get_serial_sequence('users', 'id')) "
+            "AS id FROM generate_series(1, $1)"
+        )
+        assert values == [3]
+
 
 @pytest.mark.unit
 class TestBuilderUpdate:
@@ -199,7 +293,7 @@ class TestBuilderUpdate:
         payload = {"name": "John Updated"}
         stmt, values = self.builder.build_update(payload, id=1)
 
-        assert stmt == "UPDATE users SET name=%s WHERE id = %s"
+        assert stmt == "UPDATE users SET name=$1 WHERE id = $2"
         assert values == ("John Updated", 1)
 
     def test_build_update_multiple_fields(self):
@@ -208,9 +302,9 @@ class TestBuilderUpdate:
         stmt, values = self.builder.build_update(payload, id=42)
 
         assert "UPDATE users SET" in stmt
-        assert "name=%s" in stmt
-        assert "email=%s" in stmt
-        assert "WHERE id = %s" in stmt
+        assert "name=$1" in stmt
+        assert "email=$2" in stmt
+        assert "WHERE id = $3" in stmt
         assert values[-1] == 42  # ID is last
 
     def test_build_update_empty_raises(self):
@@ -223,9 +317,56 @@ class TestBuilderUpdate:
         payload = {"active": False}
         stmt, values = self.builder.build_update_bulk(payload, ids=[1, 2, 3])
 
-        assert "UPDATE users SET active=%s" in stmt
-        assert "WHERE id IN (%s, %s, %s)" in stmt
-        assert values == (False, 1, 2, 3)
+        assert "UPDATE users SET active=$1" in stmt
+        assert "WHERE id = ANY($2::int[])" in stmt
+        assert values == (False, [1, 2, 3])
+
+    def test_build_update_many(self):
+        """Test per-row UPDATE via unnest column arrays."""
+        from dotorm import Boolean, Char, Integer
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import POSTGRES
+
+        fields = {
+            "id": Integer(primary_key=True),
+            "name": Char(max_length=100),
+            "active": Boolean(),
+        }
+        builder = Builder(table="users", fields=fields, dialect=POSTGRES)
+        rows = [[1, "a", True], [2, "b", False]]
+
+        stmt, values = builder.build_update_many(rows, ["name", "active"])
+
+        assert stmt == (
+            "UPDATE users AS t SET name = v.name, active = v.active "
+            "FROM unnest($1::int4[], $2::text[], $3::bool[]) "
+            "AS v(id, name, active) WHERE t.id = v.id"
+        )
+        assert values == [[1, 2], ["a", "b"], [True, False]]
+
+    def test_build_update_many_mysql(self):
+        """Test MySQL per-row UPDATE via CASE."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL
+
+        builder = Builder(table="users", fields=self.fields, dialect=MYSQL)
+
+        stmt, values = builder.build_update_many(
+            [[1, "a"], [2, "b"]], ["name"]
+        )
+
+        assert stmt == (
+            "UPDATE users SET name = CASE id WHEN %s THEN %s "
+            "WHEN %s THEN %s END WHERE id IN (%s, %s)"
+        )
+        assert values == [1, "a", 2, "b", 1, 2]
+
+    def test_build_update_many_invalid_field(self):
+        """Test id and unknown fields are rejected."""
+        with pytest.raises(ValueError, match="Invalid field"):
+            self.builder.build_update_many([[1, 2]], ["id"])
+        with pytest.raises(ValueError, match="Invalid field"):
+            self.builder.build_update_many([[1, "x"]], ["missing"])
 
 
 @pytest.mark.unit
@@ -259,7 +400,7 @@ class TestBuilderGet:
         assert '"email"' in stmt
         assert '"computed"' not in stmt  # Not stored
         assert "FROM users" in stmt
-        assert "WHERE id = %s" in stmt
+        assert "WHERE id = $1" in stmt
         assert "LIMIT 1" in stmt
         assert values == [1]
 
@@ -279,6 +420,26 @@ class TestBuilderGet:
         assert 'SELECT "name" FROM users' in stmt
         assert values == [99]
 
+    def test_build_get_many(self):
+        """Test SELECT by several IDs with single array param."""
+        stmt, values = self.builder.build_get_many([3, 1, 2], ["id", "name"])
+
+        assert stmt == (
+            'SELECT "id", "name" FROM users WHERE id = ANY($1::int[])'
+        )
+        assert values == [[3, 1, 2]]
+
+    def test_build_get_many_mysql(self):
+        """Test MySQL SELECT by several IDs with IN placeholders."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL
+
+        builder = Builder(table="users", fields=self.fields, dialect=MYSQL)
+        stmt, values = builder.build_get_many([3, 1], ["id"])
+
+        assert stmt == "SELECT `id` FROM users WHERE id IN (%s, %s)"
+        assert values == [3, 1]
+
     def test_build_table_len(self):
         """Test COUNT query."""
         stmt, values = self.builder.build_table_len()
@@ -337,14 +498,14 @@ class TestBuilderSearch:
         """Test search with custom limit."""
         stmt, values = self.builder.build_search(limit=10)
 
-        assert "LIMIT %s" in stmt
+        assert "LIMIT $1" in stmt
         assert values == (10,)
 
     def test_build_search_with_pagination(self):
         """Test search with start/end pagination."""
         stmt, values = self.builder.build_search(start=20, end=40)
 
-        assert "LIMIT %s OFFSET %s" in stmt
+        assert "LIMIT $1 OFFSET $2" in stmt
         assert values == (20, 20)  # (end-start, start)
 
     def test_build_search_order_asc(self):
@@ -385,7 +546,7 @@ class TestBuilderSearch:
 
         assert "WHERE" in stmt
         assert '"active"' in stmt
-        assert "= %s" in stmt
+        assert '"active" = $1' in stmt
         # values содержит filter value + limit
         assert True in values
 
@@ -397,10 +558,8 @@ class TestBuilderSearch:
         )
 
         assert "WHERE" in stmt
-        assert "IN" in stmt
-        assert 1 in values
-        assert 2 in values
-        assert 3 in values
+        assert '"id" = ANY($1)' in stmt
+        assert values[0] == [1, 2, 3]
 
     def test_build_search_excludes_non_stored(self):
         """Test that non-stored fields are excluded."""
@@ -441,6 +600,203 @@ class TestBuilderDialects:
 
         assert "`name`" in stmt
 
+    def test_mysql_keeps_percent_placeholders(self):
+        """Test MySQL statements keep %s, Postgres gets $N."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL
+
+        fields = {"id": MockField(), "name": MockField()}
+        builder = Builder(table="users", fields=fields, dialect=MYSQL)
+
+        stmt, _ = builder.build_update({"name": "x"}, id=1)
+        assert stmt == "UPDATE users SET name=%s WHERE id = %s"
+
+        stmt, values = builder.build_search(
+            fields=["name"], filter=[("name", "=", "x")], limit=5
+        )
+        assert "`name` = %s" in stmt
+        assert "LIMIT %s" in stmt
+        assert values == ("x", 5)
+
+
+    def test_many2many_multiple_dialects(self):
+        """Test M2M batch uses ANY array on Postgres, IN on MySQL."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL, POSTGRES
+
+        class Role:
+            __table__ = "roles"
+
+            @classmethod
+            def get_store_fields(cls):
+                return ["id", "name"]
+
+        fields = {"id": MockField(), "name": MockField()}
+        kwargs = dict(
+            ids=[1, 2, 3],
+            relation_table=Role,
+            many2many_table="user_roles",
+            column1="role_id",
+            column2="user_id",
+            fields=["id", "name"],
+        )
+
+        pg = Builder(table="users", fields=fields, dialect=POSTGRES)
+        stmt, values = pg.build_get_many2many_multiple(**kwargs)
+        assert "pt.user_id = ANY($1)" in stmt
+        assert "rn <= $2" in stmt
+        assert values == ([1, 2, 3], 80)
+
+        my = Builder(table="users", fields=fields, dialect=MYSQL)
+        stmt, values = my.build_get_many2many_multiple(**kwargs)
+        assert "pt.user_id IN (%s, %s, %s)" in stmt
+        assert values == (1, 2, 3, 80)
+
+    def test_many2many_multiple_limit_per_parent(self):
+        """Test M2M batch limits and orders children of each parent."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import POSTGRES
+
+        class Role:
+            __table__ = "roles"
+
+            @classmethod
+            def get_store_fields(cls):
+                return ["id", "name"]
+
+        builder = Builder(
+            table="users",
+            fields={"id": MockField(), "name": MockField()},
+            dialect=POSTGRES,
+        )
+        kwargs = dict(
+            ids=[1, 2],
+            relation_table=Role,
+            many2many_table="user_roles",
+            column1="role_id",
+            column2="user_id",
+            fields=["id", "name"],
+        )
+
+        stmt, values = builder.build_get_many2many_multiple(
+            **kwargs, limit=5, sort="name", order="desc"
+        )
+        assert (
+            "ROW_NUMBER() OVER (\n"
+            "                    PARTITION BY pt.user_id ORDER BY p.name DESC"
+        ) in stmt
+        assert "ORDER BY m2m_id, rn" in stmt
+        assert values == ([1, 2], 5)
+
+        # без лимита - без оконной функции
+        stmt, values = builder.build_get_many2many_multiple(
+            **kwargs, limit=None, sort="unknown"
+        )
+        assert "ROW_NUMBER" not in stmt
+        assert "ORDER BY pt.user_id, p.id ASC" in stmt
+        assert values == ([1, 2],)
+
+    def test_one2many_multiple_limit_per_parent(self):
+        """Test O2M batch limits children per parent (FK partition)."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL, POSTGRES
+
+        fields = {
+            "id": MockField(),
+            "name": MockField(),
+            "user_id": MockField(),
+        }
+        pg = Builder(table="orders", fields=fields, dialect=POSTGRES)
+
+        stmt, values = pg.build_search_one2many_multiple(
+            ids=[1, 2], relation_field="user_id", fields=["name"], limit=3
+        )
+        assert stmt == (
+            'SELECT "id", "name", "user_id" FROM ('
+            'SELECT "id", "name", "user_id", ROW_NUMBER() OVER ('
+            'PARTITION BY "user_id" ORDER BY "id" ASC) AS rn '
+            'FROM orders WHERE "user_id" = ANY($1)'
+            ') sub WHERE rn <= $2 ORDER BY "user_id", rn'
+        )
+        assert values == ([1, 2], 3)
+
+        my = Builder(table="orders", fields=fields, dialect=MYSQL)
+        stmt, values = my.build_search_one2many_multiple(
+            ids=[1, 2], relation_field="user_id", fields=["name"], limit=None
+        )
+        assert "ROW_NUMBER" not in stmt
+        assert stmt.endswith("ORDER BY `user_id`, `id` ASC")
+        assert values == (1, 2)
+
+    def test_polymorphic_one2many_multiple(self):
+        """Test polymorphic batch filters by res_model and res_id."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import POSTGRES
+
+        fields = {
+            "id": MockField(),
+            "res_model": MockField(),
+            "res_id": MockField(),
+        }
+        pg = Builder(table="attachments", fields=fields, dialect=POSTGRES)
+
+        stmt, values = pg.build_search_one2many_multiple(
+            ids=[1, 2],
+            relation_field="res_id",
+            fields=["id"],
+            limit=None,
+            res_model="users",
+        )
+        assert 'WHERE "res_model" = $1 AND "res_id" = ANY($2)' in stmt
+        assert values == ("users", [1, 2])
+
+    def test_link_many2many_dialects(self):
+        """Test M2M link: one unnest INSERT (PG), executemany rows (MySQL)."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL, POSTGRES
+
+        fields = {"id": MockField()}
+        links = [(1, 10), (1, 11), (2, 10)]
+
+        pg = Builder(table="users", fields=fields, dialect=POSTGRES)
+        stmt, values = pg.build_link_many2many(
+            "user_role", "role_id", "user_id", links, ignore_conflicts=True
+        )
+        assert stmt == (
+            "INSERT INTO user_role (user_id, role_id) "
+            "SELECT * FROM unnest($1::int[], $2::int[]) "
+            "ON CONFLICT DO NOTHING"
+        )
+        assert values == [[1, 1, 2], [10, 11, 10]]
+
+        my = Builder(table="users", fields=fields, dialect=MYSQL)
+        stmt, values = my.build_link_many2many(
+            "user_role", "role_id", "user_id", links
+        )
+        assert stmt == (
+            "INSERT INTO user_role (user_id, role_id) VALUES (%s, %s)"
+        )
+        assert values == links
+
+    def test_unlink_many2many_dialects(self):
+        """Test M2M unlink: = ANY (PG), IN (MySQL)."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL, POSTGRES
+
+        fields = {"id": MockField()}
+
+        pg = Builder(table="users", fields=fields, dialect=POSTGRES)
+        assert pg.build_unlink_many2many("user_role", "role_id", [10, 11]) == (
+            "DELETE FROM user_role WHERE role_id = ANY($1::int[])",
+            [[10, 11]],
+        )
+
+        my = Builder(table="users", fields=fields, dialect=MYSQL)
+        assert my.build_unlink_many2many("user_role", "role_id", [10, 11]) == (
+            "DELETE FROM user_role WHERE role_id IN (%s, %s)",
+            [10, 11],
+        )
+
 
 @pytest.mark.unit
 class TestBuilderGetStoreFields:
@@ -541,3 +897,117 @@ class TestBuilderHelpers:
             build_sql_update_from_schema(
                 "UPDATE test SET %s WHERE id = %s", {}, 1
             )
+
+
+@pytest.mark.unit
+class TestBuilderStatementCache:
+    """Tests for search statement cache."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import POSTGRES
+
+        self.fields = {
+            "id": MockField(store=True, primary_key=True),
+            "name": MockField(store=True),
+            "active": MockField(store=True),
+        }
+        self.builder = Builder(
+            table="users",
+            fields=self.fields,
+            dialect=POSTGRES,
+        )
+
+    def test_same_shape_hits_cache(self):
+        """Test same query shape reuses SQL and re-binds values."""
+        stmt1, values1 = self.builder.build_search(
+            fields=["id", "name"],
+            filter=[("active", "=", True)],
+            limit=10,
+        )
+        stmt2, values2 = self.builder.build_search(
+            fields=["id", "name"],
+            filter=[("active", "=", False)],
+            limit=20,
+        )
+
+        assert stmt1 is stmt2
+        assert values1 == (True, 10)
+        assert values2 == (False, 20)
+        info = self.builder.statement_cache.info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+    def test_different_shape_misses_cache(self):
+        """Test different filter shape builds new statement."""
+        stmt1, _ = self.builder.build_search(filter=[("id", "in", [1, 2])])
+        stmt2, _ = self.builder.build_search(filter=[("id", "not in", [1])])
+        stmt3, _ = self.builder.build_search(filter=[("name", "=", None)])
+
+        assert stmt1 != stmt2
+        assert "IS NULL" in stmt3
+        assert self.builder.statement_cache.info()["misses"] == 3
+
+    def test_pagination_mode_in_key(self):
+        """Test LIMIT and LIMIT/OFFSET shapes are cached separately."""
+        stmt1, values1 = self.builder.build_search(limit=10)
+        stmt2, values2 = self.builder.build_search(start=10, end=30)
+
+        assert "OFFSET" not in stmt1
+        assert "OFFSET" in stmt2
+        assert values1 == (10,)
+        assert values2 == (20, 10)
+
+    def test_lru_eviction(self):
+        """Test least recently used statement is evicted."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import POSTGRES
+
+        builder = Builder(
+            table="users", fields=self.fields, dialect=POSTGRES, cache_size=2
+        )
+        builder.build_search(fields=["id"])
+        builder.build_search(fields=["name"])
+        builder.build_search(fields=["id"])
+        builder.build_search(fields=["active"])
+
+        assert len(builder.statement_cache) == 2
+        builder.build_search(fields=["name"])
+        assert builder.statement_cache.info()["misses"] == 4
+
+    def test_cache_disabled(self):
+        """Test cache_size=0 disables caching."""
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import POSTGRES
+
+        builder = Builder(
+            table="users", fields=self.fields, dialect=POSTGRES, cache_size=0
+        )
+        builder.build_search(fields=["id"])
+        builder.build_search(fields=["id"])
+
+        assert len(builder.statement_cache) == 0
+        assert builder.statement_cache.info()["hits"] == 0
+
+    def test_invalid_order_not_cached(self):
+        """Test invalid order raises on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid order"):
+                self.builder.build_search(order="INVALID")
+
+    def test_count_and_exists_cached(self):
+        """Test COUNT and EXISTS statements are cached by filter shape."""
+        stmt1, values1 = self.builder.build_search_count(
+            [("active", "=", True)]
+        )
+        stmt2, values2 = self.builder.build_search_count(
+            [("active", "=", False)]
+        )
+        stmt3, _ = self.builder.build_exists([("active", "=", True)])
+
+        assert stmt1 is stmt2
+        assert values1 == (True,)
+        assert values2 == (False,)
+        assert stmt3.startswith("SELECT 1 FROM users")
+        assert self.builder.statement_cache.info()["hits"] == 1
@@ -102,11 +102,11 @@ class TestFilterParserInOperators:
         self.parser = FilterParser(POSTGRES)
 
     def test_in_operator_list(self):
-        """Test IN operator with list."""
+        """Test IN operator binds list as single array param."""
         clause, values = self.parser.parse(("id", "in", [1, 2, 3]))
 
-        assert clause == '"id" IN (%s, %s, %s)'
-        assert values == (1, 2, 3)
+        assert clause == '"id" = ANY(%s)'
+        assert values == ([1, 2, 3],)
 
     def test_in_operator_tuple(self):
         """Test IN operator with tuple."""
@@ -114,8 +114,8 @@ class TestFilterParserInOperators:
             ("status", "in", ("active", "pending"))
         )
 
-        assert clause == '"status" IN (%s, %s)'
-        assert values == ("active", "pending")
+        assert clause == '"status" = ANY(%s)'
+        assert values == (["active", "pending"],)
 
     def test_not_in_operator(self):
         """Test NOT IN operator."""
@@ -123,24 +123,47 @@ class TestFilterParserInOperators:
             ("role", "not in", ["admin", "guest"])
         )
 
-        assert clause == '"role" NOT IN (%s, %s)'
-        assert values == ("admin", "guest")
+        assert clause == '"role" <> ALL(%s)'
+        assert values == (["admin", "guest"],)
 
     def test_in_single_value(self):
         """Test IN with single value."""
         clause, values = self.parser.parse(("id", "in", [42]))
 
-        assert clause == '"id" IN (%s)'
-        assert values == (42,)
+        assert clause == '"id" = ANY(%s)'
+        assert values == ([42],)
 
     def test_in_many_values(self):
-        """Test IN with many values."""
+        """Test IN clause does not depend on list length."""
         ids = list(range(10))
         clause, values = self.parser.parse(("id", "in", ids))
+        clause2, _ = self.parser.parse(("id", "in", ids[:3]))
+
+        assert clause == clause2 == '"id" = ANY(%s)'
+        assert values == (ids,)
 
-        placeholders = ", ".join(["%s"] * 10)
-        assert clause == f'"id" IN ({placeholders})'
-        assert values == tuple(ids)
+    def test_in_array_cast_from_field_type(self):
+        """Test array type is taken from field sql_type."""
+        from dotorm.components.dialect import POSTGRES
+        from dotorm.components.filter_parser import FilterParser
+        from dotorm.fields import BigInteger, Char, Integer
+
+        parser = FilterParser(
+            POSTGRES,
+            fields={
+                "id": Integer(primary_key=True),
+                "big": BigInteger(),
+                "name": Char(),
+            },
+        )
+
+        assert parser.parse(("id", "in", [1]))[0] == '"id" = ANY(%s::int4[])'
+        assert parser.parse(("big", "in", [1]))[0] == (
+            '"big" = ANY(%s::int8[])'
+        )
+        assert parser.parse(("name", "not in", ["a"]))[0] == (
+            '"name" <> ALL(%s::text[])'
+        )
 
     def test_in_non_list_raises(self):
         """Test IN with non-list value raises error."""
@@ -302,8 +325,8 @@ class TestFilterParserNotExpression:
         """Test NOT with IN expression."""
         clause, values = self.parser.parse(("not", ("id", "in", [1, 2, 3])))
 
-        assert clause == 'NOT ("id" IN (%s, %s, %s))'
-        assert values == (1, 2, 3)
+        assert clause == 'NOT ("id" = ANY(%s))'
+        assert values == ([1, 2, 3],)
 
 
 @pytest.mark.unit
@@ -470,8 +493,8 @@ class TestFilterParserEdgeCases:
         """Test IN with empty list."""
         clause, values = self.parser.parse(("id", "in", []))
 
-        assert clause == '"id" IN ()'
-        assert values == ()
+        assert clause == '"id" = ANY(%s)'
+        assert values == ([],)
 
     def test_field_with_special_chars(self):
         """Test field name is properly escaped."""
@@ -504,6 +527,20 @@ class TestFilterParserDialects:
 
         assert "`name`" in clause
 
+    def test_mysql_in_operators(self):
+        """Test MySQL keeps IN (...) with one placeholder per element."""
+        from dotorm.components.dialect import MYSQL
+        from dotorm.components.filter_parser import FilterParser
+
+        parser = FilterParser(MYSQL)
+        clause, values = parser.parse(("id", "in", [1, 2, 3]))
+        not_clause, not_values = parser.parse(("role", "not in", ["a"]))
+
+        assert clause == "`id` IN (%s, %s, %s)"
+        assert values == (1, 2, 3)
+        assert not_clause == "`role` NOT IN (%s)"
+        assert not_values == ("a",)
+
 
 @pytest.mark.unit
 class TestFilterParserCompatibility:
@@ -582,3 +619,164 @@ class TestFilterParserIsTriplet:
         """Test invalid triplet that is not a sequence."""
         assert self.parser._is_triplet("not a triplet") is False
         assert self.parser._is_triplet(123) is False
+
+
+@pytest.mark.unit
+class TestFilterParserSignature:
+    """Tests for filter shape/values split."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        from dotorm.components.dialect import POSTGRES
+        from dotorm.components.filter_parser import FilterParser
+
+        self.parser = FilterParser(POSTGRES)
+
+    def test_values_match_parse(self):
+        """Test signature values are in the same order as parse values."""
+        expr = [
+            ("name", "ilike", "john"),
+            "or",
+            [("age", "between", [18, 30]), ("id", "in", [1, 2, 3])],
+            ("not", [("deleted_at", "=", None)]),
+        ]
+        _, values = self.parser.signature(expr)
+        _, parse_values = self.parser.parse(expr)
+
+        assert values == parse_values
+
+    def test_same_shape_different_values(self):
+        """Test shape does not depend on values."""
+        shape1, _ = self.parser.signature([("active", "=", True)])
+        shape2, _ = self.parser.signature([("active", "=", False)])
+
+        assert shape1 == shape2
+
+    def test_shape_ignores_list_arity_postgres(self):
+        """Test IN list length is not part of the Postgres shape."""
+        shape1, _ = self.parser.signature([("id", "in", [1, 2])])
+        shape2, _ = self.parser.signature([("id", "in", [1, 2, 3])])
+
+        assert shape1 == shape2
+
+    def test_shape_depends_on_list_arity_mysql(self):
+        """Test IN list length is part of the MySQL shape."""
+        from dotorm.components.dialect import MYSQL
+        from dotorm.components.filter_parser import FilterParser
+
+        parser = FilterParser(MYSQL)
+        shape1, _ = parser.signature([("id", "in", [1, 2])])
+        shape2, _ = parser.signature([("id", "in", [1, 2, 3])])
+
+        assert shape1 != shape2
+
+    def test_shape_depends_on_none(self):
+        """Test None value (IS NULL) differs from regular value."""
+        shape1, _ = self.parser.signature([("name", "=", None)])
+        shape2, _ = self.parser.signature([("name", "=", "x")])
+
+        assert shape1 != shape2
+
+    def test_invalid_filter_raises(self):
+        """Test signature validates like parse."""
+        with pytest.raises(ValueError, match="Unsupported operator"):
+            self.parser.signature(("name", "unknown", 1))
+        with pytest.raises(ValueError, match="requires list"):
+            self.parser.signature(("id", "in", 1))
+
+    def test_cached_shape_skips_walk(self):
+        """Test repeated filter shape does not walk the expression again."""
+        from unittest.mock import patch
+
+        expected, _ = self.parser.signature(
+            [("active", "=", True), ("id", "in", [1])]
+        )
+        with patch.object(self.parser, "_signature") as walk:
+            shape, values = self.parser.signature(
+                [("active", "=", False), ("id", "in", [2, 3])]
+            )
+
+        walk.assert_not_called()
+        assert shape == expected
+        assert values == (False, [2, 3])
+
+    @pytest.mark.parametrize("dialect", ["POSTGRES", "MYSQL"])
+    def test_cached_values_match_walk(self, dialect):
+        """Test values extracted for cached shape equal uncached ones."""
+        from dotorm.components import dialect as dialects
+        from dotorm.components.filter_parser import FilterParser
+
+        parser = FilterParser(getattr(dialects, dialect))
+
+        def expr(n):
+            return [
+                ("name", "ILIKE", f"jo{n}"),
+                "or",
+                [("age", "between", (n, n + 10)), ("id", "not in", [n, 7])],
+                ("not", [("deleted_at", "=", None)]),
+                ("email", "is not null", None),
+            ]
+
+        parser.signature(expr(1))
+        assert parser.signature(expr(2)) == parser._walk(expr(2))
+        assert parser._shapes.info()["hits"] == 1
+
+    def test_invalid_value_after_cached_shape(self):
+        """Test cached shape does not accept value of another kind."""
+        self.parser.signature([("id", "in", [1])])
+
+        with pytest.raises(ValueError, match="requires list"):
+            self.parser.signature([("id", "in", "1")])
+
+
+@pytest.mark.unit
+class TestFilterParserCompile:
+    """Tests for compiled filter templates."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        from dotorm.components.dialect import POSTGRES
+        from dotorm.components.filter_parser import FilterParser
+
+        self.parser = FilterParser(POSTGRES)
+
+    def test_template_reused_for_same_shape(self):
+        """Test repeated shape returns the same compiled template."""
+        compiled1, values1 = self.parser.compile([("id", "in", [1, 2])])
+        compiled2, values2 = self.parser.compile([("id", "in", [3, 4, 5])])
+
+        assert compiled1 is compiled2
+        assert compiled1.clause == '"id" = ANY(%s)'
+        assert values1 == ([1, 2],)
+        assert values2 == ([3, 4, 5],)
+        assert self.parser._templates.info()["hits"] == 1
+
+    def test_compile_matches_parse(self):
+        """Test compiled clause is identical to parse output."""
+        filter_expr = [
+            ("not", [("status", "=", "deleted")]),
+            ("name", "ilike", "jo"),
+            "or",
+            [("age", "between", [18, 65]), ("email", "is not null", None)],
+        ]
+        compiled, values = self.parser.compile(filter_expr)
+        clause, parse_values = self.parser.parse(filter_expr)
+
+        assert compiled.clause == clause
+        assert values == parse_values
+        assert clause == (
+            '(NOT ("status" = %s)) AND "name" ILIKE %s OR '
+            '("age" BETWEEN %s AND %s AND "email" IS NOT NULL)'
+        )
+
+    def test_cache_disabled(self):
+        """Test cache_size=0 renders every time with same result."""
+        from dotorm.components.dialect import POSTGRES
+        from dotorm.components.filter_parser import FilterParser
+
+        parser = FilterParser(POSTGRES, cache_size=0)
+        clause1, _ = parser.parse([("name", "=", None)])
+        clause2, _ = parser.parse([("name", "=", None)])
+
+        assert clause1 == clause2 == '"name" IS NULL'
+        assert len(parser._templates) == 0
@@ -0,0 +1,889 @@
+"""
+Unit tests for DotModel (deserialization, serialization).
+
+These tests work without database connection.
+Run with: pytest tests/unit/test_model.py -v
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from dotorm import (
+    Boolean,
+    Char,
+    DotModel,
+    Integer,
+    JSONField,
+    Many2many,
+    Many2one,
+    One2many,
+    One2one,
+    PolymorphicOne2many,
+)
+from dotorm.databases.postgres.codecs import JsonCodecs
+from dotorm.decorators import depends
+from dotorm.model import JsonMode
+
+
+class Role(DotModel):
+    __table__ = "unit_roles"
+
+    id: int = Integer(primary_key=True)
+    name: str = Char(max_length=100)
+
+
+class User(DotModel):
+    __table__ = "unit_users"
+
+    id: int = Integer(primary_key=True)
+    name: str = Char(max_length=100)
+    active: bool = Boolean(default=True)
+    settings: dict = JSONField()
+    role_id: Role = Many2one(lambda: Role)
+    role_ids: list[Role] = Many2many(
+        relation_table=lambda: Role,
+        many2many_table="unit_user_roles",
+        column1="user_id",
+        column2="role_id",
+    )
+
+
+@pytest.mark.unit
+class TestCompactRecords:
+    """Tests for prepare_list_compact (search(compact=True))."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.rows = [
+            {"id": 1, "name": "John", "active": True, "settings": '{"a": 1}'},
+            {"id": 2, "name": "Jane", "active": False, "settings": None},
+        ]
+
+    def test_compact_is_model_instance(self):
+        """Test compact records behave like model for attributes."""
+        records = User.prepare_list_compact(self.rows)
+
+        assert len(records) == 2
+        assert isinstance(records[0], User)
+        assert records[0].id == 1
+        assert records[1].name == "Jane"
+        # JSON string decoded like in regular __init__
+        assert records[0].settings == {"a": 1}
+
+    def test_compact_uses_slots(self):
+        """Test values are stored in slots, not in instance __dict__."""
+        record = User.prepare_list_compact(self.rows)[0]
+
+        assert "name" in type(record).__slots__
+        assert "name" not in record.__dict__
+
+    def test_compact_class_cached(self):
+        """Test one generated class per set of columns."""
+        first = User.prepare_list_compact(self.rows)[0]
+        second = User.prepare_list_compact(self.rows)[0]
+        other = User.prepare_list_compact([{"id": 3, "name": "X"}])[0]
+
+        assert type(first) is type(second)
+        assert type(first) is not type(other)
+
+    def test_compact_json_matches_regular(self):
+        """Test json() output is identical to regular records."""
+        compact = User.prepare_list_compact(self.rows, ("role_id",))
+        regular = [User(**row) for row in self.rows]
+
+        for c, r in zip(compact, regular):
+            assert c.json() == r.json()
+            assert c.json(exclude_unset=True) == r.json(exclude_unset=True)
+
+    def test_compact_relation_slot_assignable(self):
+        """Test relation fields from extra can be set after load."""
+        record = User.prepare_list_compact(self.rows, ("role_id",))[0]
+        record.role_id = Role(id=5, name="admin")
+
+        assert record.json()["role_id"] == {"id": 5, "name": "admin"}
+
+    def test_compact_empty_rows(self):
+        """Test empty result."""
+        assert User.prepare_list_compact([]) == []
+
+
+class _Connection:
+    """Stand-in for asyncpg connection (set_type_codec only)."""
+
+    def __init__(self):
+        self.codecs = []
+
+    async def set_type_codec(self, typename, **kwargs):
+        self.codecs.append((typename, kwargs["format"]))
+
+
+@pytest.mark.unit
+class TestJsonCodecs:
+    """Tests for json/jsonb decoded by asyncpg codecs (JsonCodecs)."""
+
+    def setup_method(self):
+        """Simulate pool connection with codecs installed."""
+        self.conn = _Connection()
+        asyncio.run(JsonCodecs.init(self.conn))
+
+    def test_init_installs_on_connection(self):
+        """Test codecs are tracked per connection, not globally."""
+        assert self.conn.codecs == [("json", "binary"), ("jsonb", "binary")]
+        assert JsonCodecs.installed_on(self.conn)
+        assert not JsonCodecs.installed_on(_Connection())
+
+    def test_installed_on_pool_proxy(self):
+        """Test pool proxy is resolved to its connection."""
+
+        class Proxy:
+            _con = self.conn
+
+        assert JsonCodecs.installed_on(Proxy())
+
+    def test_fast_path_with_json_fields(self):
+        """Test JSON model skips __init__ when driver decodes JSON."""
+        rows = [{"id": 1, "name": "John", "settings": {"a": 1}}]
+
+        with patch.object(User, "__init__") as init:
+            records = JsonCodecs.prepare(self.conn, User.prepare_list_ids, rows)
+
+        init.assert_not_called()
+        assert records[0].settings == {"a": 1}
+
+    def test_slow_path_without_codecs(self):
+        """Test JSON strings are still decoded without codecs."""
+        records = JsonCodecs.prepare(
+            _Connection(),
+            User.prepare_list_ids,
+            [{"id": 1, "settings": '{"a": 1}'}],
+        )
+
+        assert records[0].settings == {"a": 1}
+        assert not JsonCodecs.decoded()
+
+    def test_form_no_double_decode(self):
+        """Test driver-decoded JSON string is not decoded again."""
+        rows = [{"id": 1, "settings": "42"}]
+
+        record = JsonCodecs.prepare(self.conn, User.prepare_form_id, rows)
+        records = JsonCodecs.prepare(self.conn, User.prepare_list_ids, rows)
+
+        assert record.settings == "42"
+        assert records[0].settings == "42"
+
+    def test_compact_skips_json_decode(self):
+        """Test compact records keep driver-decoded values as is."""
+        records = JsonCodecs.prepare(
+            self.conn,
+            User.prepare_list_compact,
+            [{"id": 1, "settings": '"text"'}],
+        )
+
+        # already decoded by driver: JSON string value stays str
+        assert records[0].settings == '"text"'
+
+    def test_encode_passes_serialized_json(self):
+        """Test encoder keeps JSON text from get_json(only_store=True)."""
+        assert JsonCodecs.encode('{"a": 1}') == '{"a": 1}'
+        assert json.loads(JsonCodecs.encode({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_decode(self):
+        """Test decoder returns Python objects."""
+        assert JsonCodecs.decode('{"a": [1, null]}') == {"a": [1, None]}
+
+    def test_binary_round_trip(self):
+        """Test binary json/jsonb codecs (used by COPY)."""
+        assert JsonCodecs.encode_json('{"a": 1}') == b'{"a": 1}'
+        assert JsonCodecs.encode_jsonb({"a": 1})[:1] == b"\x01"
+        assert JsonCodecs.decode(b'{"a": 1}') == {"a": 1}
+        data = JsonCodecs.encode_jsonb([1, "x"])
+        assert JsonCodecs.decode_jsonb(data) == [1, "x"]
+
+    def test_decode_jsonb_unknown_version(self):
+        """Test unknown jsonb binary version is rejected."""
+        with pytest.raises(ValueError):
+            JsonCodecs.decode_jsonb(b"\x02{}")
+
+
+@pytest.mark.unit
+class TestSerializer:
+    """Tests for generated serializers behind json() / get_json()."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.admin = Role(id=5, name="admin")
+        self.user = User(
+            id=1,
+            name="John",
+            settings={"a": 1},
+            role_id=self.admin,
+            role_ids=[self.admin, Role(id=6, name="")],
+        )
+
+    def test_list_mode(self):
+        """Test LIST: m2o and x2m as id/name, unset as default."""
+        assert self.user.json() == {
+            "id": 1,
+            "name": "John",
+            "active": True,
+            "settings": {"a": 1},
+            "role_id": {"id": 5, "name": "admin"},
+            "role_ids": [{"id": 5, "name": "admin"}, {"id": 6, "name": "6"}],
+        }
+
+    def test_form_mode(self):
+        """Test FORM: m2o as full dict, x2m as nested records."""
+        record = self.user.json(mode=JsonMode.FORM)
+
+        assert record["role_id"] == {"id": 5, "name": "admin"}
+        assert record["role_ids"][1] == {"id": 6, "name": ""}
+
+        self.user.role_ids = {"data": [self.admin], "fields": [], "total": 1}
+        record = self.user.json(mode=JsonMode.FORM)
+        assert record["role_ids"] == {
+            "data": [{"id": 5, "name": "admin"}],
+            "fields": [],
+            "total": 1,
+        }
+
+    def test_create_mode_only_store(self):
+        """Test CREATE: m2o as id, JSON dumped, x2m not stored."""
+        record = self.user.json(
+            mode=JsonMode.CREATE, only_store=True, exclude_unset=True
+        )
+
+        assert record == {
+            "id": 1,
+            "name": "John",
+            "settings": '{"a": 1}',
+            "role_id": 5,
+        }
+
+    def test_include_exclude_none(self):
+        """Test include/exclude/exclude_none filters."""
+        user = User(id=1, name=None)
+
+        assert user.json(include={"id", "name"}) == {"id": 1, "name": None}
+        assert user.json(include={"id", "name"}, exclude_none=True) == {
+            "id": 1
+        }
+        assert "settings" not in user.json(exclude={"settings"})
+        assert user.json(exclude_unset=True, exclude={"id"}) == {"name": None}
+
+    def test_serializer_cached(self):
+        """Test one generated function per set of options."""
+        first = User._get_serializer(JsonMode.LIST, include=["id"])
+        second = User._get_serializer(JsonMode.LIST, include={"id"})
+
+        assert first is second
+        assert User._get_serializer(JsonMode.FORM) is not first
+
+    def test_get_json_override_respected(self):
+        """Test json() still calls get_json overridden in model."""
+
+        class Custom(User):
+            def get_json(self, exclude_unset=False, only_store=None, mode=2):
+                return {"id": self.id, "custom": True}
+
+        assert Custom(id=1).json(exclude={"id"}) == {"custom": True}
+
+
+@pytest.mark.unit
+class TestDumpsMany:
+    """Tests for dumps_many (records straight to JSON bytes)."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        admin = Role(id=5, name="admin")
+        self.records = [
+            User(id=1, name="John", role_id=admin, role_ids=[admin]),
+            User(id=2, name="Jane", settings={"a": 1}),
+        ]
+
+    def test_same_as_json(self):
+        """Test output equals json() of each record in LIST and FORM."""
+        for mode in (JsonMode.LIST, JsonMode.FORM):
+            result = User.dumps_many(self.records, mode)
+
+            assert isinstance(result, bytes)
+            assert json.loads(result) == [
+                record.json(mode=mode) for record in self.records
+            ]
+
+    def test_compact_records(self):
+        """Test compact records serialize like regular ones."""
+        rows = [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
+        compact = User.prepare_list_compact(rows)
+
+        assert json.loads(User.dumps_many(compact)) == [
+            User(**row).json() for row in rows
+        ]
+
+    def test_include_exclude_none(self):
+        """Test json() filters are applied."""
+        result = User.dumps_many(
+            self.records, include={"id", "settings"}, exclude_none=True
+        )
+
+        assert json.loads(result) == [{"id": 1}, {"id": 2, "settings": {"a": 1}}]
+
+    def test_empty(self):
+        """Test empty list."""
+        assert User.dumps_many([]) == b"[]"
+
+
+def _total(record):
+    _total.calls += 1
+    return record.price * record.qty
+
+
+_total.calls = 0
+
+
+class Line(DotModel):
+    __table__ = "unit_lines"
+
+    id: int = Integer(primary_key=True)
+    price: int = Integer()
+    qty: int = Integer()
+    total: int = Integer(store=False, compute=depends("price", "qty")(_total))
+    label: str = Char(
+        store=False,
+        compute=depends("total")(lambda record: f"total={record.total}"),
+    )
+
+
+@pytest.mark.unit
+class TestLazyCompute:
+    """Tests for lazy compute fields (Field.__get__ + @depends)."""
+
+    def setup_method(self):
+        _total.calls = 0
+
+    def test_not_computed_on_load(self):
+        """Test compute is not called while hydrating rows."""
+        rows = [{"id": i, "price": 2, "qty": i} for i in range(10)]
+
+        with patch.object(Line, "__init__") as init:
+            records = Line.prepare_list_ids(rows)
+
+        init.assert_not_called()
+        assert _total.calls == 0
+        assert records[3].total == 6
+
+    def test_cached_after_first_access(self):
+        """Test value is computed once and stored in instance."""
+        line = Line(id=1, price=2, qty=3)
+
+        assert line.total == 6
+        assert line.total == 6
+        assert _total.calls == 1
+        assert line.__dict__["total"] == 6
+
+    def test_invalidated_by_depends(self):
+        """Test writing a dependency drops cached value (with chains)."""
+        line = Line(id=1, price=2, qty=3)
+        assert line.label == "total=6"
+
+        line.qty = 5
+
+        assert "total" not in line.__dict__
+        assert line.label == "total=10"
+        assert _total.calls == 2
+
+    def test_compact_records(self):
+        """Test compact records compute lazily too."""
+        line = Line.prepare_list_compact([{"id": 1, "price": 2, "qty": 3}])[0]
+
+        assert _total.calls == 0
+        assert line.json(include={"total", "label"}) == {
+            "total": 6,
+            "label": "total=6",
+        }
+
+        line.price = 4
+        assert line.total == 12
+
+    def test_class_access_returns_field(self):
+        """Test class attribute is still the Field."""
+        assert isinstance(Line.total, Integer)
+        assert Line._compute_invalidation == {
+            "price": ("label", "total"),
+            "qty": ("label", "total"),
+            "total": ("label",),
+        }
+
+
+@pytest.mark.unit
+class TestMapRelationResults:
+    """Tests for _map_relation_results (batch relations -> parents)."""
+
+    def test_many2one(self):
+        """Test m2o id replaced by record, unset -> None, missing kept."""
+        users = [User(id=1, role_id=5), User(id=2), User(id=3, role_id=7)]
+        admin = Role(id=5, name="admin")
+
+        User._map_relation_results(User.role_id, "role_id", users, [admin])
+
+        assert users[0].role_id is admin
+        assert users[1].role_id is None
+        assert users[2].role_id == 7
+
+    def test_many2many(self):
+        """Test children grouped by m2m_id, service attr removed."""
+        users = [User(id=1), User(id=2), User(id=3)]
+        roles = [
+            Role(id=5, name="a", m2m_id=1),
+            Role(id=6, name="b", m2m_id=2),
+            Role(id=5, name="a", m2m_id=2),
+        ]
+
+        User._map_relation_results(User.role_ids, "role_ids", users, roles)
+
+        assert [r.id for r in users[0].role_ids] == [5]
+        assert [r.id for r in users[1].role_ids] == [6, 5]
+        assert users[2].role_ids == []
+        assert all("m2m_id" not in r.__dict__ for r in roles)
+
+    def test_one2many(self):
+        """Test children grouped by relation_table_field."""
+
+        class Team(DotModel):
+            __table__ = "unit_teams"
+
+            id: int = Integer(primary_key=True)
+            user_ids: list[User] = One2many(lambda: User, "team_id")
+
+        teams = [Team(id=1), Team(id=2)]
+        users = [User(id=10, team_id=2), User(id=11, team_id=2)]
+
+        Team._map_relation_results(Team.user_ids, "user_ids", teams, users)
+
+        assert teams[0].user_ids == []
+        assert teams[1].user_ids == users
+
+    def test_one2one(self):
+        """Test one record per parent by FK, missing -> None."""
+
+        class Profile(DotModel):
+            __table__ = "unit_profiles"
+
+            id: int = Integer(primary_key=True)
+            user_id: int = Integer()
+
+        class Account(DotModel):
+            __table__ = "unit_accounts"
+
+            id: int = Integer(primary_key=True)
+            profile: Profile = One2one(lambda: Profile, "user_id")
+
+        accounts = [Account(id=1), Account(id=2)]
+        profile = Profile(id=7, user_id=2)
+
+        Account._map_relation_results(
+            Account.profile, "profile", accounts, [profile]
+        )
+
+        assert accounts[0].profile is None
+        assert accounts[1].profile is profile
+
+    def test_polymorphic_one2many(self):
+        """Test attachments grouped by res_id."""
+
+        class File(DotModel):
+            __table__ = "unit_files"
+
+            id: int = Integer(primary_key=True)
+            res_model: str = Char()
+            res_id: int = Integer()
+
+        class Doc(DotModel):
+            __table__ = "unit_docs"
+
+            id: int = Integer(primary_key=True)
+            file_ids: list[File] = PolymorphicOne2many(File, "res_id")
+
+        docs = [Doc(id=1), Doc(id=2)]
+        files = [
+            File(id=5, res_model="unit_docs", res_id=2),
+            File(id=6, res_model="unit_docs", res_id=2),
+        ]
+
+        Doc._map_relation_results(Doc.file_ids, "file_ids", docs, files)
+
+        assert docs[0].file_ids == []
+        assert [f.id for f in docs[1].file_ids] == [5, 6]
+
+
+@pytest.mark.unit
+class TestNestedPaths:
+    """Tests for dotted field paths in search (helpers)."""
+
+    def test_split_nested_paths(self):
+        """Test dotted paths become relation field + rest of path."""
+        fields, paths = User._split_nested_paths(
+            ["name", "role_ids.acl_ids.name", "role_ids.model_id", "role_id"]
+        )
+
+        assert fields == ["name", "role_ids", "role_id"]
+        assert paths == {"role_ids": ["acl_ids.name", "model_id"]}
+
+    def test_split_without_paths(self):
+        """Test plain field list is returned as is."""
+        fields = ["id", "name"]
+
+        assert User._split_nested_paths(fields) == (fields, {})
+
+    def test_merge_nested_paths(self):
+        """Test first segments are added to fields_nested."""
+        merged = User._merge_nested_paths(
+            {"role_ids": ["id", "name"], "role_id": ["name"]},
+            {"role_ids": ["acl_ids.name", "acl_ids.active", "model_id"]},
+        )
+
+        assert merged == {
+            "role_ids": ["id", "name", "acl_ids", "model_id"],
+            "role_id": ["name"],
+        }
+
+    def test_deeper_paths(self):
+        """Test paths ending with relation field go to next level."""
+        field = User.get_fields()["role_ids"]
+
+        relations = [("user_id", User.get_fields()["role_id"])]
+        with patch.object(Role, "get_relation_fields", return_value=relations):
+            deeper = User._deeper_paths(field, ["name", "user_id", "acl_ids.name"])
+
+        assert deeper == ["user_id", "acl_ids.name"]
+        assert User._deeper_paths(field, None) == []
+
+    def test_collect_relation_records(self):
+        """Test m2o models and x2m lists are flattened, ids skipped."""
+        admin, guest = Role(id=5), Role(id=6)
+        users = [User(role_id=admin), User(role_id=7), User(role_id=None)]
+
+        assert User._collect_relation_records(users, "role_id") == [admin]
+
+        users = [User(role_ids=[admin, guest]), User(role_ids=[])]
+        assert User._collect_relation_records(users, "role_ids") == [
+            admin,
+            guest,
+        ]
+
+    def test_merge_keeps_full_relation(self):
+        """Test relation requested as a whole keeps all store fields."""
+        merged = User._merge_nested_paths(
+            None, {"role_ids": ["model_id.name"]}, ["role_ids"]
+        )
+
+        assert merged == {}
+
+
+@pytest.mark.unit
+class TestRelationProjection:
+    """Tests for fields_nested pushed into relation SQL."""
+
+    def setup_method(self):
+        """Builders for models (normally set by the pool setup)."""
+        from dotorm.builder.builder import Builder
+
+        self.patches = [
+            patch.object(
+                model,
+                "_builder",
+                Builder(model.__table__, model.get_fields(), model._dialect),
+                create=True,
+            )
+            for model in (User, Role)
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_many2one_requested_fields(self):
+        """Test m2o selects only requested columns plus id."""
+        users = [User(id=1, role_id=5)]
+        (req,) = User._builder.build_search_relation(
+            [("role_id", User.role_id)], users, {"role_id": ["name"]}
+        )
+
+        assert req.stmt.startswith('SELECT "id", "name" FROM unit_roles')
+
+    def test_many2many_requested_fields(self):
+        """Test m2m selects requested columns, id and m2m_id only."""
+        users = [User(id=1)]
+        (req,) = User._builder.build_search_relation(
+            [("role_ids", User.role_ids)],
+            users,
+            {"role_ids": ["name", "acl_ids"]},
+        )
+
+        assert "SELECT id, name, m2m_id FROM" in req.stmt
+        assert "SELECT p.id, p.name, pt." in req.stmt
+
+    def test_all_store_fields_by_default(self):
+        """Test without fields_nested all store fields are selected."""
+        users = [User(id=1, role_id=5)]
+        (req,) = User._builder.build_search_relation(
+            [("role_id", User.role_id)], users
+        )
+
+        assert req.fields == Role.get_store_fields()
+
+
+@pytest.mark.unit
+class TestJoinMany2one:
+    """Tests for search(join_m2o=...) LEFT JOIN loading."""
+
+    def setup_method(self):
+        from dotorm.builder.builder import Builder
+
+        self.patches = [
+            patch.object(
+                model,
+                "_builder",
+                Builder(model.__table__, model.get_fields(), model._dialect),
+                create=True,
+            )
+            for model in (User, Role)
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+
+    def _joins(self, fields_nested=None):
+        return User._m2o_joins(
+            [("role_id", User.role_id), ("role_ids", User.role_ids)],
+            fields_nested,
+            True,
+        )
+
+    def test_joins_only_many2one(self):
+        """Test only Many2one fields are joined, columns from nested."""
+        joins = self._joins({"role_id": ["name"]})
+
+        assert [(name, cols) for name, _, cols in joins] == [
+            ("role_id", ["id", "name"])
+        ]
+        assert User._m2o_joins([("role_id", User.role_id)], None, []) == []
+
+    def test_build_search_join(self):
+        """Test parent query is wrapped, joined columns aliased."""
+        stmt, values = User._builder.build_search(
+            ["name", "role_id"], limit=10, sort="name", order="asc"
+        )
+        join_stmt = User._builder.build_search_join(
+            stmt, self._joins(), "name", "asc"
+        )
+
+        assert join_stmt.startswith(
+            'SELECT p.*, j0."id" AS "role_id__id", '
+            'j0."name" AS "role_id__name" FROM ('
+        )
+        assert 'LEFT JOIN unit_roles j0 ON j0.id = p."role_id"' in join_stmt
+        assert join_stmt.endswith('ORDER BY p."name" ASC')
+        assert values == (10,)
+        # тот же stmt из кэша
+        assert (
+            User._builder.build_search_join(stmt, self._joins(), "name", "asc")
+            is join_stmt
+        )
+
+    def test_prepare_joined(self):
+        """Test rows split into parents and shared Many2one records."""
+        prepare = User._prepare_joined(User.prepare_list_ids, self._joins())
+        keys = ("id", "name", "role_id", "role_id__id", "role_id__name")
+        rows = [
+            dict(zip(keys, values))
+            for values in (
+                (1, "a", 5, 5, "admin"),
+                (2, "b", 5, 5, "admin"),
+                (3, "c", None, None, None),
+            )
+        ]
+
+        users = prepare(rows)
+
+        assert [u.id for u in users] == [1, 2, 3]
+        assert "role_id__name" not in users[0].__dict__
+        assert isinstance(users[0].role_id, Role)
+        assert users[0].role_id.name == "admin"
+        assert users[0].role_id is users[1].role_id
+        assert users[2].role_id is None
+
+
+class _RecordingSession:
+    """Session stub: records statements, returns rows for given ids."""
+
+    calls: list = []
+    rows: dict = {}
+
+    def __init__(self, pool=None):
+        pass
+
+    async def execute(self, stmt, values, prepare=None, **kwargs):
+        self.calls.append((stmt, values))
+        ids = values[0] if isinstance(values[0], list) else values
+        rows = [self.rows[i] for i in ids if i in self.rows]
+        return prepare(rows) if prepare and rows else rows
+
+
+@pytest.mark.unit
+class TestBatchLoader:
+    """Tests for __batch_get__ coalescing of get_or_none()."""
+
+    def setup_method(self):
+        from dotorm.builder.builder import Builder
+
+        _RecordingSession.calls = []
+        _RecordingSession.rows = {
+            i: {"id": i, "name": f"role_{i}"} for i in (1, 2, 3)
+        }
+        self.patches = [
+            patch.object(
+                Role,
+                "_builder",
+                Builder(Role.__table__, Role.get_fields(), Role._dialect),
+                create=True,
+            ),
+            patch.object(Role, "_no_transaction", _RecordingSession),
+            patch.object(Role, "_pool", None, create=True),
+            patch.object(Role, "__batch_get__", True),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+        if "_batch_loader" in Role.__dict__:
+            del Role._batch_loader
+
+    async def test_same_tick_one_query(self):
+        """Test concurrent get_or_none() make one id = ANY query."""
+        roles = await asyncio.gather(
+            Role.get_or_none(2), Role.get_or_none(1), Role.get_or_none(9)
+        )
+
+        assert len(_RecordingSession.calls) == 1
+        stmt, values = _RecordingSession.calls[0]
+        assert "id = ANY($1::int[])" in stmt
+        assert values == [[2, 1, 9]]
+        assert [r.name for r in roles[:2]] == ["role_2", "role_1"]
+        assert roles[2] is None
+
+    async def test_same_id_separate_copies(self):
+        """Test callers of the same id get own instances."""
+        first, second = await asyncio.gather(
+            Role.get_or_none(3), Role.get_or_none(3)
+        )
+
+        assert len(_RecordingSession.calls) == 1
+        assert first is not second
+        assert first.name == second.name == "role_3"
+
+    async def test_explicit_session_not_batched(self):
+        """Test explicit session bypasses loader."""
+        role = await Role.get_or_none(1, session=_RecordingSession())
+
+        assert role.name == "role_1"
+        assert "_batch_loader" not in Role.__dict__
+        assert "LIMIT 1" in _RecordingSession.calls[0][0]
+
+
+@pytest.mark.unit
+class TestCreateBulkCopy:
+    """Tests for create_bulk(method="copy") outside of database."""
+
+    async def test_copy_requires_postgres(self):
+        """Test COPY insert is rejected on other dialects."""
+        from dotorm.components.dialect import MYSQL
+
+        with patch.object(Role, "_dialect", MYSQL):
+            with pytest.raises(ValueError, match="requires Postgres"):
+                await Role.create_bulk([Role(name="a")], method="copy")
+
+
+@pytest.mark.unit
+class TestBulkChunking:
+    """Tests for chunking of bulk operations by parameter budget."""
+
+    def setup_method(self):
+        from dotorm.builder.builder import Builder
+        from dotorm.components.dialect import MYSQL
+
+        _RecordingSession.calls = []
+        self.patches = [
+            patch.object(
+                Role,
+                "_builder",
+                Builder(Role.__table__, Role.get_fields(), MYSQL),
+                create=True,
+            ),
+            patch.object(Role, "_dialect", MYSQL),
+            patch.object(Role, "_no_transaction", _RecordingSession),
+            patch.object(Role, "_pool", None, create=True),
+            patch.object(Role, "__bulk_max_params__", 2),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+
+    async def test_delete_bulk_chunked(self):
+        """Test MySQL IN (...) split by __bulk_max_params__."""
+        await Role.delete_bulk([1, 2, 3, 4, 5])
+
+        assert [values for _, values in _RecordingSession.calls] == [
+            [1, 2],
+            [3, 4],
+            [5],
+        ]
+
+    async def test_update_bulk_reserves_fixed_params(self):
+        """Test SET params are taken from budget of every chunk."""
+        with patch.object(Role, "__bulk_max_params__", 3):
+            await Role.update_bulk([1, 2, 3], Role(name="x"))
+
+        assert [values for _, values in _RecordingSession.calls] == [
+            ("x", 1, 2),
+            ("x", 3),
+        ]
+
+    async def test_single_chunk_by_default(self):
+        """Test batch within budget is one statement."""
+        with patch.object(Role, "__bulk_max_params__", 65535):
+            await Role.delete_bulk([1, 2, 3])
+
+        assert len(_RecordingSession.calls) == 1
+
+    async def test_update_many_chunked(self):
+        """Test MySQL CASE form split by 2 params per field + id."""
+        records = [Role(id=i, name=f"r{i}") for i in (1, 2, 3)]
+        with patch.object(Role, "__bulk_max_params__", 6):
+            await Role.update_many(records, ["name"])
+
+        assert [values for _, values in _RecordingSession.calls] == [
+            [1, "r1", 2, "r2", 1, 2],
+            [3, "r3", 3],
+        ]
+
+    async def test_update_many_requires_set_fields(self):
+        """Test unset field or missing id is rejected, not written."""
+        with pytest.raises(ValueError, match="not set"):
+            await Role.update_many([Role(id=1)], ["name"])
+        with pytest.raises(ValueError, match="with id"):
+            await Role.update_many([Role(name="x")], ["name"])
+
+        assert _RecordingSession.calls == []
@@ -0,0 +1,147 @@
+"""
+Unit tests for ORM utils (columnar results, JSON encoding).
+
+Run with: pytest tests/unit/test_utils.py -v
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from dotorm.fields import Boolean, Char, Float, Integer
+from dotorm.fields import Decimal as DecimalField
+from dotorm.orm import utils
+from dotorm.orm.utils import (
+    bulk_chunk_size,
+    chunked,
+    columns_to_numpy,
+    dumps_json_bytes,
+    rows_to_columns,
+)
+
+
+@pytest.mark.unit
+class TestRowsToColumns:
+    """Tests for rows_to_columns."""
+
+    def test_transpose(self):
+        """Test rows are transposed into column lists."""
+        data = rows_to_columns(("id", "name"), [(1, "a"), (2, "b")])
+
+        assert data == {"id": [1, 2], "name": ["a", "b"]}
+
+    def test_empty_rows(self):
+        """Test empty result keeps column names."""
+        assert rows_to_columns(("id", "name"), []) == {"id": [], "name": []}
+
+
+@pytest.mark.unit
+class TestColumnsToNumpy:
+    """Tests for columns_to_numpy."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.np = pytest.importorskip("numpy")
+        self.fields = {
+            "id": Integer(primary_key=True),
+            "qty": Integer(),
+            "price": DecimalField(max_digits=10, decimal_places=2),
+            "rate": Float(),
+            "active": Boolean(),
+            "name": Char(),
+        }
+
+    def test_numeric_columns(self):
+        """Test numeric fields become typed arrays, others stay lists."""
+        data = columns_to_numpy(
+            {
+                "id": [1, 2],
+                "price": [Decimal("1.50"), None],
+                "rate": [0.5, 1.0],
+                "active": [True, False],
+                "name": ["a", "b"],
+            },
+            self.fields,
+        )
+
+        assert data["id"].dtype == self.np.int64
+        assert data["price"].dtype == self.np.float64
+        assert data["price"][0] == 1.5
+        assert self.np.isnan(data["price"][1])
+        assert data["rate"].tolist() == [0.5, 1.0]
+        assert data["active"].dtype == self.np.bool_
+        assert data["name"] == ["a", "b"]
+
+    def test_integer_with_null(self):
+        """Test NULL in integer column gives float64 with nan."""
+        data = columns_to_numpy({"qty": [1, None]}, self.fields)
+
+        assert data["qty"].dtype == self.np.float64
+        assert self.np.isnan(data["qty"][1])
+
+
+@pytest.mark.unit
+class TestDumpsJsonBytes:
+    """Tests for dumps_json_bytes (orjson or json fallback)."""
+
+    VALUE = {
+        "name": "Иван",
+        "amount": Decimal("10.50"),
+        "day": date(2024, 1, 2),
+        "at": datetime(2024, 1, 2, 3, 4, 5),
+        "data": b"\x00\xff",
+        "tags": [1, None, True],
+    }
+    EXPECTED = {
+        "name": "Иван",
+        "amount": "10.50",
+        "day": "2024-01-02",
+        "at": "2024-01-02T03:04:05",
+        "data": "AP8=",
+        "tags": [1, None, True],
+    }
+
+    def test_encode(self):
+        """Test non-JSON types are converted."""
+        result = dumps_json_bytes(self.VALUE)
+
+        assert isinstance(result, bytes)
+        assert json.loads(result) == self.EXPECTED
+
+    def test_fallback_without_orjson(self):
+        """Test json fallback gives same compact output."""
+        with patch.object(utils, "orjson", None):
+            result = dumps_json_bytes(self.VALUE)
+
+        assert json.loads(result) == self.EXPECTED
+        assert b" " not in dumps_json_bytes([1, {"a": 2}])
+
+    def test_unsupported_type(self):
+        """Test unknown types raise TypeError."""
+        with pytest.raises(TypeError):
+            dumps_json_bytes({"value": object()})
+
+
+@pytest.mark.unit
+class TestBulkChunks:
+    """Tests for bulk_chunk_size and chunked."""
+
+    def test_chunk_size_by_params(self):
+        """Test rows limited by placeholder budget."""
+        assert bulk_chunk_size(3, 65535, None) == 21845
+        assert bulk_chunk_size(3, 2, None) == 1
+
+    def test_chunk_size_by_rows(self):
+        """Test array params (0 per row) only limited by max_rows."""
+        assert bulk_chunk_size(0, 65535, None) is None
+        assert bulk_chunk_size(0, 65535, 500) == 500
+        assert bulk_chunk_size(2, 100, 20) == 20
+
+    def test_chunked(self):
+        """Test items split in order, single chunk when fits."""
+        assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+        assert chunked([1, 2], None) == [[1, 2]]
+        assert chunked([1, 2], 5) == [[1, 2]]